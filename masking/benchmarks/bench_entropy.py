@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+엔트로피 탐지기 벤치마크
+
+설정 파일에서 흔히 보이는 값(짧은 값, URL, 경로, 16진수 키, base64 토큰 등)을 섞은 입력에 대해
+단일 값 판정(is_secret)과 일괄 판정(detect_batch)의 초당 처리 값 수를 비교하고,
+두 결과가 같은지 확인합니다.
+
+    python benchmarks/bench_entropy.py [값 개수]
+"""
+
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.entropy import EntropyDetector, np
+
+
+TOKEN_CHARS = string.ascii_letters + string.digits + '+/=_-'
+
+
+def sample_values(count: int, seed: int = 0):
+    """설정 값과 비슷한 분포의 입력 생성"""
+    rng = random.Random(seed)
+    values = []
+    for index in range(count):
+        kind = rng.random()
+        if kind < 0.3:
+            values.append(''.join(rng.choice(TOKEN_CHARS) for _ in range(rng.randint(1, 100))))
+        elif kind < 0.4:
+            values.append(''.join(rng.choice('0123456789abcdef') for _ in range(rng.randint(16, 64))))
+        elif kind < 0.5:
+            values.append(f"jdbc:mysql://db-{index % 97}.internal:3306/app")
+        elif kind < 0.6:
+            values.append(f"/var/log/app/service-{index % 13}.log")
+        else:
+            values.append(rng.choice(['true', 'false', '8080', 'INFO', 'classpath:static/', '30s']))
+    return values
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    values = sample_values(count)
+    detector = EntropyDetector()
+
+    if np is None:
+        print("numpy 미설치: detect_batch는 is_secret을 값마다 호출합니다. (pip install numpy)\n")
+
+    start = time.perf_counter()
+    scalar = [detector.is_secret(value) for value in values]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = detector.detect_batch(values)
+    batch_time = time.perf_counter() - start
+
+    print(f"{'method':<14} {'seconds':>10} {'values/sec':>14}")
+    print('-' * 40)
+    print(f"{'is_secret':<14} {scalar_time:>10.3f} {count / scalar_time:>14,.0f}")
+    print(f"{'detect_batch':<14} {batch_time:>10.3f} {count / batch_time:>14,.0f}")
+    print()
+    print(f"탐지된 값: {sum(batch):,} / {count:,} (결과 일치: {scalar == batch})")
+
+
+if __name__ == '__main__':
+    main()
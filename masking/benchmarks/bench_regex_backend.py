@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+값 패턴 정규식 백엔드 벤치마크
+
+적대적 입력(긴 인증서/블롭, 백트래킹 유발 문자열)에 대해 re, 길이 상한 re, re2 백엔드의
+최악 실행 시간을 비교합니다.
+
+    python benchmarks/bench_regex_backend.py
+"""
+
+import os
+import sys
+import time
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.regex_backend import DEFAULT_MAX_VALUE_LENGTH, ReBackend, create_regex_backend, re2
+
+
+# 사용자가 추가할 수 있는 재앙적 백트래킹 패턴 예시 (중첩 반복)
+CATASTROPHIC_PATTERN = r"^(?:[A-Za-z0-9+/]+)+={1,2}$"
+
+
+def load_value_patterns():
+    """기본 config.yml의 sensitive_value_patterns 로드"""
+    config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.yml')
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f).get('sensitive_value_patterns', [])
+
+
+def adversarial_values(size: int):
+    """패턴별 최악 입력 생성"""
+    return {
+        'base64 blob (no terminator)': 'A' * size + '!',
+        'mixed-case blob (lookahead)': ('aB1' * (size // 3 + 1))[:size] + ' ',
+        'pem certificate body': '-----BEGIN CERTIFICATE-----' + 'M' * size,
+    }
+
+
+def time_patterns(compiled_patterns, value: str, repeat: int = 3) -> float:
+    """모든 패턴을 값에 적용하는 데 걸린 최대 시간(ms)"""
+    worst = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for pattern in compiled_patterns:
+            pattern.match(value)
+        worst = max(worst, time.perf_counter() - start)
+    return worst * 1000
+
+
+def main():
+    patterns = load_value_patterns()
+
+    backends = [
+        ('re (no cap)', ReBackend(max_value_length=None)),
+        (f're (cap {DEFAULT_MAX_VALUE_LENGTH})', ReBackend()),
+    ]
+    if re2 is not None:
+        backends.append(('re2', create_regex_backend('re2')))
+    else:
+        print("google-re2 미설치: re2 백엔드 결과는 생략합니다. (pip install google-re2)\n")
+
+    print("[1] config.yml 값 패턴 - 입력 크기별 최악 시간 (ms)")
+    header = f"{'input':<30} {'size':>8}" + ''.join(f"{name:>18}" for name, _ in backends)
+    print(header)
+    print('-' * len(header))
+    compiled = {name: [backend.compile(p) for p in patterns] for name, backend in backends}
+    for size in (1_000, 10_000, 100_000, 1_000_000):
+        for label, value in adversarial_values(size).items():
+            row = f"{label:<30} {size:>8}"
+            for name, _ in backends:
+                row += f"{time_patterns(compiled[name], value):>18.3f}"
+            print(row)
+
+    print()
+    print(f"[2] 재앙적 사용자 패턴 {CATASTROPHIC_PATTERN!r} - 최악 시간 (ms)")
+    print(header)
+    print('-' * len(header))
+    for size in (16, 18, 20, 22, 5_000):
+        value = 'A' * size + '!'
+        row = f"{'nested repeat':<30} {size:>8}"
+        for name, backend in backends:
+            if name == 're (no cap)' and size > 22:
+                row += f"{'(skipped)':>18}"
+                continue
+            row += f"{time_patterns([backend.compile(CATASTROPHIC_PATTERN)], value, repeat=1):>18.3f}"
+        print(row)
+
+    for name, backend in backends:
+        fallback = getattr(backend, 'fallback_patterns', None)
+        if fallback:
+            print(f"\n{name}: RE2 미지원 패턴은 길이 상한 re로 실행됨 -> {sorted(set(fallback))}")
+
+
+if __name__ == '__main__':
+    main()
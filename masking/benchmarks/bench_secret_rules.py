@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+비밀 값 규칙 팩 벤치마크
+
+내장 규칙 팩을 복제해 규칙 수를 늘려 가며, 규칙마다 라인을 따로 검사하는 방식과
+결합 정규식 한 번으로 검사하는 방식(SecretScanner)의 라인당 처리 시간을 비교합니다.
+re2 백엔드(google-re2 설치 시)는 규칙 수와 무관하게 라인당 한 번의 선형 탐색으로 처리합니다.
+
+    python benchmarks/bench_secret_rules.py [라인 수]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.regex_backend import ReBackend, create_regex_backend, re2
+from src.secret_rules import BUILTIN_RULES, SecretRule, SecretScanner
+
+
+def sample_lines(count: int, seed: int = 0):
+    """비밀 값이 드물게 섞인 설정 파일 라인 생성"""
+    rng = random.Random(seed)
+    plain = [
+        "server.port=8080",
+        "spring.datasource.url=jdbc:mysql://db.internal:3306/app?useSSL=false",
+        "  level: INFO",
+        "# 운영 환경에서는 값을 환경 변수로 주입합니다",
+        "logging.file.path=/var/log/app/service.log",
+        "  - classpath:static/",
+    ]
+    secret = [
+        "github.token=ghp_" + "a1B2" * 9,
+        "  webhook: https://hooks.slack.com/services/T0000/B0000/" + "x" * 24,
+        "stripe.key=sk_live_" + "q" * 24,
+    ]
+    return [rng.choice(secret) if rng.random() < 0.01 else rng.choice(plain) for _ in range(count)]
+
+
+def scaled_rules(copies: int):
+    """내장 규칙을 copies배로 복제 (규칙 수 증가에 따른 비용 측정용)"""
+    return [
+        SecretRule(f"{rule.name}-{copy}", rule.pattern, rule.description)
+        for copy in range(copies)
+        for rule in BUILTIN_RULES
+    ]
+
+
+def time_per_line(scan, lines) -> float:
+    """라인당 평균 시간(µs)"""
+    start = time.perf_counter()
+    for line in lines:
+        scan(line)
+    return (time.perf_counter() - start) / len(lines) * 1_000_000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    lines = sample_lines(count)
+
+    backends = [('re', ReBackend())]
+    if re2 is not None:
+        backends.append(('re2', create_regex_backend('re2')))
+    else:
+        print("google-re2 미설치: re2 백엔드 결과는 생략합니다. (pip install google-re2)\n")
+
+    header = f"{'rules':>6} {'per-rule re (µs)':>18}" + ''.join(f"{f'combined {name} (µs)':>22}" for name, _ in backends)
+    print(header)
+    print('-' * len(header))
+    for copies in (1, 2, 4, 8):
+        rules = scaled_rules(copies)
+        separate = [ReBackend().compile(rule.pattern) for rule in rules]
+
+        def scan_separately(line):
+            for pattern in separate:
+                if pattern.search(line):
+                    return True
+            return False
+
+        row = f"{len(rules):>6} {time_per_line(scan_separately, lines):>18.2f}"
+        for _, backend in backends:
+            scanner = SecretScanner(rules, backend)
+            row += f"{time_per_line(scanner.search, lines):>22.2f}"
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
@@ -7,8 +7,9 @@ CLI 진입점
 
 import os
 import sys
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import click
 import yaml
@@ -16,14 +17,36 @@ import yaml
 # 모듈 경로 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.masker import MaskingEngine, MaskingResult
-from src.scanner import FileScanner, BackupManager, FileProcessor
+from src.masker import MaskedItem, MaskingEngine, MaskingResult
+from src.scanner import (
+    FileScanner, BackupManager, FileProcessor, FileTransaction, is_temp_file, remove_stale_temp_files
+)
+from src.scan_index import ScanIndex, content_digest
+from src.watcher import ConfigWatcher
 from src.llm_client import LLMConfig, OllamaClient, create_llm_client, MockLLMClient
 from src.reporter import (
     MaskingReport, FileReport, ReportGenerator, ConsoleReporter
 )
 
 
+# 중복 파일에 재사용하려고 실행 동안 보관하는 마스킹된 내용의 최대 크기 합계 (문자 수)
+REUSE_CONTENT_BUDGET = 64 * 1024 * 1024
+
+
+class ReusableResult(NamedTuple):
+    """
+    같은 내용의 파일에 재사용할 마스킹 결과 요약
+
+    원본 내용은 보관하지 않고, 마스킹된 내용은 마스킹된 파일만 REUSE_CONTENT_BUDGET 안에서 보관합니다.
+    보관하지 못한 경우 중복 파일을 같은 LLM 탐지 키로 다시 마스킹합니다(LLM 재호출 없음).
+    """
+    source_path: str
+    masked_items: List[MaskedItem]
+    error: Optional[str]
+    masked_content: Optional[str]
+    llm_keys: Optional[List[str]]
+
+
 def load_config(config_path: str = None) -> dict:
     """설정 파일 로드"""
     # 기본 설정 파일 경로
@@ -60,6 +83,42 @@ def load_config(config_path: str = None) -> dict:
     }
 
 
+def create_engine(cfg: dict, console: ConsoleReporter) -> MaskingEngine:
+    """마스킹 엔진 생성 (영구 판정 캐시를 열 수 없으면 경고 후 캐시 없이 진행)"""
+    engine = MaskingEngine(cfg)
+    if engine.verdict_store_error:
+        console.print_warning(f"키 판정 캐시를 열 수 없어 캐시 없이 진행합니다: {engine.verdict_store_error}")
+    return engine
+
+
+def close_engine(engine: MaskingEngine, console: ConsoleReporter):
+    """엔진 종료 (영구 판정 캐시 기록 실패는 경고만 출력)"""
+    engine.verdict_store_error = None
+    engine.close()
+    if engine.verdict_store_error:
+        console.print_warning(f"키 판정 캐시를 기록하지 못했습니다: {engine.verdict_store_error}")
+
+
+def connect_llm(cfg: dict, console: ConsoleReporter) -> Tuple[Optional[object], LLMConfig]:
+    """
+    LLM 클라이언트 생성 및 연결 확인
+    
+    Returns:
+        Tuple[LLM 클라이언트 (연결할 수 없으면 None), LLM 설정]
+    """
+    llm_config = LLMConfig.from_dict(cfg)
+    llm_client = create_llm_client(llm_config)
+    
+    # Ollama 연결 확인
+    if llm_client.is_available():
+        console.print_info(f"Ollama LLM 연결됨: {llm_config.endpoint} (모델: {llm_config.model})")
+        return llm_client, llm_config
+    
+    console.print_warning(f"Ollama 연결 실패 또는 모델 '{llm_config.model}' 없음. 'ollama pull {llm_config.model}' 실행 필요.")
+    console.print_warning("LLM 없이 패턴 기반 탐지만 사용합니다.")
+    return None, llm_config
+
+
 @click.group()
 @click.version_option(version='1.0.0')
 def cli():
@@ -82,6 +141,7 @@ def cli():
 @click.option('--output', '-o', type=click.Path(), help='리포트 출력 파일')
 @click.option('--format', 'output_format', type=click.Choice(['json', 'yaml', 'text']), default='json', help='리포트 형식')
 @click.option('--verbose', '-v', is_flag=True, help='상세 출력')
+@click.option('--full', is_flag=True, help='증분 스캔 인덱스를 무시하고 모든 파일을 다시 마스킹')
 def mask(
     paths: tuple,
     config: Optional[str],
@@ -92,7 +152,8 @@ def mask(
     exclude: tuple,
     output: Optional[str],
     output_format: str,
-    verbose: bool
+    verbose: bool,
+    full: bool
 ):
     """프로젝트의 민감 정보를 마스킹합니다.
     
@@ -109,6 +170,9 @@ def mask(
         
         # LLM 활성화
         python main.py mask . --use-llm
+        
+        # 변경되지 않은 파일도 모두 다시 마스킹
+        python main.py mask . --full
     """
     # 경로가 지정되지 않으면 현재 디렉토리 사용
     if not paths:
@@ -132,158 +196,541 @@ def mask(
         file_patterns=cfg.get('file_patterns', []),
         exclude_dirs=cfg.get('exclude_dirs', []),
         include_patterns=list(include) if include else None,
-        exclude_patterns=list(exclude) if exclude else None
+        exclude_patterns=list(exclude) if exclude else None,
+        workers=cfg.get('scan', {}).get('workers', 8),
+        ordered=cfg.get('scan', {}).get('ordered', True),
+        discovery=cfg.get('scan', {}).get('discovery', 'auto')
     )
     
     # 백업 매니저 초기화
     backup_config = cfg.get('backup', {})
     backup_manager = None if no_backup else BackupManager(
         backup_dir_name=backup_config.get('directory', '.masking_backup'),
-        suffix=backup_config.get('suffix', '.backup')
+        compression=backup_config.get('compression', 'auto'),
+        mode=backup_config.get('mode', 'objects')
     )
     
     # 파일 프로세서 초기화
     file_processor = FileProcessor(backup_manager)
     
     # 마스킹 엔진 초기화
-    engine = MaskingEngine(cfg)
+    engine = create_engine(cfg, console)
+    stream_threshold = cfg.get('stream_threshold_bytes', 16 * 1024 * 1024)
+    batch_size = max(1, cfg.get('batch_size', 500))
     
-    # LLM 클라이언트 초기화 (Ollama)
-    llm_client = None
-    if use_llm:
-        llm_config = LLMConfig.from_dict(cfg)
-        llm_client = create_llm_client(llm_config)
-        
-        # Ollama 연결 확인
-        if llm_client.is_available():
-            console.print_info(f"Ollama LLM 연결됨: {llm_config.endpoint} (모델: {llm_config.model})")
-        else:
-            console.print_warning(f"Ollama 연결 실패 또는 모델 '{llm_config.model}' 없음. 'ollama pull {llm_config.model}' 실행 필요.")
-            console.print_warning("LLM 없이 패턴 기반 탐지만 사용합니다.")
-            llm_client = None
-    
-    # 각 프로젝트 경로 처리
-    for project_path in paths:
-        project_path = os.path.abspath(project_path)
+    try:
+        # LLM 클라이언트 초기화 (Ollama)
+        llm_client, llm_config = connect_llm(cfg, console) if use_llm else (None, None)
         
-        console.print_info(f"프로젝트 스캔 중: {project_path}")
+        # 증분 스캔 인덱스 설정 (마스킹 설정이나 LLM 사용 여부가 바뀌면 인덱스 무효화)
+        index_config = cfg.get('index', {})
+        index_fingerprint = engine.fingerprint()
+        if llm_client:
+            index_fingerprint += f":llm:{llm_config.model}"
         
-        # 리포트 초기화
-        report = MaskingReport(
-            project_path=project_path,
-            llm_used=use_llm and llm_client is not None,
-            dry_run=dry_run
-        )
+        # 내용 해시 + 마스커 종류 -> 재사용할 마스킹 결과 요약
+        # 여러 모듈에 복사된 같은 설정 파일은 실행 전체에서 한 번만 마스킹(LLM 탐지 포함)하고 결과를 재사용
+        results_by_content: Dict[Tuple[str, str], ReusableResult] = {}
+        reuse_budget = REUSE_CONTENT_BUDGET
         
-        # 파일 스캔 및 처리
-        for file_path in scanner.scan(project_path):
-            rel_path = os.path.relpath(file_path, project_path)
+        # 각 프로젝트 경로 처리
+        for project_path in paths:
+            project_path = os.path.abspath(project_path)
             
-            try:
-                # 파일 읽기
-                content = file_processor.read_file(file_path)
+            console.print_info(f"프로젝트 스캔 중: {project_path}")
+            
+            # 리포트 초기화
+            report = MaskingReport(
+                project_path=project_path,
+                llm_used=use_llm and llm_client is not None,
+                dry_run=dry_run
+            )
+            
+            # 지난 실행 이후 바뀌지 않은 정상 파일은 건너뜀 (--full이면 모든 파일 처리)
+            scan_index = None
+            if index_config.get('enabled', False):
+                index_path = index_config.get('path') or os.path.join(
+                    backup_config.get('directory', '.masking_backup'), 'scan_index.json'
+                )
+                scan_index = ScanIndex(
+                    os.path.join(project_path, os.path.expanduser(index_path)),
+                    index_fingerprint
+                )
+            use_index = scan_index is not None and not full
+            
+            def record(file_report: FileReport):
+                """파일 리포트 추가 및 콘솔 출력"""
+                report.add_file_report(file_report)
+                if file_report.error:
+                    console.print_error(f"{file_report.relative_path}: {file_report.error}")
+                    return
+                console.print_file_processed(file_report.relative_path, file_report.masked_count, dry_run)
                 
-                # LLM을 통한 추가 패턴 탐지
-                if llm_client:
-                    try:
-                        llm_keys = llm_client.detect_sensitive_keys(content)
-                        if llm_keys:
-                            engine.add_sensitive_patterns(llm_keys)
-                            if verbose:
-                                console.print_info(f"LLM이 탐지한 추가 키: {llm_keys}")
-                    except Exception as e:
-                        console.print_warning(f"LLM 탐지 실패: {e}")
+                if verbose and file_report.masked_items:
+                    for item in file_report.masked_items:
+                        console.print_info(f"    Line {item.line}: {item.key}")
+            
+            def process_batch(batch: List[tuple]):
+                """읽어 둔 파일들을 마스킹하고 저장 (내용이 같은 파일은 한 번만 마스킹)"""
+                nonlocal reuse_budget
+                content_keys = [(digest, engine.masker_kind(file_path)) for file_path, _, _, _, digest in batch]
+                pending = {}
+                for content_key, entry in zip(content_keys, batch):
+                    if content_key not in results_by_content and content_key not in pending:
+                        pending[content_key] = entry
                 
-                # 마스킹 처리
-                result = engine.mask_file(file_path, content)
+                # LLM을 통한 추가 키 탐지 (파일별 오버레이로 전달, 엔진의 매처는 변경하지 않음)
+                llm_keys = {}
+                if llm_client:
+                    for file_path, rel_path, content, _, _ in pending.values():
+                        try:
+                            detected = llm_client.detect_sensitive_keys(content)
+                            if detected:
+                                llm_keys[file_path] = detected
+                                if verbose:
+                                    console.print_info(f"LLM이 탐지한 추가 키 ({rel_path}): {detected}")
+                        except Exception as e:
+                            console.print_warning(f"LLM 탐지 실패: {e}")
                 
-                # 파일 저장 (dry_run이 아닐 때만)
-                if not dry_run and result.masked_count > 0:
-                    backup_path = None
-                    if backup_manager:
-                        backup_path = backup_manager.create_backup(file_path, project_path)
-                    
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(result.masked_content)
-                    
-                    file_report = FileReport(
-                        file_path=file_path,
-                        relative_path=rel_path,
-                        masked_count=result.masked_count,
+                # 배치 전체의 고유 키/값을 한 번씩만 판정
+                results = engine.mask_many(
+                    ((file_path, content) for file_path, _, content, _, _ in pending.values()),
+                    extra_keys=llm_keys
+                )
+                batch_results: Dict[Tuple[str, str], MaskingResult] = {}
+                for (content_key, entry), result in zip(pending.items(), results):
+                    batch_results[content_key] = result
+                    masked_content = None
+                    if result.masked_count > 0 and len(result.masked_content) <= reuse_budget:
+                        masked_content = result.masked_content
+                        reuse_budget -= len(masked_content)
+                    results_by_content[content_key] = ReusableResult(
+                        source_path=entry[0],
                         masked_items=result.masked_items,
-                        backup_path=backup_path
-                    )
-                else:
-                    file_report = FileReport(
-                        file_path=file_path,
-                        relative_path=rel_path,
-                        masked_count=result.masked_count,
-                        masked_items=result.masked_items
+                        error=result.error,
+                        masked_content=masked_content,
+                        llm_keys=llm_keys.get(entry[0])
                     )
                 
-                report.add_file_report(file_report)
-                console.print_file_processed(rel_path, result.masked_count, dry_run)
+                for (file_path, rel_path, content, stat, digest), content_key in zip(batch, content_keys):
+                    reused = results_by_content[content_key]
+                    duplicate_of = None
+                    if reused.source_path != file_path:
+                        duplicate_of = os.path.relpath(reused.source_path, project_path)
+                    result = batch_results.get(content_key)
+                    if result is None and reused.masked_items and reused.masked_content is None:
+                        # 보관 한도를 넘어 버린 마스킹 결과: 같은 LLM 키로 다시 마스킹
+                        result = engine.mask_file(file_path, content, extra_keys=reused.llm_keys)
+                    elif duplicate_of is not None:
+                        # 다시 마스킹하지 않은 중복 파일도 규칙별 탐지 횟수에 집계
+                        engine.count_secret_hits(reused.masked_items, reused.llm_keys)
+                    if result is None:
+                        result = MaskingResult(
+                            file_path=file_path,
+                            original_content=content,
+                            masked_content=content if reused.masked_content is None else reused.masked_content,
+                            masked_items=reused.masked_items,
+                            error=reused.error
+                        )
+                    if scan_index is not None:
+                        if result.error is None and result.masked_count == 0:
+                            scan_index.mark_clean(rel_path, stat, digest)
+                        else:
+                            scan_index.discard(rel_path)
+                    
+                    try:
+                        backup_path = None
+                        # 마스킹 결과를 임시 파일에 기록 (dry_run이 아닐 때만, 프로젝트 처리가 끝나면 일괄 교체)
+                        if not dry_run and result.masked_count > 0:
+                            if backup_manager:
+                                backup_path = backup_manager.create_backup(file_path, project_path)
+                            transaction.stage(file_path, result.masked_content)
+                        
+                        record(FileReport(
+                            file_path=file_path,
+                            relative_path=rel_path,
+                            masked_count=result.masked_count,
+                            masked_items=result.masked_items,
+                            backup_path=backup_path,
+                            error=result.error,
+                            duplicate_of=duplicate_of
+                        ))
+                    except Exception as e:
+                        record(FileReport(
+                            file_path=file_path,
+                            relative_path=rel_path,
+                            masked_count=0,
+                            error=str(e)
+                        ))
                 
-                if verbose and result.masked_items:
-                    for item in result.masked_items:
-                        console.print_info(f"    Line {item['line']}: {item['key']}")
+                # 배치의 백업 기록을 저널에 한 번에 추가
+                if backup_manager:
+                    backup_manager.flush(project_path)
+            
+            # 파일 스캔 및 처리 (batch_size개씩 모아서 일괄 마스킹)
+            # 마스킹된 파일은 임시 파일에 모아 두었다가 프로젝트 처리가 끝난 뒤 한 번에 교체
+            transaction = FileTransaction()
+            try:
+                batch = []
+                checked_dirs = set()
+                for file_path in scanner.scan(project_path):
+                    rel_path = os.path.relpath(file_path, project_path)
+                    
+                    # 이전 실행이 비정상 종료로 남긴 임시 파일은 디렉토리마다 처음 한 번 삭제
+                    if not dry_run:
+                        directory = os.path.dirname(file_path)
+                        if directory not in checked_dirs:
+                            checked_dirs.add(directory)
+                            remove_stale_temp_files(directory)
+                    if is_temp_file(file_path):
+                        continue
+                    
+                    try:
+                        stat = os.stat(file_path)
+                        if use_index and scan_index.is_unchanged(rel_path, stat):
+                            report.add_skipped_file()
+                            continue
+                        
+                        # 대용량 파일은 라인 단위 스트리밍 마스킹 (LLM 탐지 생략)
+                        if stat.st_size >= stream_threshold:
+                            masked_items, backup_path = file_processor.mask_file_streaming(
+                                file_path, engine, project_path, dry_run=dry_run, transaction=transaction
+                            )
+                            if scan_index is not None:
+                                if masked_items:
+                                    scan_index.discard(rel_path)
+                                else:
+                                    scan_index.mark_clean(rel_path, stat)
+                            record(FileReport(
+                                file_path=file_path,
+                                relative_path=rel_path,
+                                masked_count=len(masked_items),
+                                masked_items=masked_items,
+                                backup_path=backup_path
+                            ))
+                            continue
+                        
+                        # 파일 읽기 (파일 상태만 바뀌고 내용이 같은 정상 파일은 건너뜀)
+                        content = file_processor.read_file(file_path)
+                        digest = content_digest(content)
+                        if use_index and scan_index.has_content(rel_path, digest):
+                            scan_index.mark_clean(rel_path, stat, digest)
+                            report.add_skipped_file()
+                            continue
+                        batch.append((file_path, rel_path, content, stat, digest))
+                    except Exception as e:
+                        record(FileReport(
+                            file_path=file_path,
+                            relative_path=rel_path,
+                            masked_count=0,
+                            error=str(e)
+                        ))
+                        continue
+                    
+                    if len(batch) >= batch_size:
+                        process_batch(batch)
+                        batch = []
                 
-            except Exception as e:
-                file_report = FileReport(
-                    file_path=file_path,
-                    relative_path=rel_path,
-                    masked_count=0,
-                    error=str(e)
+                if batch:
+                    process_batch(batch)
+            except BaseException:
+                # 중단되면 원본은 그대로 두고 임시 파일만 삭제
+                transaction.rollback()
+                raise
+            
+            # 백업 기록을 먼저 저널에 남긴 뒤 마스킹 결과 일괄 교체
+            if backup_manager:
+                backup_manager.flush(project_path)
+            for file_path, error in transaction.commit():
+                rel_path = os.path.relpath(file_path, project_path)
+                report.errors.append(f"{file_path}: {error}")
+                console.print_error(f"{rel_path}: {error}")
+                if scan_index is not None:
+                    scan_index.discard(rel_path)
+            
+            if scan_index is not None and not dry_run:
+                scan_index.save()
+            
+            # 요약 출력
+            console.print_summary(report)
+            
+            if verbose:
+                stats = engine.matcher.cache_stats()
+                console.print_info(
+                    f"키 판정 캐시: hit {stats['hits']}, miss {stats['misses']} "
+                    f"({stats['size']}/{stats['max_size']}), 영구 캐시 hit {stats['store_hits']}"
                 )
-                report.add_file_report(file_report)
+                secret_scanner = engine.matcher.secret_scanner
+                if secret_scanner is not None and secret_scanner.hit_counts():
+                    hits = ', '.join(f"{name} {count}" for name, count in secret_scanner.hit_counts().items())
+                    console.print_info(f"비밀 값 규칙 팩 {secret_scanner.version} 탐지: {hits}")
+            
+            # 리포트 저장
+            if output:
+                generator = ReportGenerator(output_format)
+                generator.save(report, output)
+                console.print_info(f"리포트 저장됨: {output}")
+            else:
+                # 기본 리포트 파일
+                default_output = os.path.join(project_path, f"masking_report.{output_format}")
+                generator = ReportGenerator(output_format)
+                generator.save(report, default_output)
+                console.print_info(f"리포트 저장됨: {default_output}")
+    finally:
+        # 영구 판정 캐시 기록 (중단되어도 기록하고 연결 종료)
+        close_engine(engine, console)
+
+
+@cli.command()
+@click.argument('paths', nargs=-1, type=click.Path(exists=True))
+@click.option('--config', '-c', type=click.Path(exists=True), help='커스텀 설정 파일 경로')
+@click.option('--no-backup', is_flag=True, help='백업 없이 원본 파일 직접 수정')
+@click.option('--use-llm', is_flag=True, help='LLM 기반 고급 탐지 활성화')
+@click.option('--include', '-i', multiple=True, help='포함할 파일 패턴')
+@click.option('--exclude', '-e', multiple=True, help='제외할 파일/폴더 패턴')
+@click.option('--initial', is_flag=True, help='감시 시작 전에 기존 대상 파일을 한 번 마스킹')
+@click.option('--verbose', '-v', is_flag=True, help='상세 출력')
+def watch(
+    paths: tuple,
+    config: Optional[str],
+    no_backup: bool,
+    use_llm: bool,
+    include: tuple,
+    exclude: tuple,
+    initial: bool,
+    verbose: bool
+):
+    """설정 파일 변경을 감시하여 생성/수정된 파일을 바로 마스킹합니다 (Ctrl+C로 종료).
+    
+    예시:
+    
+        # 현재 디렉토리 감시
+        python main.py watch .
+        
+        # 기존 파일을 먼저 마스킹한 뒤 감시
+        python main.py watch /path/to/project --initial
+    """
+    if not paths:
+        paths = ('.',)
+    project_paths = [os.path.abspath(path) for path in paths]
+    
+    cfg = load_config(config)
+    watch_config = cfg.get('watch', {})
+    
+    console = ConsoleReporter()
+    console.print_header("설정 파일 감시")
+    
+    scanner = FileScanner(
+        file_patterns=cfg.get('file_patterns', []),
+        exclude_dirs=cfg.get('exclude_dirs', []),
+        include_patterns=list(include) if include else None,
+        exclude_patterns=list(exclude) if exclude else None,
+        workers=cfg.get('scan', {}).get('workers', 8),
+        ordered=cfg.get('scan', {}).get('ordered', True),
+        discovery=cfg.get('scan', {}).get('discovery', 'auto')
+    )
+    
+    backup_config = cfg.get('backup', {})
+    backup_manager = None if no_backup else BackupManager(
+        backup_dir_name=backup_config.get('directory', '.masking_backup'),
+        compression=backup_config.get('compression', 'auto'),
+        mode=backup_config.get('mode', 'objects')
+    )
+    file_processor = FileProcessor(backup_manager)
+    
+    # 엔진과 LLM 클라이언트는 감시하는 동안 한 번만 만들어 재사용
+    engine = create_engine(cfg, console)
+    stream_threshold = cfg.get('stream_threshold_bytes', 16 * 1024 * 1024)
+    llm_client, _ = connect_llm(cfg, console) if use_llm else (None, None)
+    
+    # 임시 파일 정리를 마친 디렉토리
+    checked_dirs = set()
+    
+    def mask_changed(project_path: str, file_paths: List[str]):
+        """변경된 파일 마스킹 후 한 번에 교체"""
+        transaction = FileTransaction()
+        try:
+            mask_into(project_path, file_paths, transaction)
+        except BaseException:
+            transaction.rollback()
+            raise
+        
+        # 백업 기록을 먼저 저널에 남긴 뒤 마스킹 결과 교체
+        if backup_manager:
+            backup_manager.flush(project_path)
+        for file_path, error in transaction.commit():
+            console.print_error(f"{os.path.relpath(file_path, project_path)}: {error}")
+    
+    def mask_into(project_path: str, file_paths: List[str], transaction: FileTransaction):
+        """변경된 파일을 마스킹하여 결과를 트랜잭션에 기록"""
+        entries = []
+        for file_path in file_paths:
+            rel_path = os.path.relpath(file_path, project_path)
+            # 이전 실행이 비정상 종료로 남긴 임시 파일은 디렉토리마다 처음 한 번 삭제
+            directory = os.path.dirname(file_path)
+            if directory not in checked_dirs:
+                checked_dirs.add(directory)
+                remove_stale_temp_files(directory)
+            if is_temp_file(file_path):
+                continue
+            try:
+                # 대용량 파일은 라인 단위 스트리밍 마스킹 (LLM 탐지 생략)
+                if os.path.getsize(file_path) >= stream_threshold:
+                    masked_items, _ = file_processor.mask_file_streaming(
+                        file_path, engine, project_path, transaction=transaction
+                    )
+                    if masked_items:
+                        console.print_file_processed(rel_path, len(masked_items))
+                    continue
+                entries.append((file_path, rel_path, file_processor.read_file(file_path)))
+            except Exception as e:
                 console.print_error(f"{rel_path}: {e}")
         
-        # 요약 출력
-        console.print_summary(report)
+        llm_keys = {}
+        if llm_client:
+            for file_path, rel_path, content in entries:
+                try:
+                    detected = llm_client.detect_sensitive_keys(content)
+                    if detected:
+                        llm_keys[file_path] = detected
+                        if verbose:
+                            console.print_info(f"LLM이 탐지한 추가 키 ({rel_path}): {detected}")
+                except Exception as e:
+                    console.print_warning(f"LLM 탐지 실패: {e}")
         
-        # 리포트 저장
-        if output:
-            generator = ReportGenerator(output_format)
-            generator.save(report, output)
-            console.print_info(f"리포트 저장됨: {output}")
-        else:
-            # 기본 리포트 파일
-            default_output = os.path.join(project_path, f"masking_report.{output_format}")
-            generator = ReportGenerator(output_format)
-            generator.save(report, default_output)
-            console.print_info(f"리포트 저장됨: {default_output}")
+        results = engine.mask_many(
+            ((file_path, content) for file_path, _, content in entries),
+            extra_keys=llm_keys
+        )
+        for (file_path, rel_path, _), result in zip(entries, results):
+            if result.error:
+                console.print_error(f"{rel_path}: {result.error}")
+                continue
+            if result.masked_count == 0:
+                if verbose:
+                    console.print_file_processed(rel_path, 0)
+                continue
+            
+            try:
+                if backup_manager:
+                    backup_manager.create_backup(file_path, project_path)
+                transaction.stage(file_path, result.masked_content)
+            except Exception as e:
+                console.print_error(f"{rel_path}: {e}")
+                continue
+            
+            console.print_file_processed(rel_path, result.masked_count)
+            if verbose:
+                for item in result.masked_items:
+                    console.print_info(f"    Line {item.line}: {item.key}")
+    
+    watcher = ConfigWatcher(
+        scanner,
+        mask_changed,
+        debounce=watch_config.get('debounce_ms', 300) / 1000,
+        poll_interval=watch_config.get('poll_interval', 1.0),
+        backend=watch_config.get('backend', 'auto')
+    )
+    
+    try:
+        if initial:
+            batch_size = max(1, cfg.get('batch_size', 500))
+            for project_path in project_paths:
+                console.print_info(f"기존 파일 마스킹 중: {project_path}")
+                files = list(scanner.scan(project_path))
+                for start in range(0, len(files), batch_size):
+                    mask_changed(project_path, files[start:start + batch_size])
+        
+        for project_path in project_paths:
+            console.print_info(f"감시 중: {project_path}")
+        console.print_info(f"감시 방식: {watcher.backend} (Ctrl+C로 종료)")
+        
+        watcher.watch(project_paths)
+    finally:
+        # 영구 판정 캐시 기록
+        close_engine(engine, console)
 
 
 @cli.command()
 @click.argument('paths', nargs=-1, type=click.Path(exists=True))
-def restore(paths: tuple):
+@click.option('--config', '-c', type=click.Path(exists=True), help='커스텀 설정 파일 경로')
+@click.option('--path', '-p', 'patterns', multiple=True, help='복원할 파일의 상대 경로 패턴 (예: "svc-order/**")')
+@click.option('--run', 'run_id', help='이 실행 ID에서 마스킹한 파일만 그 실행 전 내용으로 복원')
+@click.option('--before', type=click.DateTime(), help='이 시각 이전의 가장 최근 백업으로 복원 (예: 2026-01-31T18:00:00)')
+@click.option('--workers', type=int, default=8, show_default=True, help='복원 스레드 수')
+@click.option('--list', 'list_runs', is_flag=True, help='백업 실행 목록만 출력')
+def restore(
+    paths: tuple,
+    config: Optional[str],
+    patterns: tuple,
+    run_id: Optional[str],
+    before: Optional[datetime],
+    workers: int,
+    list_runs: bool
+):
     """백업에서 원본 파일을 복원합니다.
     
     예시:
     
+        # 모든 파일을 최신 백업으로 복원
         python main.py restore /path/to/project
+        
+        # 한 서비스만 복원
+        python main.py restore /path/to/project --path "svc-order/**"
+        
+        # 특정 실행의 마스킹 되돌리기
+        python main.py restore /path/to/project --list
+        python main.py restore /path/to/project --run 20260131T180000-1a2b3c
     """
     if not paths:
         paths = ('.',)
     
+    cfg = load_config(config)
+    
     console = ConsoleReporter()
     console.print_header("백업 복원")
     
-    backup_manager = BackupManager()
+    backup_config = cfg.get('backup', {})
+    backup_manager = BackupManager(
+        backup_dir_name=backup_config.get('directory', '.masking_backup'),
+        compression=backup_config.get('compression', 'auto'),
+        mode=backup_config.get('mode', 'objects')
+    )
     
     for project_path in paths:
         project_path = os.path.abspath(project_path)
+        
+        if list_runs:
+            runs = backup_manager.list_runs(project_path)
+            if not runs:
+                console.print_warning(f"백업 실행 기록이 없습니다: {project_path}")
+                continue
+            print(f"\n백업 실행 목록 ({project_path}):\n")
+            for run, started, count in runs:
+                print(f"  • {run}  {started}  {count}개 파일")
+            continue
+        
         console.print_info(f"복원 중: {project_path}")
         
-        restored = backup_manager.restore_all(project_path)
+        result = backup_manager.restore(
+            project_path,
+            patterns=list(patterns) or None,
+            run_id=run_id,
+            before=before,
+            workers=workers
+        )
         
-        if restored:
-            for file_path in restored:
-                rel_path = os.path.relpath(file_path, project_path)
-                console.print_file_processed(rel_path, 0, False)
-                console.print_info(f"복원됨: {rel_path}")
-            console.print_info(f"총 {len(restored)}개 파일이 복원되었습니다.")
-        else:
+        for file_path in result.restored:
+            console.print_info(f"복원됨: {os.path.relpath(file_path, project_path)}")
+        for file_path, error in result.errors:
+            console.print_error(f"{os.path.relpath(file_path, project_path)}: {error}")
+        
+        if result.restored or result.unchanged:
+            console.print_info(
+                f"총 {len(result.restored)}개 파일이 복원되었습니다. "
+                f"(백업과 같아 건너뜀: {len(result.unchanged)}개)"
+            )
+        elif not result.errors:
             console.print_warning("복원할 백업 파일이 없습니다.")
 
 
@@ -342,7 +789,10 @@ def scan(path: str, config: Optional[str]):
     
     scanner = FileScanner(
         file_patterns=cfg.get('file_patterns', []),
-        exclude_dirs=cfg.get('exclude_dirs', [])
+        exclude_dirs=cfg.get('exclude_dirs', []),
+        workers=cfg.get('scan', {}).get('workers', 8),
+        ordered=cfg.get('scan', {}).get('ordered', True),
+        discovery=cfg.get('scan', {}).get('discovery', 'auto')
     )
     
     console.print_info(f"스캔 중: {project_path}")
@@ -414,7 +864,8 @@ mask_format: "***MASKED***"
 backup:
   enabled: true
   directory: ".masking_backup"
-  suffix: ".backup"
+  compression: "auto"
+  mode: "objects"
 
 # Ollama LLM 설정
 llm:
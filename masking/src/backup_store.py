@@ -0,0 +1,311 @@
+"""
+백업 객체 저장소 모듈
+
+마스킹 전 원본 내용을 내용 해시(SHA-256)로 식별되는 압축 객체로 저장합니다.
+같은 내용은 파일이나 실행이 달라도 한 번만 저장되므로, 백업은 실제로 바뀐 내용만큼만 공간을 사용합니다.
+
+- ObjectStore: <백업 디렉토리>/objects/에 객체마다 파일 하나
+- ArchiveStore: <백업 디렉토리>/archives/에 실행마다 tar 아카이브 하나 (네트워크 파일 시스템용)
+"""
+
+import glob
+import hashlib
+import json
+import os
+import tarfile
+import tempfile
+import time
+import zlib
+from typing import Dict, Iterable, Optional, Tuple
+
+try:
+    import zstandard  # 선택적 의존성 (zstd 압축)
+except ImportError:
+    zstandard = None
+
+
+# 파일을 읽고 압축하는 단위 (대용량 파일도 메모리 사용량 일정)
+CHUNK_SIZE = 1024 * 1024
+
+# 압축 방식 -> 객체 파일 확장자
+CODEC_SUFFIXES = {'zstd': '.zst', 'zlib': '.zz'}
+
+
+def hash_file(file_path: str) -> str:
+    """파일 내용의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _require_zstd():
+    if zstandard is None:
+        raise ImportError("zstd 압축 백업을 사용하려면 'pip install zstandard'가 필요합니다.")
+
+
+def _resolve_compression(compression: str) -> str:
+    """압축 방식 설정값 확인 (auto: zstandard가 설치되어 있으면 zstd, 아니면 zlib)"""
+    if compression == 'auto':
+        compression = 'zstd' if zstandard is not None else 'zlib'
+    if compression not in CODEC_SUFFIXES:
+        raise ValueError(f"지원하지 않는 백업 압축 방식: {compression}")
+    if compression == 'zstd':
+        _require_zstd()
+    return compression
+
+
+def _compress_file(file_path: str, codec: str, dst) -> int:
+    """
+    파일을 CHUNK_SIZE 단위로 압축하여 dst에 기록
+
+    Returns:
+        기록한 압축 데이터 크기
+    """
+    compressor = zstandard.ZstdCompressor().compressobj() if codec == 'zstd' else zlib.compressobj(6)
+    written = 0
+    with open(file_path, 'rb') as src:
+        for chunk in iter(lambda: src.read(CHUNK_SIZE), b''):
+            written += dst.write(compressor.compress(chunk))
+    written += dst.write(compressor.flush())
+    return written
+
+
+def _decompress(chunks: Iterable[bytes], codec: str) -> bytes:
+    """압축 데이터 조각을 압축 해제"""
+    if codec == 'zstd':
+        _require_zstd()
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+    else:
+        decompressor = zlib.decompressobj()
+    parts = [decompressor.decompress(chunk) for chunk in chunks]
+    if codec == 'zlib':
+        parts.append(decompressor.flush())
+    return b''.join(parts)
+
+
+class ObjectStore:
+    """
+    내용 주소 기반 백업 객체 저장소
+
+    객체는 objects/<해시 앞 2자리>/<나머지 해시><확장자>에 저장하며, 확장자로 압축 방식을 구분합니다.
+    압축 방식을 바꿔도 기존 객체는 그대로 읽고 같은 내용은 다시 저장하지 않습니다.
+    """
+
+    def __init__(self, root: str, compression: str = 'auto'):
+        """
+        Args:
+            root: 객체 저장소 디렉토리 (<백업 디렉토리>/objects)
+            compression: auto (zstandard가 설치되어 있으면 zstd, 아니면 zlib), zstd, zlib
+        """
+        self.root = root
+        self.compression = _resolve_compression(compression)
+
+    def _object_path(self, digest: str, codec: str) -> str:
+        return os.path.join(self.root, digest[:2], digest[2:] + CODEC_SUFFIXES[codec])
+
+    def find(self, digest: str) -> Optional[Tuple[str, str]]:
+        """
+        저장된 객체 찾기
+
+        Returns:
+            (객체 경로, 압축 방식), 없으면 None
+        """
+        for codec in (self.compression, *(c for c in CODEC_SUFFIXES if c != self.compression)):
+            path = self._object_path(digest, codec)
+            if os.path.exists(path):
+                return path, codec
+        return None
+
+    def put_file(self, file_path: str) -> Tuple[str, str]:
+        """
+        파일 내용을 객체로 저장 (같은 내용의 객체가 이미 있으면 저장하지 않음)
+
+        객체는 같은 디렉토리의 임시 파일에 압축해 쓴 뒤 이름을 바꾸므로, 중단되어도
+        잘린 객체가 남지 않습니다.
+
+        Args:
+            file_path: 저장할 파일 경로
+
+        Returns:
+            (내용 해시, 객체 경로)
+        """
+        digest = hash_file(file_path)
+        found = self.find(digest)
+        if found is not None:
+            return digest, found[0]
+
+        object_path = self._object_path(digest, self.compression)
+        directory = os.path.dirname(object_path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix='.object.', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as dst:
+                _compress_file(file_path, self.compression, dst)
+            os.replace(temp_path, object_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return digest, object_path
+
+    def read(self, digest: str) -> bytes:
+        """
+        객체 내용을 압축 해제하여 반환
+
+        Raises:
+            FileNotFoundError: 객체가 없는 경우
+        """
+        found = self.find(digest)
+        if found is None:
+            raise FileNotFoundError(f"백업 객체 없음: {digest}")
+        object_path, codec = found
+        with open(object_path, 'rb') as f:
+            return _decompress(iter(lambda: f.read(CHUNK_SIZE), b''), codec)
+
+    def flush(self):
+        """객체는 저장 시점에 바로 기록되므로 할 일 없음 (ArchiveStore와 같은 인터페이스)"""
+
+
+class ArchiveStore:
+    """
+    실행 단위 tar 아카이브 백업 저장소
+
+    한 실행의 원본을 <실행 ID>.tar 하나에 순차적으로 추가하므로 파일마다 생성/이름 변경 같은
+    메타데이터 왕복이 생기지 않습니다. 아카이브 자체는 압축하지 않고 멤버(<해시><확장자>)마다
+    따로 압축하여, <실행 ID>.index.json에 기록한 데이터 위치(offset_data)와 크기로 멤버 하나만
+    바로 읽을 수 있습니다. 이전 실행의 아카이브에 같은 내용이 있으면 다시 저장하지 않습니다.
+    """
+
+    INDEX_SUFFIX = '.index.json'
+
+    def __init__(self, root: str, run_id: str, compression: str = 'auto'):
+        """
+        Args:
+            root: 아카이브 디렉토리 (<백업 디렉토리>/archives)
+            run_id: 이번 실행 ID (새 백업을 추가할 아카이브 이름)
+            compression: 멤버 압축 방식 (auto, zstd, zlib)
+        """
+        self.root = root
+        self.run_id = run_id
+        self.compression = _resolve_compression(compression)
+        self.archive_path = os.path.join(root, f"{run_id}.tar")
+        self._tar: Optional[tarfile.TarFile] = None
+        # 내용 해시 -> 멤버 위치 (모든 아카이브)
+        self._entries: Optional[Dict[str, Dict]] = None
+        # 이번 실행 아카이브에 추가한 멤버 위치 (flush 시 인덱스 파일로 기록)
+        self._added: Dict[str, Dict] = {}
+
+    def _load_entries(self) -> Dict[str, Dict]:
+        """모든 아카이브 인덱스를 읽어 내용 해시 -> 멤버 위치 반환 (처음 한 번만)"""
+        if self._entries is None:
+            self._entries = {}
+            for index_path in sorted(glob.glob(os.path.join(glob.escape(self.root), '*' + self.INDEX_SUFFIX))):
+                try:
+                    with open(index_path, 'r', encoding='utf-8') as f:
+                        self._entries.update(json.load(f))
+                except (OSError, ValueError):
+                    continue
+        return self._entries
+
+    def find(self, digest: str) -> Optional[Tuple[str, str]]:
+        """
+        저장된 멤버 찾기
+
+        Returns:
+            ('<아카이브 경로>#<해시>', 압축 방식), 없으면 None
+        """
+        entry = self._load_entries().get(digest)
+        if entry is None:
+            return None
+        return f"{os.path.join(self.root, entry['archive'])}#{digest}", entry['codec']
+
+    def put_file(self, file_path: str) -> Tuple[str, str]:
+        """
+        파일 내용을 이번 실행 아카이브에 멤버로 추가 (같은 내용이 이미 있으면 추가하지 않음)
+
+        멤버 크기를 헤더에 먼저 써야 하므로 압축 결과는 임시 버퍼(큰 파일은 디스크)에 모은 뒤 추가합니다.
+
+        Returns:
+            (내용 해시, '<아카이브 경로>#<해시>')
+        """
+        digest = hash_file(file_path)
+        found = self.find(digest)
+        if found is not None:
+            return digest, found[0]
+
+        if self._tar is None:
+            os.makedirs(self.root, exist_ok=True)
+            # 이전 flush에서 닫은 아카이브에는 이어서 추가
+            self._tar = tarfile.open(self.archive_path, 'a', format=tarfile.PAX_FORMAT)
+
+        with tempfile.SpooledTemporaryFile(max_size=8 * CHUNK_SIZE) as buffer:
+            size = _compress_file(file_path, self.compression, buffer)
+            buffer.seek(0)
+
+            info = tarfile.TarInfo(digest + CODEC_SUFFIXES[self.compression])
+            info.size = size
+            info.mtime = int(time.time())
+            offset_data = self._tar.offset + len(info.tobuf(self._tar.format, self._tar.encoding, self._tar.errors))
+            self._tar.addfile(info, buffer)
+
+        entry = {
+            'archive': os.path.basename(self.archive_path),
+            'offset_data': offset_data,
+            'size': size,
+            'codec': self.compression
+        }
+        self._added[digest] = entry
+        self._load_entries()[digest] = entry
+        return digest, f"{self.archive_path}#{digest}"
+
+    def read(self, digest: str) -> bytes:
+        """
+        멤버 하나를 인덱스의 위치에서 바로 읽어 압축 해제
+
+        Raises:
+            FileNotFoundError: 멤버가 없는 경우
+        """
+        entry = self._load_entries().get(digest)
+        if entry is None:
+            raise FileNotFoundError(f"백업 객체 없음: {digest}")
+        if self._tar is not None and entry['archive'] == os.path.basename(self.archive_path):
+            self._tar.fileobj.flush()
+
+        with open(os.path.join(self.root, entry['archive']), 'rb') as f:
+            f.seek(entry['offset_data'])
+            data = f.read(entry['size'])
+        if len(data) != entry['size']:
+            raise ValueError(f"백업 아카이브가 잘렸습니다: {entry['archive']}")
+        return _decompress([data], entry['codec'])
+
+    def flush(self):
+        """
+        아카이브를 닫아 디스크에 기록한 뒤 인덱스 파일 갱신
+
+        백업 기록(저널)이 아카이브 멤버를 가리키기 전에 호출해야 합니다.
+        """
+        if self._tar is None:
+            return
+        self._tar.close()
+        self._tar = None
+
+        fd = os.open(self.archive_path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        index_path = os.path.join(self.root, self.run_id + self.INDEX_SUFFIX)
+        fd, temp_path = tempfile.mkstemp(prefix='.index.', suffix='.tmp', dir=self.root)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._added, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, index_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
@@ -0,0 +1,219 @@
+"""
+엔트로피 기반 비밀 값 탐지 모듈
+
+값의 Shannon 엔트로피와 문자 종류 특성으로 무작위 토큰(16진수 키, base64 비밀키 등)을
+탐지합니다. NumPy가 설치되어 있으면 여러 값의 바이트를 하나의 배열로 이어 붙여 한 번에 계산합니다.
+"""
+
+import math
+import re
+import string
+from itertools import compress
+from operator import itemgetter
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np  # 선택적 의존성 (일괄 계산 가속)
+except ImportError:
+    np = None
+
+
+# 토큰 형태로 볼 수 있는 값 (공백, URL 구분자 등이 없는 값)
+_TOKEN_RE = re.compile(r'^[A-Za-z0-9+/=_\-]+$')
+_HEX_RE = re.compile(r'^[0-9a-fA-F]+$')
+
+# 토큰 문자 알파벳 (소문자, 대문자, 숫자, 기타 순서) 및 문자 종류별 인덱스 범위
+_TOKEN_ALPHABET = string.ascii_lowercase + string.ascii_uppercase + string.digits + '+/=_-'
+_CLASS_RANGES = ((0, 26), (26, 52), (52, 62), (62, len(_TOKEN_ALPHABET)))
+
+# 바이트 플래그 (문자 종류 4비트 + 16진수 외 문자 + 토큰 외 문자)
+_FLAG_CLASSES = 0x0F
+_FLAG_NON_HEX = 0x10
+_FLAG_INVALID = 0x20
+
+if np is not None:
+    # 바이트 -> 알파벳 인덱스 (토큰 형태인 값의 바이트에만 사용)
+    _BYTE_TO_INDEX = np.zeros(256, dtype=np.uint8)
+    # 바이트 -> 플래그 (알파벳 외 바이트는 _FLAG_INVALID)
+    _BYTE_FLAGS = np.full(256, _FLAG_INVALID, dtype=np.uint8)
+    for _index, _ch in enumerate(_TOKEN_ALPHABET):
+        _BYTE_TO_INDEX[ord(_ch)] = _index
+        _class = next(number for number, (start, end) in enumerate(_CLASS_RANGES) if start <= _index < end)
+        _BYTE_FLAGS[ord(_ch)] = (1 << _class) | (0 if _ch in string.hexdigits else _FLAG_NON_HEX)
+    # 문자 종류 비트 -> 문자 종류 수
+    _CLASS_COUNT = np.array([bin(bits).count('1') for bits in range(_FLAG_CLASSES + 1)], dtype=np.uint8)
+
+# 일괄 판정 시 한 번에 계산할 값 수 (히스토그램이 CPU 캐시에 들어가는 크기)
+_BLOCK_ROWS = 4096
+
+
+def _c_log_c_table(width: int):
+    """0..width 개수에 대한 c * log2(c) 조회 테이블"""
+    c = np.arange(width + 1, dtype=np.float64)
+    return c * np.log2(np.maximum(c, 1.0))
+
+
+def _concat_ascii(values: List[str]) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    문자열들을 이어 붙인 바이트 배열과 문자열별 길이
+
+    ASCII가 아닌 문자는 '?' 한 바이트로 바꾸므로(토큰 문자가 아님) 문자 위치와 바이트 위치가 같습니다.
+    """
+    lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+    data = np.frombuffer(''.join(values).encode('ascii', 'replace'), dtype=np.uint8)
+    return data, lengths
+
+
+def _char_classes(value: str) -> int:
+    """소문자/대문자/숫자/기타 중 포함된 문자 종류 수"""
+    lower = upper = digit = other = False
+    for ch in value:
+        if 'a' <= ch <= 'z':
+            lower = True
+        elif 'A' <= ch <= 'Z':
+            upper = True
+        elif '0' <= ch <= '9':
+            digit = True
+        else:
+            other = True
+    return lower + upper + digit + other
+
+
+def shannon_entropy(value: str) -> float:
+    """문자당 Shannon 엔트로피 (bits)"""
+    if not value:
+        return 0.0
+    counts = {}
+    for ch in value:
+        counts[ch] = counts.get(ch, 0) + 1
+    length = len(value)
+    return -sum((c / length) * math.log2(c / length) for c in counts.values())
+
+
+class EntropyDetector:
+    """
+    엔트로피/문자 종류 기반 비밀 값 탐지기
+
+    다음 조건을 모두 만족하는 값을 비밀 값으로 판정합니다.
+
+    - 공백이나 ``:``, ``.`` 등이 없는 토큰 형태이고 길이가 min_length 이상
+    - 문자 종류(소문자/대문자/숫자/기타)가 min_char_classes 이상
+    - 엔트로피가 임계값 이상 (16진수로만 이루어진 값은 hex_threshold 사용)
+
+    엔트로피는 앞에서부터 최대 max_length 문자까지만 계산합니다.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 4.0,
+        hex_threshold: float = 3.0,
+        min_length: int = 20,
+        max_length: int = 64,
+        min_char_classes: int = 2
+    ):
+        """
+        Args:
+            threshold: 일반 토큰의 엔트로피 임계값 (bits/char)
+            hex_threshold: 16진수 토큰의 엔트로피 임계값 (bits/char)
+            min_length: 최소 길이
+            max_length: 엔트로피 계산에 사용할 최대 길이 (고정 폭 배열 폭)
+            min_char_classes: 최소 문자 종류 수
+        """
+        self.threshold = threshold
+        self.hex_threshold = hex_threshold
+        self.min_length = min_length
+        self.max_length = max_length
+        self.min_char_classes = min_char_classes
+
+    def _is_candidate(self, value: str) -> bool:
+        return len(value) >= self.min_length and _TOKEN_RE.match(value) is not None
+
+    def _threshold_for(self, sample: str) -> float:
+        return self.hex_threshold if _HEX_RE.match(sample) else self.threshold
+
+    def is_secret(self, value: str) -> bool:
+        """단일 값 판정 (순수 Python)"""
+        if not isinstance(value, str) or not self._is_candidate(value):
+            return False
+        sample = value[:self.max_length]
+        if _char_classes(sample) < self.min_char_classes:
+            return False
+        return shannon_entropy(sample) >= self._threshold_for(sample)
+
+    def _detect_block(self, data, lengths):
+        """
+        이어 붙인 바이트 배열로 주어진 값들을 판정 (detect_batch의 블록 단위 계산)
+
+        Args:
+            data: 값들의 앞 max_length 문자를 이어 붙인 uint8 배열
+            lengths: 값별 바이트 수 (모두 1 이상)
+
+        Returns:
+            값별 비밀 값 여부 bool 배열
+        """
+        # 1단계: 바이트 플래그를 값 단위로 OR하여 토큰 형태, 문자 종류 수 조건 확인
+        flags = np.bitwise_or.reduceat(_BYTE_FLAGS[data], np.cumsum(lengths) - lengths)
+        secret = ((flags & _FLAG_INVALID) == 0) & (_CLASS_COUNT[flags & _FLAG_CLASSES] >= self.min_char_classes)
+        if not secret.any():
+            return secret
+
+        # 2단계: 남은 값만 (행 번호 * 알파벳 크기 + 알파벳 인덱스)로 bincount하여 행별 히스토그램 계산
+        data = data[np.repeat(secret, lengths)]
+        flags = flags[secret]
+        lengths = lengths[secret]
+        size = len(lengths)
+        columns = len(_TOKEN_ALPHABET)
+        indexed = np.repeat(np.arange(0, size * columns, columns, dtype=np.int64), lengths)
+        indexed += _BYTE_TO_INDEX[data]
+        counts = np.bincount(indexed, minlength=size * columns).reshape(size, columns)
+
+        # H = log2(L) - (1/L) * sum(c * log2(c))
+        c_log_c = _c_log_c_table(self.max_length)[counts].sum(axis=1)
+        entropies = np.log2(lengths) - c_log_c / lengths
+        thresholds = np.where(flags & _FLAG_NON_HEX, self.threshold, self.hex_threshold)
+        secret[secret] = entropies >= thresholds
+        return secret
+
+    def detect_batch(self, values: Sequence[str]) -> List[bool]:
+        """
+        여러 값을 한 번에 판정
+
+        NumPy가 있으면 최소 길이를 넘는 값의 앞 max_length 문자를 패딩 없이 하나의 바이트 배열로
+        이어 붙이고, 캐시에 들어가는 크기의 블록마다 바이트 플래그 OR(reduceat)로 토큰 형태와
+        문자 종류를 걸러낸 뒤 남은 값만 bincount 한 번으로 히스토그램과 엔트로피를 구합니다.
+        바이트 단위 조회는 uint8 테이블을 사용하고, 값마다 실행되는 Python 코드는 길이 계산과
+        슬라이싱뿐입니다.
+
+        Returns:
+            값별 비밀 값 여부 리스트
+        """
+        if np is None:
+            return [self.is_secret(value) for value in values]
+        if not values:
+            return []
+
+        count = len(values)
+        try:
+            full_lengths = np.fromiter(map(len, values), dtype=np.int64, count=count)
+            long_rows = full_lengths >= max(self.min_length, 1)
+            prefixes = list(map(itemgetter(slice(0, self.max_length)), compress(values, long_rows.tolist())))
+            data, lengths = _concat_ascii(prefixes)
+        except TypeError:
+            # 문자열이 아닌 값은 빈 값으로 취급 (최소 길이 조건에서 제외됨)
+            return self.detect_batch([value if isinstance(value, str) else '' for value in values])
+
+        rows = np.flatnonzero(long_rows)
+        secret = np.zeros(len(rows), dtype=bool)
+        ends = np.cumsum(lengths)
+        for start in range(0, len(rows), _BLOCK_ROWS):
+            stop = min(start + _BLOCK_ROWS, len(rows))
+            block = data[ends[start] - lengths[start]:ends[stop - 1]]
+            secret[start:stop] = self._detect_block(block, lengths[start:stop])
+
+        # 폭을 넘는 값은 잘린 부분의 토큰 형태 여부를 따로 확인 (드묾)
+        for position in np.flatnonzero(secret & (full_lengths[rows] > self.max_length)).tolist():
+            secret[position] = _TOKEN_RE.match(values[rows[position]]) is not None
+
+        result = np.zeros(count, dtype=bool)
+        result[rows] = secret
+        return result.tolist()
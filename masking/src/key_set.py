@@ -0,0 +1,71 @@
+"""
+정확 일치 키 집합 모듈
+
+LLM이 탐지한 키 경로는 정규식이 아니라 정확한 키 이름이므로,
+정규식 리스트 대신 해시 집합에 보관하여 집합 크기와 무관하게 O(1)로 조회합니다.
+"""
+
+from typing import Iterable, Optional, Set
+
+
+class ExactKeySet:
+    """
+    대소문자를 구분하지 않는 해시 기반 키 집합
+
+    suffix_match가 켜져 있으면 ``app.jwt.secret``처럼 키의 점(.) 경계 접미사가 집합에
+    있는 경우에도 일치로 판정합니다. 접미사마다 해시 조회 한 번이므로 비용은 키 깊이에만
+    비례하고 집합 크기와는 무관합니다.
+    """
+
+    def __init__(self, keys: Iterable[str] = (), suffix_match: bool = False):
+        """
+        Args:
+            keys: 초기 키 목록
+            suffix_match: 점 경계 접미사 일치 허용 여부
+        """
+        self.suffix_match = suffix_match
+        self._keys: Set[str] = set()
+        self.add(keys)
+
+    def add(self, keys: Iterable[str]) -> int:
+        """
+        키 추가 (중복은 무시)
+
+        Returns:
+            새로 추가된 키 수
+        """
+        before = len(self._keys)
+        for key in keys:
+            if isinstance(key, str) and key.strip():
+                self._keys.add(key.strip().casefold())
+        return len(self._keys) - before
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return self.match(key) is not None
+
+    def match(self, key: str) -> Optional[str]:
+        """
+        키와 일치하는 집합 항목 반환
+
+        Returns:
+            일치한 항목 (casefold된 키 또는 접미사), 없으면 None
+        """
+        normalized = key.casefold()
+        if normalized in self._keys:
+            return normalized
+
+        if self.suffix_match:
+            index = normalized.find('.')
+            while index != -1:
+                suffix = normalized[index + 1:]
+                if suffix in self._keys:
+                    return suffix
+                index = normalized.find('.', index + 1)
+
+        return None
@@ -4,11 +4,61 @@
 YAML, Properties, ENV 파일의 민감 정보를 마스킹 처리합니다.
 """
 
+import copy
+import hashlib
+import io
+import itertools
+import json
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import sqlite3
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Container, Dict, Iterable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, field
 import yaml
 
+from .entropy import EntropyDetector
+from .key_set import ExactKeySet
+from .prefilter import build_key_prefilter
+from .regex_backend import DEFAULT_MAX_VALUE_LENGTH, ReBackend, create_regex_backend
+from .secret_rules import RULE_PACK_VERSION, SecretScanner, load_rule_pack
+from .verdict_store import VerdictStore, compute_ruleset_hash
+
+
+class MaskedItem:
+    """
+    마스킹된 항목 레코드
+    
+    대량으로 생성되므로 ``__slots__``로 인스턴스 딕셔너리를 없애고,
+    반복되는 키와 유형 문자열은 intern하여 공유합니다.
+    딕셔너리 변환은 직렬화 시점에만 수행합니다.
+    """
+    __slots__ = ('line', 'key', 'original_value', 'type')
+    
+    def __init__(self, line: int, key: str, original_value: str, type: str):
+        self.line = line
+        self.key = sys.intern(key)
+        self.original_value = original_value
+        self.type = sys.intern(type)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화용 딕셔너리로 변환"""
+        return {
+            'line': self.line,
+            'key': self.key,
+            'original_value': self.original_value,
+            'type': self.type
+        }
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MaskedItem):
+            return NotImplemented
+        return (self.line, self.key, self.original_value, self.type) == \
+            (other.line, other.key, other.original_value, other.type)
+    
+    def __repr__(self) -> str:
+        return f"MaskedItem(line={self.line}, key={self.key!r}, type={self.type!r})"
+
 
 @dataclass
 class MaskingResult:
@@ -16,7 +66,7 @@ class MaskingResult:
     file_path: str
     original_content: str
     masked_content: str
-    masked_items: List[Dict[str, Any]] = field(default_factory=list)
+    masked_items: List[MaskedItem] = field(default_factory=list)
     error: Optional[str] = None
     
     @property
@@ -28,6 +78,46 @@ class MaskingResult:
         return len(self.masked_items)
 
 
+# 다른 패턴과 하나의 alternation으로 합칠 수 없는 패턴 (역참조 사용)
+_BACKREFERENCE_RE = re.compile(r'\\[1-9]|\(\?P=')
+
+
+def _compile_alternation(
+    patterns: List[str], prefix: str, flags: int = 0
+) -> Tuple[Optional[re.Pattern], Dict[str, str], List[Tuple[str, re.Pattern]]]:
+    """
+    패턴 리스트를 named group 기반의 단일 alternation 정규식으로 컴파일
+
+    각 패턴은 ``(?P<{prefix}{index}>...)`` 그룹으로 감싸지므로 ``lastgroup``으로
+    어떤 규칙이 매칭되었는지 알 수 있습니다. 역참조를 쓰거나 그룹으로 감쌀 수 없는
+    패턴은 개별 컴파일하여 fallback 리스트로 반환합니다.
+
+    Returns:
+        Tuple[결합 정규식(없으면 None), 그룹명 -> 원본 패턴, fallback (패턴, 정규식) 리스트]
+    """
+    groups: Dict[str, str] = {}
+    parts: List[str] = []
+    fallback: List[Tuple[str, re.Pattern]] = []
+
+    for index, pattern in enumerate(patterns):
+        compiled = re.compile(pattern, flags)
+        name = f"{prefix}{index}"
+        wrapped = f"(?P<{name}>{pattern})"
+        if _BACKREFERENCE_RE.search(pattern):
+            fallback.append((pattern, compiled))
+            continue
+        try:
+            re.compile(wrapped, flags)
+        except re.error:
+            fallback.append((pattern, compiled))
+            continue
+        groups[name] = pattern
+        parts.append(wrapped)
+
+    combined = re.compile('|'.join(parts), flags) if parts else None
+    return combined, groups, fallback
+
+
 class SensitivePatternMatcher:
     """민감 정보 패턴 매칭 클래스"""
     
@@ -36,26 +126,208 @@ class SensitivePatternMatcher:
         key_patterns: List[str],
         value_patterns: List[str] = None,
         exclude_key_patterns: List[str] = None,
-        exclude_value_patterns: List[str] = None
+        exclude_value_patterns: List[str] = None,
+        key_cache_size: int = 4096,
+        regex_backend: Optional[ReBackend] = None,
+        exact_key_suffix_match: bool = True,
+        entropy_detector: Optional[EntropyDetector] = None,
+        secret_scanner: Optional[SecretScanner] = None
     ):
+        """
+        Args:
+            key_patterns: 민감 키 정규식 리스트
+            value_patterns: 민감 값 정규식 리스트
+            exclude_key_patterns: 제외할 키 정규식 리스트
+            exclude_value_patterns: 제외할 값 정규식 리스트
+            key_cache_size: 키 판정 LRU 캐시 크기 (0이면 캐시 사용 안 함)
+            regex_backend: 값 패턴용 정규식 백엔드 (기본값: 길이 상한이 있는 re)
+            exact_key_suffix_match: 정확 일치 키 집합에서 점(.) 경계 접미사 일치 허용 여부
+            entropy_detector: 값 패턴에 걸리지 않은 고엔트로피 값 탐지기 (선택)
+            secret_scanner: 알려진 비밀 값 형식 스캐너 (값과 원본 라인 검사, 선택)
+        """
+        self.regex_backend = regex_backend or ReBackend()
         self.key_patterns = [re.compile(p, re.IGNORECASE) for p in key_patterns]
-        self.value_patterns = [re.compile(p) for p in (value_patterns or [])]
+        self.value_patterns = [self.regex_backend.compile(p) for p in (value_patterns or [])]
         self.exclude_key_patterns = [re.compile(p, re.IGNORECASE) for p in (exclude_key_patterns or [])]
-        self.exclude_value_patterns = [re.compile(p) for p in (exclude_value_patterns or [])]
+        self.exclude_value_patterns = [self.regex_backend.compile(p) for p in (exclude_value_patterns or [])]
+        self.entropy_detector = entropy_detector
+        self.secret_scanner = secret_scanner
+        
+        # 키 -> 판정 결과 LRU 캐시 (여러 파일/프로필에서 반복되는 키 재평가 방지)
+        self.key_cache_size = max(0, key_cache_size)
+        self._key_cache: 'OrderedDict[str, Tuple[bool, Optional[str]]]' = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # 실행 간 재사용되는 영구 키 판정 캐시 (VerdictStore, 선택)
+        self.verdict_store: Optional[VerdictStore] = None
+        
+        # LLM이 탐지한 정확 일치 키 집합 (정규식 규칙/캐시와 별도로 관리)
+        self.exact_keys = ExactKeySet(suffix_match=exact_key_suffix_match)
+        
+        self._compile_key_rules()
     
-    def is_sensitive_key(self, key: str) -> bool:
-        """키가 민감한 정보를 나타내는지 확인"""
+    def _compile_key_rules(self):
+        """키 패턴/제외 패턴을 각각 하나의 alternation 정규식으로 컴파일"""
+        self._key_regex, self._key_groups, self._key_fallback = _compile_alternation(
+            [p.pattern for p in self.key_patterns], 'k', re.IGNORECASE
+        )
+        self._exclude_key_regex, self._exclude_key_groups, self._exclude_key_fallback = _compile_alternation(
+            [p.pattern for p in self.exclude_key_patterns], 'x', re.IGNORECASE
+        )
+        # 필수 리터럴 기반 사전 필터 (추출 불가능한 패턴이 있으면 None)
+        self._key_prefilter = build_key_prefilter(p.pattern for p in self.key_patterns)
+        # 규칙이 바뀌면 이전 판정은 더 이상 유효하지 않음
+        self._key_cache.clear()
+        if self.verdict_store is not None and self.verdict_store.ruleset_hash != self.ruleset_hash():
+            # 다른 규칙 집합의 영구 캐시는 더 이상 조회하지 않음
+            self.verdict_store = None
+    
+    def ruleset_hash(self) -> str:
+        """현재 키 판정 규칙 집합의 해시 (영구 캐시 무효화 기준)"""
+        return compute_ruleset_hash(
+            [p.pattern for p in self.key_patterns],
+            [p.pattern for p in self.exclude_key_patterns]
+        )
+    
+    def add_key_patterns(self, patterns: List[str]) -> int:
+        """
+        민감 키 패턴을 추가하고 결합 정규식을 다시 컴파일합니다.
+        
+        Args:
+            patterns: 추가할 정규식 패턴 리스트 (유효하지 않은 정규식은 무시)
+            
+        Returns:
+            실제로 추가된 패턴 수
+        """
+        added = 0
+        for pattern in patterns:
+            try:
+                self.key_patterns.append(re.compile(pattern, re.IGNORECASE))
+                added += 1
+            except re.error:
+                # 유효하지 않은 정규식은 무시
+                pass
+        if added:
+            self._compile_key_rules()
+        return added
+    
+    @staticmethod
+    def _search_rules(
+        key: str,
+        regex: Optional[re.Pattern],
+        groups: Dict[str, str],
+        fallback: List[Tuple[str, re.Pattern]]
+    ) -> Optional[str]:
+        """결합 정규식(+fallback)으로 검색하여 매칭된 원본 패턴을 반환"""
+        if regex is not None:
+            match = regex.search(key)
+            if match:
+                return groups[match.lastgroup]
+        for pattern, compiled in fallback:
+            if compiled.search(key):
+                return pattern
+        return None
+    
+    def match_key(self, key: str) -> Tuple[bool, Optional[str]]:
+        """
+        키를 분류하고 판정에 사용된 규칙을 함께 반환합니다.
+        
+        정규식 규칙으로 민감하지 않다고 판정된 키는 LLM이 탐지한 정확 일치 키 집합에서
+        한 번 더 조회합니다. 제외 패턴에 해당하는 키는 집합에 있어도 민감하지 않습니다.
+        
+        Returns:
+            Tuple[민감 여부, 매칭된 규칙 (제외 규칙, 민감 규칙 또는 일치한 키, 없으면 None)]
+        """
+        verdict = self._match_rule_key(key)
+        if verdict[0] or not self.exact_keys:
+            return verdict
+        
+        matched = self.exact_keys.match(key)
+        if matched is not None and not self.is_excluded_key(key):
+            return True, matched
+        return verdict
+    
+    def is_excluded_key(self, key: str) -> bool:
+        """제외 키 패턴 해당 여부"""
+        return self._search_rules(
+            key, self._exclude_key_regex, self._exclude_key_groups, self._exclude_key_fallback
+        ) is not None
+    
+    def _match_rule_key(self, key: str) -> Tuple[bool, Optional[str]]:
+        """
+        정규식 규칙으로 키를 분류합니다.
+        
+        제외 패턴 alternation과 민감 패턴 alternation을 각각 최대 한 번씩 실행하며,
+        결과는 LRU 캐시에 저장됩니다. 영구 캐시(verdict_store)가 연결되어 있으면
+        정규식 실행 전에 먼저 조회합니다.
+        """
+        if not self.key_cache_size:
+            return self._lookup_or_classify_key(key)
+        
+        cache = self._key_cache
+        verdict = cache.get(key)
+        if verdict is not None:
+            self.cache_hits += 1
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                # 다른 스레드가 그사이 제거한 경우
+                pass
+            return verdict
+        
+        self.cache_misses += 1
+        verdict = self._lookup_or_classify_key(key)
+        cache[key] = verdict
+        if len(cache) > self.key_cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                pass
+        return verdict
+    
+    def _lookup_or_classify_key(self, key: str) -> Tuple[bool, Optional[str]]:
+        """영구 캐시를 먼저 조회하고, 없으면 분류 후 저장"""
+        store = self.verdict_store
+        if store is None:
+            return self._classify_key(key)
+        
+        verdict = store.get(key)
+        if verdict is None:
+            verdict = self._classify_key(key)
+            store.put(key, verdict)
+        return verdict
+    
+    def _classify_key(self, key: str) -> Tuple[bool, Optional[str]]:
+        """캐시를 거치지 않고 키를 분류"""
+        # 필수 리터럴이 하나도 없는 키는 정규식 실행 없이 제외
+        if self._key_prefilter is not None and not self._key_prefilter.search(key.casefold()):
+            return False, None
+        
         # 제외 패턴 먼저 확인
-        for pattern in self.exclude_key_patterns:
-            if pattern.search(key):
-                return False
+        rule = self._search_rules(
+            key, self._exclude_key_regex, self._exclude_key_groups, self._exclude_key_fallback
+        )
+        if rule is not None:
+            return False, rule
         
         # 민감 정보 패턴 확인
-        for pattern in self.key_patterns:
-            if pattern.search(key):
-                return True
-        
-        return False
+        rule = self._search_rules(key, self._key_regex, self._key_groups, self._key_fallback)
+        return rule is not None, rule
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """키 판정 캐시 통계 반환"""
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'size': len(self._key_cache),
+            'max_size': self.key_cache_size,
+            'store_hits': self.verdict_store.hits if self.verdict_store is not None else 0
+        }
+    
+    def is_sensitive_key(self, key: str) -> bool:
+        """키가 민감한 정보를 나타내는지 확인"""
+        return self.match_key(key)[0]
     
     def is_sensitive_value(self, value: str) -> bool:
         """값 자체가 민감한 정보인지 확인"""
@@ -63,16 +335,57 @@ class SensitivePatternMatcher:
             return False
             
         # 제외 패턴 먼저 확인
+        if self._is_excluded_value(value):
+            return False
+        
+        # 민감 정보 값 패턴 및 알려진 비밀 값 형식 확인
+        if self._match_value_patterns(value):
+            return True
+        
+        # 고엔트로피 값 확인
+        return self.entropy_detector is not None and self.entropy_detector.is_secret(value)
+    
+    def _is_excluded_value(self, value: str) -> bool:
         for pattern in self.exclude_value_patterns:
             if pattern.match(value):
-                return False
-        
-        # 민감 정보 값 패턴 확인
+                return True
+        return False
+    
+    def _match_value_patterns(self, value: str) -> bool:
         for pattern in self.value_patterns:
             if pattern.match(value):
                 return True
+        return self.secret_scanner is not None and self.secret_scanner.search(value) is not None
+    
+    def classify_values(self, values: Iterable[str]) -> Dict[str, bool]:
+        """
+        여러 값을 한 번에 판정
         
-        return False
+        정규식 패턴은 값마다 실행하고, 패턴으로 판정되지 않은 나머지 값은 엔트로피 탐지기로
+        한 번에 일괄 판정합니다. 결과는 is_sensitive_value와 같습니다.
+        
+        Args:
+            values: 판정할 값
+            
+        Returns:
+            값 -> 민감 여부 딕셔너리
+        """
+        verdicts: Dict[str, bool] = {}
+        undecided: List[str] = []
+        for value in values:
+            if not isinstance(value, str) or self._is_excluded_value(value):
+                verdicts[value] = False
+            elif self._match_value_patterns(value):
+                verdicts[value] = True
+            else:
+                verdicts[value] = False
+                undecided.append(value)
+        
+        if self.entropy_detector is not None and undecided:
+            for value, secret in zip(undecided, self.entropy_detector.detect_batch(undecided)):
+                if secret:
+                    verdicts[value] = True
+        return verdicts
     
     def should_mask(self, key: str, value: Any) -> bool:
         """해당 키-값 쌍이 마스킹 대상인지 확인"""
@@ -86,178 +399,760 @@ class SensitivePatternMatcher:
         return self.is_sensitive_key(key) or (isinstance(value, str) and self.is_sensitive_value(value))
 
 
-class YamlMasker:
-    """YAML 파일 마스킹 처리기"""
+# PEM 블록 경계 및 본문 라인 (base64, RFC 1421 헤더)
+_PEM_BEGIN_RE = re.compile(r'-----BEGIN ([A-Z0-9 ]+)-----')
+_PEM_END_RE = re.compile(r'-----END [A-Z0-9 ]+-----')
+_PEM_BASE64_RE = re.compile(r'[A-Za-z0-9+/]+={0,2}')
+_PEM_HEADER_RE = re.compile(r'(?:Proc-Type|DEK-Info|Comment):')
+# 주석 처리된 PEM 블록의 라인 앞 주석 기호
+_PEM_COMMENT_RE = re.compile(r'\s*(#+|!|//)')
+
+
+# 단일 파일/스트리밍 마스킹에서 값을 한 번에 판정할 라인 묶음 크기
+VALUE_BATCH_LINES = 4096
+
+
+def _find_pem_begin(text: str) -> Optional[re.Match]:
+    """공개키가 아닌 PEM 블록의 BEGIN 경계 검색"""
+    for begin in _PEM_BEGIN_RE.finditer(text):
+        if 'PUBLIC KEY' not in begin.group(1):
+            return begin
+    return None
+
+
+def split_line_ending(line: str) -> Tuple[str, str]:
+    """라인을 본문과 줄바꿈 문자(\\n, \\r\\n 또는 빈 문자열)로 분리"""
+    if line.endswith('\n'):
+        if line.endswith('\r\n'):
+            return line[:-2], '\r\n'
+        return line[:-1], '\n'
+    return line, ''
+
+
+class _PemBlock:
+    """
+    진행 중인 PEM 블록 (BEGIN 이후 END 전까지)
+    
+    본문 라인은 BEGIN 라인과 같은 주석 기호(# 등)로 시작할 수 있고, BEGIN 라인보다 얕게
+    들여쓰면 안 됩니다. base64 라인은 길이가 4의 배수이고 첫 본문 라인보다 길지 않으며,
+    그보다 짧은 라인(마지막 라인) 뒤에는 END만 올 수 있습니다. END가 없는 블록 뒤의
+    일반 설정 라인을 본문으로 삼켜 지우지 않기 위한 조건입니다.
+    """
+    
+    __slots__ = ('prefix', 'line_ending', 'item', 'indent', 'comment', 'width', 'finished')
+    
+    def __init__(
+        self, body: str, begin: re.Match, prefix: Optional[str], line_ending: str, item: MaskedItem
+    ):
+        """
+        Args:
+            body: BEGIN 라인 본문
+            begin: BEGIN 경계 매치
+            prefix: BEGIN 앞부분 (마스킹 문자열 앞에 유지, 이미 출력했으면 None)
+            line_ending: BEGIN 라인 줄바꿈
+            item: 블록의 마스킹 항목
+        """
+        self.prefix = prefix
+        self.line_ending = line_ending
+        self.item = item
+        self.indent = len(body) - len(body.lstrip())
+        comment = _PEM_COMMENT_RE.match(body, 0, begin.start())
+        self.comment = comment.group(1) if comment else None
+        self.width = None
+        self.finished = False
+    
+    def accepts(self, body: str) -> bool:
+        """END가 없는 라인이 블록 본문인지 확인"""
+        text = body.lstrip()
+        if not text:
+            # RFC 1421 헤더와 본문 사이의 빈 줄
+            return self.width is None
+        if len(body) - len(text) < self.indent:
+            return False
+        if self.comment is not None and text.startswith(self.comment):
+            text = text[len(self.comment):]
+        # properties 줄 연결 문자
+        text = text.strip()
+        if text.endswith('\\'):
+            text = text[:-1].rstrip()
+        
+        if not text or _PEM_HEADER_RE.match(text):
+            return self.width is None
+        if self.finished or len(text) % 4 or not _PEM_BASE64_RE.fullmatch(text):
+            return False
+        if self.width is None:
+            self.width = len(text)
+        elif len(text) > self.width:
+            return False
+        self.finished = len(text) < self.width
+        return True
+
+
+class LineMasker:
+    """
+    라인 단위 마스커 기반 클래스
+    
+    하위 클래스는 ``_mask_line``만 구현하면 문자열 전체(mask_content)와
+    라인 스트림(mask_lines) 두 가지 방식을 모두 지원합니다.
+    
+    여러 줄에 걸친 비밀 값은 앞으로만 진행하는 한 번의 스캔으로 처리합니다.
+    마스커가 여러 줄 값(YAML 블록 스칼라, properties 줄 연결 등)의 나머지 라인을 제거하고,
+    공통 단계에서 PEM 블록(BEGIN ~ END)을 마스킹 문자열 하나로 치환합니다.
+    이전 라인으로 되돌아가지 않으며 보류하는 것은 PEM 시작 라인 하나뿐입니다.
+    """
     
     def __init__(self, matcher: SensitivePatternMatcher, mask_format: str = "***MASKED***"):
         self.matcher = matcher
         self.mask_format = mask_format
     
-    def mask_content(self, content: str) -> Tuple[str, List[Dict[str, Any]]]:
+    def _new_state(self) -> Any:
+        """파일 단위 파싱 상태 생성 (상태가 필요한 마스커만 오버라이드)"""
+        return None
+    
+    def _mask_line(
+        self, line: str, line_num: int, state: Any, matcher: SensitivePatternMatcher
+    ) -> Tuple[str, Optional[MaskedItem]]:
         """
-        YAML 콘텐츠를 마스킹 처리
+        줄바꿈 문자를 제외한 한 라인을 마스킹 처리
         
         Returns:
-            Tuple[마스킹된 콘텐츠, 마스킹된 항목 리스트]
+            Tuple[마스킹된 라인 (마스킹된 여러 줄 값의 일부라 제거할 라인은 None), 마스킹된 항목 (없으면 None)]
         """
-        masked_items = []
-        lines = content.split('\n')
-        result_lines = []
+        raise NotImplementedError
+    
+    def mask_lines(
+        self, lines: Iterable[str], matcher: SensitivePatternMatcher = None
+    ) -> Iterator[Tuple[str, Optional[MaskedItem]]]:
+        """
+        라인 스트림을 마스킹 처리 (파일 핸들 등 줄바꿈이 포함된 라인도 지원)
         
-        # YAML 파싱을 위한 현재 키 경로 추적
-        key_stack = []
-        indent_stack = [0]
+        Args:
+            lines: 라인 이터러블
+            matcher: 이번 호출에만 사용할 매처 (기본값: 생성 시 지정한 매처)
+            
+        Yields:
+            Tuple[원래 줄바꿈을 유지한 마스킹된 라인, 마스킹된 항목 (없으면 None)]
+        """
+        matcher = matcher or self.matcher
+        scanner = matcher.secret_scanner
+        state = self._new_state()
+        if getattr(matcher, 'entropy_detector', None) is not None:
+            # 엔트로피 판정을 값마다 하지 않도록 라인 묶음 단위로 값을 미리 일괄 판정
+            matcher = _BatchedValueMatcher(matcher)
+            lines = self._prime_values(lines, state, matcher)
         
-        for line_num, line in enumerate(lines, 1):
-            # 빈 줄이나 주석은 그대로 유지
-            if not line.strip() or line.strip().startswith('#'):
-                result_lines.append(line)
-                continue
+        def masked_lines():
+            for line_num, line in enumerate(lines, 1):
+                body, line_ending = split_line_ending(line)
+                masked_line, item = self._mask_line(body, line_num, state, matcher)
+                yield line_num, body, line_ending, masked_line, item
+        
+        return self._mask_blocks(masked_lines(), scanner)
+    
+    def _mask_blocks(
+        self,
+        entries: Iterable[Tuple[int, str, str, Optional[str], Optional[MaskedItem]]],
+        scanner: Optional[SecretScanner],
+        skip_secret_lines: Container[int] = ()
+    ) -> Iterator[Tuple[str, Optional[MaskedItem]]]:
+        """
+        키/값 단위로 마스킹된 라인에 PEM 블록 치환과 알려진 형식의 비밀 값 마스킹 적용
+        
+        Args:
+            entries: (라인 번호, 원본 본문, 줄바꿈, 마스킹된 라인 (제거할 라인은 None), 항목) 이터러블
+            scanner: 비밀 값 형식 스캐너 (없으면 None)
+            skip_secret_lines: 비밀 값 형식 검사를 건너뛸 라인 번호
             
-            # 현재 줄의 들여쓰기 레벨 계산
-            stripped = line.lstrip()
-            current_indent = len(line) - len(stripped)
+        Yields:
+            Tuple[원래 줄바꿈을 유지한 마스킹된 라인, 마스킹된 항목 (없으면 None)]
+        """
+        pem_block: Optional[_PemBlock] = None
+        for line_num, body, line_ending, masked_line, item in entries:
+            if masked_line is None:
+                continue
             
-            # 들여쓰기에 따라 키 스택 조정
-            while len(indent_stack) > 1 and current_indent <= indent_stack[-1]:
-                indent_stack.pop()
-                if key_stack:
-                    key_stack.pop()
+            if pem_block is not None:
+                end = _PEM_END_RE.search(body)
+                if end is None and pem_block.accepts(body):
+                    continue
+                prefix = pem_block.prefix
+                pem_item = pem_block.item
+                begin_ending = pem_block.line_ending
+                pem_block = None
+                if end is not None:
+                    # END 뒤의 내용(닫는 따옴표 등)은 유지
+                    if prefix is not None:
+                        yield prefix + self.mask_format + body[end.end():] + line_ending, pem_item
+                    continue
+                # END 없이 본문이 아닌 라인이 나오면 블록을 닫고 현재 라인은 그대로 처리
+                if prefix is not None:
+                    yield prefix + self.mask_format + begin_ending, pem_item
             
-            # 키-값 쌍 파싱
-            if ':' in stripped and not stripped.startswith('-'):
-                key_part = stripped.split(':', 1)[0].strip()
-                value_part = stripped.split(':', 1)[1].strip() if ':' in stripped else ""
-                
-                # 전체 키 경로 생성
-                full_key = '.'.join(key_stack + [key_part]) if key_stack else key_part
-                
-                # 값이 있는 경우 마스킹 여부 확인
-                if value_part and not value_part.startswith('#'):
-                    # 인용부호 제거하여 실제 값 확인
-                    actual_value = value_part.strip('"\'')
-                    
-                    if self.matcher.should_mask(full_key, actual_value):
-                        # 마스킹 처리
-                        original_value = value_part
-                        masked_line = line.replace(value_part, f'"{self.mask_format}"', 1)
-                        result_lines.append(masked_line)
-                        
-                        masked_items.append({
-                            'line': line_num,
-                            'key': full_key,
-                            'original_value': actual_value,
-                            'type': 'yaml'
-                        })
-                        continue
+            begin = _find_pem_begin(body)
+            if begin and not _PEM_END_RE.search(body, begin.end()):
+                if item is not None:
+                    # 키/값 단위로 이미 마스킹된 라인: 나머지 본문만 제거
+                    pem_block = _PemBlock(body, begin, None, line_ending, item)
+                    yield masked_line + line_ending, item
                 else:
-                    # 하위 키가 있을 수 있으므로 스택에 추가
-                    key_stack.append(key_part)
-                    indent_stack.append(current_indent)
+                    pem_block = _PemBlock(body, begin, body[:begin.start()], line_ending, MaskedItem(
+                        line=line_num,
+                        key=begin.group(1),
+                        original_value=begin.group(0),
+                        type='pem'
+                    ))
+                continue
             
-            result_lines.append(line)
+            if item is None and scanner is not None and line_num not in skip_secret_lines:
+                masked_line, item = self._mask_secrets(masked_line, line_num, scanner)
+            yield masked_line + line_ending, item
         
-        return '\n'.join(result_lines), masked_items
-
-
-class PropertiesMasker:
-    """Properties 파일 마스킹 처리기"""
+        if pem_block is not None and pem_block.prefix is not None:
+            yield pem_block.prefix + self.mask_format + pem_block.line_ending, pem_block.item
     
-    def __init__(self, matcher: SensitivePatternMatcher, mask_format: str = "***MASKED***"):
-        self.matcher = matcher
-        self.mask_format = mask_format
+    def _prime_values(
+        self, lines: Iterable[str], state: Any, matcher: '_BatchedValueMatcher'
+    ) -> Iterator[str]:
+        """
+        라인을 VALUE_BATCH_LINES개씩 미리 읽어 그 안의 값을 한 번에 판정해 둔 뒤 넘김
+        
+        묶음의 첫 라인을 넘기는 시점에는 이전 묶음 처리가 끝나 있으므로, 현재 파싱 상태의
+        복사본으로 묶음을 먼저 파싱하면 본 처리에서 판정할 값을 그대로 수집할 수 있습니다.
+        """
+        lines = iter(lines)
+        while True:
+            chunk = list(itertools.islice(lines, VALUE_BATCH_LINES))
+            if not chunk:
+                return
+            collector = _PairCollector()
+            preview = copy.deepcopy(state)
+            for line in chunk:
+                self._mask_line(split_line_ending(line)[0], 0, preview, collector)
+            matcher.prime(collector.values)
+            yield from chunk
+    
+    def _mask_secrets(
+        self, line: str, line_num: int, scanner: SecretScanner
+    ) -> Tuple[str, Optional[MaskedItem]]:
+        """
+        키/값으로 마스킹되지 않은 원본 라인에서 알려진 형식의 비밀 값 구간을 마스킹
+        
+        주석, 리스트 항목, 인라인 JSON 등 키-값 파싱으로 잡히지 않는 비밀 값을 처리합니다.
+        
+        Returns:
+            Tuple[마스킹된 라인, 첫 번째 비밀 값 항목 (없으면 None)]
+        """
+        found = scanner.find_all(line)
+        if not found:
+            return line, None
+        
+        parts = []
+        position = 0
+        for start, end, _ in found:
+            parts.append(line[position:start])
+            parts.append(self.mask_format)
+            position = end
+        parts.append(line[position:])
+        
+        start, end, rule = found[0]
+        return ''.join(parts), MaskedItem(
+            line=line_num,
+            key=rule,
+            original_value=line[start:end],
+            type='secret'
+        )
     
-    def mask_content(self, content: str) -> Tuple[str, List[Dict[str, Any]]]:
+    def mask_content(
+        self, content: str, matcher: SensitivePatternMatcher = None
+    ) -> Tuple[str, List[MaskedItem]]:
         """
-        Properties 콘텐츠를 마스킹 처리
+        콘텐츠 전체를 마스킹 처리
+        
+        Args:
+            content: 파일 내용
+            matcher: 이번 호출에만 사용할 매처 (기본값: 생성 시 지정한 매처)
         
         Returns:
             Tuple[마스킹된 콘텐츠, 마스킹된 항목 리스트]
         """
         masked_items = []
-        lines = content.split('\n')
         result_lines = []
         
-        for line_num, line in enumerate(lines, 1):
-            # 빈 줄이나 주석은 그대로 유지
-            stripped = line.strip()
-            if not stripped or stripped.startswith('#') or stripped.startswith('!'):
-                result_lines.append(line)
-                continue
+        for masked_line, item in self.mask_lines(io.StringIO(content), matcher):
+            result_lines.append(masked_line)
+            if item is not None:
+                masked_items.append(item)
+        
+        return ''.join(result_lines), masked_items
+
+
+class YamlMasker(LineMasker):
+    """YAML 파일 마스킹 처리기"""
+    
+    # 블록 스칼라 지시자 (|, >, |-, >+, |2 등)
+    _BLOCK_SCALAR_RE = re.compile(r'^[|>][-+1-9]{0,2}\s*(?:#.*)?$')
+    
+    def _new_state(self) -> Dict[str, Any]:
+        # YAML 파싱을 위한 현재 키 경로 추적
+        # block: 진행 중인 블록 스칼라 (키의 들여쓰기, 마스킹 여부), 없으면 None
+        return {'key_stack': [], 'indent_stack': [0], 'block': None}
+    
+    def _mask_line(
+        self, line: str, line_num: int, state: Dict[str, Any], matcher: SensitivePatternMatcher
+    ) -> Tuple[Optional[str], Optional[MaskedItem]]:
+        key_stack = state['key_stack']
+        indent_stack = state['indent_stack']
+        
+        # 빈 줄은 그대로 유지
+        if not line.strip():
+            return line, None
+        
+        # 현재 줄의 들여쓰기 레벨 계산
+        stripped = line.lstrip()
+        current_indent = len(line) - len(stripped)
+        
+        # 블록 스칼라 내용: 키보다 깊게 들여쓴 라인 (마스킹된 블록이면 제거, 아니면 그대로 유지)
+        if state['block'] is not None:
+            block_indent, block_masked = state['block']
+            if current_indent > block_indent:
+                return (None if block_masked else line), None
+            state['block'] = None
+        
+        # 주석은 그대로 유지
+        if stripped.startswith('#'):
+            return line, None
+        
+        # 들여쓰기에 따라 키 스택 조정
+        while len(indent_stack) > 1 and current_indent <= indent_stack[-1]:
+            indent_stack.pop()
+            if key_stack:
+                key_stack.pop()
+        
+        # 키-값 쌍 파싱
+        if ':' in stripped and not stripped.startswith('-'):
+            key_part = stripped.split(':', 1)[0].strip()
+            value_part = stripped.split(':', 1)[1].strip() if ':' in stripped else ""
             
-            # 키=값 또는 키:값 파싱
-            match = re.match(r'^([^=:]+)[=:](.*)$', line)
-            if match:
-                key = match.group(1).strip()
-                value = match.group(2).strip()
-                
-                if self.matcher.should_mask(key, value):
-                    # 마스킹 처리 (원래 구분자 유지)
-                    separator = '=' if '=' in line else ':'
-                    masked_line = f"{key}{separator}{self.mask_format}"
-                    result_lines.append(masked_line)
-                    
-                    masked_items.append({
-                        'line': line_num,
-                        'key': key,
-                        'original_value': value,
-                        'type': 'properties'
-                    })
-                    continue
+            # 전체 키 경로 생성
+            full_key = '.'.join(key_stack + [key_part]) if key_stack else key_part
             
-            result_lines.append(line)
+            # 값이 있는 경우 마스킹 여부 확인
+            if value_part and not value_part.startswith('#'):
+                # 인용부호 제거하여 실제 값 확인
+                actual_value = value_part.strip('"\'')
+                
+                is_block = self._BLOCK_SCALAR_RE.match(value_part) is not None
+                masked = matcher.should_mask(full_key, actual_value)
+                if is_block:
+                    # 다음 라인부터 키보다 깊게 들여쓴 라인은 블록 스칼라 내용
+                    state['block'] = (current_indent, masked)
+                
+                if masked:
+                    # 마스킹 처리 (블록 스칼라는 지시자를 값으로 치환하고 내용 라인은 제거)
+                    masked_line = line.replace(value_part, f'"{self.mask_format}"', 1)
+                    return masked_line, MaskedItem(
+                        line=line_num,
+                        key=full_key,
+                        original_value=actual_value,
+                        type='yaml'
+                    )
+            else:
+                # 하위 키가 있을 수 있으므로 스택에 추가
+                key_stack.append(key_part)
+                indent_stack.append(current_indent)
         
-        return '\n'.join(result_lines), masked_items
+        return line, None
 
 
-class EnvMasker:
-    """ENV 파일 마스킹 처리기"""
+class YamlTokenMasker(YamlMasker):
+    """
+    libyaml 이벤트 기반 YAML 마스킹 처리기
     
-    def __init__(self, matcher: SensitivePatternMatcher, mask_format: str = "***MASKED***"):
-        self.matcher = matcher
-        self.mask_format = mask_format
+    PyYAML C 파서(CLoader, 없으면 순수 Python 파서)의 이벤트 마크로 스칼라의 정확한 위치를
+    구하고, 마스킹이 필요한 스칼라 구간만 치환합니다. 리스트 항목, 플로우 매핑, 블록 스칼라도
+    처리하며 나머지 내용은 원본과 동일하게 유지됩니다.
+    
+    YAML 파싱에 실패하거나 스트리밍(mask_lines) 처리 시에는 라인 기반 YamlMasker로 동작합니다.
+    """
+    
+    _LOADER = getattr(yaml, 'CLoader', yaml.SafeLoader)
+    # 스칼라 앞에 붙는 앵커(&name)/태그(!tag) 속성
+    _NODE_PROPERTIES_RE = re.compile(r'(?:[&!]\S*\s+)*')
+    _NULL_VALUES = frozenset(('', '~', 'null', 'Null', 'NULL'))
+    
+    def mask_content(
+        self, content: str, matcher: SensitivePatternMatcher = None
+    ) -> Tuple[str, List[MaskedItem]]:
+        try:
+            spans, masked_items = self._find_masked_spans(content, matcher or self.matcher)
+        except yaml.YAMLError:
+            return super().mask_content(content, matcher)
+        
+        result = []
+        position = 0
+        for start, end in spans:
+            result.append(content[position:start])
+            result.append(f'"{self.mask_format}"')
+            position = end
+        result.append(content[position:])
+        masked_content = ''.join(result)
+        
+        # PEM 블록은 규칙 팩 사용 여부와 관계없이 항상 처리 (라인 모드와 같음)
+        scanner = (matcher or self.matcher).secret_scanner
+        return self._mask_remaining_secrets(masked_content, masked_items, scanner)
     
-    def mask_content(self, content: str) -> Tuple[str, List[Dict[str, Any]]]:
+    def _mask_remaining_secrets(
+        self, content: str, masked_items: List[MaskedItem], scanner: Optional[SecretScanner]
+    ) -> Tuple[str, List[MaskedItem]]:
         """
-        ENV 콘텐츠를 마스킹 처리
+        스칼라 단위로 마스킹되지 않은 라인(주석 등)의 PEM 블록과 알려진 비밀 값 마스킹
+        
+        라인 모드와 같은 PEM 블록 처리를 사용하므로 주석 처리된 개인키도 본문과 END 라인까지 제거됩니다.
+        알려진 형식의 비밀 값 구간은 scanner가 있을 때만 마스킹합니다.
+        """
+        masked_lines = {item.line for item in masked_items}
+        
+        def entries():
+            for line_num, line in enumerate(io.StringIO(content), 1):
+                body, line_ending = split_line_ending(line)
+                yield line_num, body, line_ending, body, None
+        
+        secret_items = []
+        result_lines = []
+        for line, item in self._mask_blocks(entries(), scanner, masked_lines):
+            result_lines.append(line)
+            if item is not None:
+                secret_items.append(item)
+        
+        if not secret_items:
+            return content, masked_items
+        return ''.join(result_lines), sorted(masked_items + secret_items, key=lambda item: item.line)
+    
+    def _find_masked_spans(
+        self, content: str, matcher: SensitivePatternMatcher
+    ) -> Tuple[List[Tuple[int, int]], List[MaskedItem]]:
+        """
+        파서 이벤트를 따라 키 경로를 추적하고 마스킹할 스칼라 구간을 수집
         
         Returns:
-            Tuple[마스킹된 콘텐츠, 마스킹된 항목 리스트]
+            Tuple[(시작, 끝) 문자 오프셋 리스트, 마스킹된 항목 리스트]
         """
+        spans = []
         masked_items = []
-        lines = content.split('\n')
-        result_lines = []
+        # 컨테이너 스택: [경로, 매핑 여부, 다음 이벤트가 키인지, 현재 키 또는 시퀀스 인덱스]
+        stack: List[list] = []
         
-        for line_num, line in enumerate(lines, 1):
-            # 빈 줄이나 주석은 그대로 유지
-            stripped = line.strip()
-            if not stripped or stripped.startswith('#'):
-                result_lines.append(line)
-                continue
-            
-            # KEY=VALUE 파싱
-            match = re.match(r'^(export\s+)?([A-Za-z_][A-Za-z0-9_]*)=(.*)$', line)
-            if match:
-                export_prefix = match.group(1) or ''
-                key = match.group(2)
-                value = match.group(3).strip('"\'')
-                
-                if self.matcher.should_mask(key, value):
-                    # 마스킹 처리
-                    masked_line = f'{export_prefix}{key}="{self.mask_format}"'
-                    result_lines.append(masked_line)
-                    
-                    masked_items.append({
-                        'line': line_num,
-                        'key': key,
-                        'original_value': value,
-                        'type': 'env'
-                    })
+        def child_path() -> str:
+            path, is_mapping, _, current = stack[-1]
+            segment = str(current) if is_mapping else f"[{current}]"
+            if not path:
+                return segment
+            return f"{path}{segment}" if segment.startswith('[') else f"{path}.{segment}"
+        
+        def value_done():
+            if not stack:
+                return
+            top = stack[-1]
+            if top[1]:
+                top[2] = True
+            else:
+                top[3] += 1
+        
+        events = list(yaml.parse(content, Loader=self._LOADER))
+        if getattr(matcher, 'entropy_detector', None) is not None:
+            # 스칼라 값을 한 번에 판정해 두고 이벤트 처리 중에는 조회만 함
+            matcher = _BatchedValueMatcher(matcher)
+            matcher.prime({event.value for event in events if isinstance(event, yaml.ScalarEvent)})
+        
+        for event in events:
+            if isinstance(event, yaml.DocumentStartEvent):
+                stack = []
+            elif isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                is_mapping = isinstance(event, yaml.MappingStartEvent)
+                if stack and stack[-1][1] and stack[-1][2]:
+                    # 복합 키 (매핑/시퀀스가 키로 사용된 경우)
+                    stack[-1][3] = '?'
+                    stack[-1][2] = False
+                path = child_path() if stack else ''
+                stack.append([path, is_mapping, True, None if is_mapping else 0])
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                stack.pop()
+                value_done()
+            elif isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+                if stack and stack[-1][1] and stack[-1][2]:
+                    # 매핑의 키
+                    stack[-1][3] = event.value if isinstance(event, yaml.ScalarEvent) else f"*{event.anchor}"
+                    stack[-1][2] = False
                     continue
+                
+                if isinstance(event, yaml.ScalarEvent) and stack:
+                    span = self._check_scalar(event, child_path(), content, masked_items, matcher)
+                    if span:
+                        spans.append(span)
+                value_done()
+        
+        return spans, masked_items
+    
+    def _check_scalar(
+        self,
+        event: yaml.ScalarEvent,
+        full_key: str,
+        content: str,
+        masked_items: List[MaskedItem],
+        matcher: SensitivePatternMatcher
+    ) -> Optional[Tuple[int, int]]:
+        """값 스칼라가 마스킹 대상이면 치환할 구간을 반환"""
+        if not event.style and event.value in self._NULL_VALUES:
+            return None
+        # 라인 모드와 마찬가지로 PEM 블록(개인키, 인증서 등)을 담은 스칼라는 키와 관계없이 마스킹
+        if not matcher.should_mask(full_key, event.value) and not _find_pem_begin(event.value):
+            return None
+        
+        start = event.start_mark.index
+        end = event.end_mark.index
+        # 앵커/태그는 유지하고 값 부분만 치환
+        start = self._NODE_PROPERTIES_RE.match(content, start).end()
+        # 블록 스칼라 뒤에 포함된 빈 줄/줄바꿈은 유지
+        end = start + len(content[start:end].rstrip())
+        
+        masked_items.append(MaskedItem(
+            line=event.start_mark.line + 1,
+            key=full_key,
+            original_value=event.value,
+            type='yaml'
+        ))
+        return start, end
+
+
+class PropertiesMasker(LineMasker):
+    """Properties 파일 마스킹 처리기"""
+    
+    def _new_state(self) -> Dict[str, bool]:
+        # continued: 이전 라인이 역슬래시로 끝나 현재 라인이 값의 연속인지
+        # dropping: 연속 라인이 마스킹된 값의 일부라 제거해야 하는지
+        return {'continued': False, 'dropping': False}
+    
+    @staticmethod
+    def _has_continuation(line: str) -> bool:
+        """라인이 홀수 개의 역슬래시로 끝나 다음 라인으로 이어지는지 확인"""
+        body = line.rstrip()
+        return (len(body) - len(body.rstrip('\\'))) % 2 == 1
+    
+    def _mask_line(
+        self, line: str, line_num: int, state: Dict[str, bool], matcher: SensitivePatternMatcher
+    ) -> Tuple[Optional[str], Optional[MaskedItem]]:
+        # 이전 라인에서 이어지는 값 (키로 해석하지 않음)
+        if state['continued']:
+            state['continued'] = self._has_continuation(line)
+            return (None if state['dropping'] else line), None
+        
+        # 빈 줄이나 주석은 그대로 유지
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#') or stripped.startswith('!'):
+            return line, None
+        
+        continued = self._has_continuation(line)
+        state['continued'] = continued
+        state['dropping'] = False
+        
+        # 키=값 또는 키:값 파싱
+        match = re.match(r'^([^=:]+)[=:](.*)$', line)
+        if match:
+            key = match.group(1).strip()
+            value = match.group(2).strip()
+            if continued:
+                value = value[:-1].rstrip()
             
-            result_lines.append(line)
+            if matcher.should_mask(key, value):
+                # 마스킹 처리 (원래 구분자 유지, 이어지는 라인은 제거)
+                state['dropping'] = continued
+                separator = '=' if '=' in line else ':'
+                masked_line = f"{key}{separator}{self.mask_format}"
+                return masked_line, MaskedItem(
+                    line=line_num,
+                    key=key,
+                    original_value=value,
+                    type='properties'
+                )
         
-        return '\n'.join(result_lines), masked_items
+        return line, None
+
+
+class EnvMasker(LineMasker):
+    """ENV 파일 마스킹 처리기"""
+    
+    def _new_state(self) -> Dict[str, Any]:
+        # quote: 여러 줄 인용 값의 닫는 따옴표 (진행 중이 아니면 None)
+        # dropping: 인용 값이 마스킹되어 나머지 라인을 제거해야 하는지
+        return {'quote': None, 'dropping': False}
+    
+    def _mask_line(
+        self, line: str, line_num: int, state: Dict[str, Any], matcher: SensitivePatternMatcher
+    ) -> Tuple[Optional[str], Optional[MaskedItem]]:
+        # 여러 줄 인용 값의 나머지 라인 (닫는 따옴표가 나올 때까지 KEY=VALUE로 해석하지 않음)
+        if state['quote'] is not None:
+            if state['quote'] in line:
+                state['quote'] = None
+            return (None if state['dropping'] else line), None
+        
+        # 빈 줄이나 주석은 그대로 유지
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            return line, None
+        
+        # KEY=VALUE 파싱
+        match = re.match(r'^(export\s+)?([A-Za-z_][A-Za-z0-9_]*)=(.*)$', line)
+        if match:
+            export_prefix = match.group(1) or ''
+            key = match.group(2)
+            raw_value = match.group(3).strip()
+            value = raw_value.strip('"\'')
+            
+            # 닫히지 않은 따옴표로 시작하면 다음 라인으로 이어지는 값
+            quote = raw_value[:1] if raw_value[:1] in ('"', "'") else None
+            if quote is not None and quote not in raw_value[1:]:
+                state['quote'] = quote
+                state['dropping'] = False
+            
+            if matcher.should_mask(key, value):
+                # 마스킹 처리 (여러 줄 값이면 나머지 라인은 제거)
+                state['dropping'] = state['quote'] is not None
+                masked_line = f'{export_prefix}{key}="{self.mask_format}"'
+                return masked_line, MaskedItem(
+                    line=line_num,
+                    key=key,
+                    original_value=value,
+                    type='env'
+                )
+        
+        return line, None
+
+
+class _PairCollector:
+    """
+    일괄 처리 1단계용 매처
+    
+    마스킹 판정 없이 마스커가 추출한 키/값을 수집만 합니다.
+    """
+    
+    secret_scanner = None
+    
+    def __init__(self):
+        self.keys: set = set()
+        self.values: set = set()
+    
+    def should_mask(self, key: str, value: Any) -> bool:
+        if value is None or value == "":
+            return False
+        self.keys.add(key)
+        if isinstance(value, str):
+            self.values.add(value)
+        return False
+
+
+class _VerdictTable:
+    """
+    일괄 처리 2단계에서 미리 계산한 판정 결과를 조회하는 매처
+    
+    should_mask 로직은 SensitivePatternMatcher와 동일하며, 키/값 판정만 테이블에서 조회합니다.
+    """
+    
+    should_mask = SensitivePatternMatcher.should_mask
+    
+    def __init__(
+        self,
+        key_verdicts: Dict[str, bool],
+        value_verdicts: Dict[str, bool],
+        secret_scanner: Optional[SecretScanner] = None
+    ):
+        self.key_verdicts = key_verdicts
+        self.value_verdicts = value_verdicts
+        self.secret_scanner = secret_scanner
+    
+    def is_sensitive_key(self, key: str) -> bool:
+        return self.key_verdicts[key]
+    
+    def is_sensitive_value(self, value: str) -> bool:
+        return self.value_verdicts[value]
+
+
+class KeyOverlayMatcher:
+    """
+    기본 매처 위에 파일 단위 정확 일치 키 집합을 덧씌운 매처
+    
+    파일마다 LLM이 탐지한 키를 기본 매처에 추가하지 않고 이 오버레이로 전달하므로,
+    기본 매처는 변경되지 않고 다른 파일로 키가 새어 나가지 않습니다.
+    파일당 비용은 키 집합 생성뿐이며 여러 작업자가 같은 기본 매처를 공유할 수 있습니다.
+    """
+    
+    should_mask = SensitivePatternMatcher.should_mask
+    
+    def __init__(self, base, keys: ExactKeySet, is_excluded_key: Callable[[str], bool]):
+        """
+        Args:
+            base: 기본 매처 (SensitivePatternMatcher 또는 판정 테이블)
+            keys: 파일 단위 정확 일치 키 집합
+            is_excluded_key: 제외 키 패턴 판정 함수
+        """
+        self.base = base
+        self.keys = keys
+        self.is_excluded_key = is_excluded_key
+    
+    @property
+    def secret_scanner(self) -> Optional[SecretScanner]:
+        return self.base.secret_scanner
+    
+    @property
+    def entropy_detector(self) -> Optional[EntropyDetector]:
+        return getattr(self.base, 'entropy_detector', None)
+    
+    def is_sensitive_key(self, key: str) -> bool:
+        if self.base.is_sensitive_key(key):
+            return True
+        return self.keys.match(key) is not None and not self.is_excluded_key(key)
+    
+    def is_sensitive_value(self, value: str) -> bool:
+        return self.base.is_sensitive_value(value)
+    
+    def classify_values(self, values: Iterable[str]) -> Dict[str, bool]:
+        return self.base.classify_values(values)
+
+
+class _BatchedValueMatcher:
+    """
+    값 판정을 미리 일괄 계산해 두고 조회하는 매처 (단일 파일/스트리밍 마스킹용)
+    
+    마스커가 prime()으로 곧 만날 값을 넘기면 기본 매처의 classify_values로 한 번에 판정하므로,
+    엔트로피 탐지기가 값마다 is_secret을 실행하지 않고 detect_batch로 처리됩니다.
+    미리 판정하지 않은 값은 기본 매처로 판정합니다.
+    """
+    
+    should_mask = SensitivePatternMatcher.should_mask
+    
+    def __init__(self, base):
+        """
+        Args:
+            base: 기본 매처 (SensitivePatternMatcher 또는 KeyOverlayMatcher)
+        """
+        self.base = base
+        self.value_verdicts: Dict[str, bool] = {}
+    
+    @property
+    def secret_scanner(self) -> Optional[SecretScanner]:
+        return self.base.secret_scanner
+    
+    def prime(self, values: Iterable[str]):
+        """다음에 판정할 값들을 한 번에 판정 (이전 판정 결과는 버림)"""
+        self.value_verdicts = self.base.classify_values(values)
+    
+    def is_sensitive_key(self, key: str) -> bool:
+        return self.base.is_sensitive_key(key)
+    
+    def is_sensitive_value(self, value: str) -> bool:
+        verdict = self.value_verdicts.get(value)
+        if verdict is None:
+            return self.base.is_sensitive_value(value)
+        return verdict
 
 
 class MaskingEngine:
@@ -276,40 +1171,168 @@ class MaskingEngine:
         self.mask_format = config.get('mask_format', '***MASKED***')
         
         # 패턴 매처 초기화
+        matcher_config = config.get('matcher', {})
         self.matcher = SensitivePatternMatcher(
             key_patterns=config.get('sensitive_key_patterns', []),
             value_patterns=config.get('sensitive_value_patterns', []),
             exclude_key_patterns=config.get('exclude_key_patterns', []),
-            exclude_value_patterns=config.get('exclude_value_patterns', [])
+            exclude_value_patterns=config.get('exclude_value_patterns', []),
+            key_cache_size=matcher_config.get('key_cache_size', 4096),
+            regex_backend=create_regex_backend(
+                matcher_config.get('regex_backend', 're'),
+                matcher_config.get('max_value_length', DEFAULT_MAX_VALUE_LENGTH)
+            ),
+            exact_key_suffix_match=config.get('llm', {}).get('key_match', 'suffix') == 'suffix',
+            entropy_detector=self._create_entropy_detector(matcher_config.get('entropy', {}))
         )
         
-        # 파일 유형별 마스커 초기화
-        self.yaml_masker = YamlMasker(self.matcher, self.mask_format)
+        # 영구 키 판정 캐시 (실행 간 재사용)
+        # 캐시 파일을 만들 수 없는 환경(쓰기 불가 HOME 등)에서는 캐시 없이 진행하고 오류만 기록
+        self.verdict_store = None
+        self.verdict_store_error: Optional[str] = None
+        store_config = matcher_config.get('verdict_cache', {})
+        if store_config.get('enabled', False):
+            try:
+                self.verdict_store = VerdictStore(
+                    store_config.get('path', '~/.cache/masking/verdicts.sqlite'),
+                    self.matcher.ruleset_hash(),
+                    store_config.get('max_entries', 200000)
+                )
+            except (OSError, sqlite3.Error) as e:
+                self.verdict_store_error = str(e)
+            self.matcher.verdict_store = self.verdict_store
+        
+        # 내장 비밀 값 형식 규칙 팩 (첫 마스킹 시 로드)
+        self._secret_rules_config = matcher_config.get('secret_rules', {})
+        self._secret_rules_loaded = False
+        
+        # 파일 유형별 마스커 초기화 (yaml_mode: line=라인 기반, token=파서 이벤트 기반)
+        yaml_masker_class = YamlTokenMasker if config.get('yaml_mode', 'line') == 'token' else YamlMasker
+        self.yaml_masker = yaml_masker_class(self.matcher, self.mask_format)
         self.properties_masker = PropertiesMasker(self.matcher, self.mask_format)
         self.env_masker = EnvMasker(self.matcher, self.mask_format)
     
-    def mask_file(self, file_path: str, content: str) -> MaskingResult:
+    @staticmethod
+    def _create_entropy_detector(entropy_config: Dict[str, Any]) -> Optional[EntropyDetector]:
+        """설정에 따라 엔트로피 탐지기 생성 (비활성화 시 None)"""
+        if not entropy_config.get('enabled', False):
+            return None
+        return EntropyDetector(
+            threshold=entropy_config.get('threshold', 4.0),
+            hex_threshold=entropy_config.get('hex_threshold', 3.0),
+            min_length=entropy_config.get('min_length', 20),
+            max_length=entropy_config.get('max_length', 64),
+            min_char_classes=entropy_config.get('min_char_classes', 2)
+        )
+    
+    def _ensure_secret_rules(self):
+        """
+        내장 비밀 값 형식 규칙 팩을 처음 마스킹할 때 한 번만 컴파일하여 매처에 연결
+        
+        내장 규칙은 선형 시간 패턴이므로 사용자 값 패턴의 백엔드(max_value_length 상한)가 아닌
+        상한 없는 백엔드로 컴파일합니다.
+        """
+        if self._secret_rules_loaded:
+            return
+        self._secret_rules_loaded = True
+        if self._secret_rules_config.get('enabled', False):
+            self.matcher.secret_scanner = load_rule_pack(
+                disabled_rules=self._secret_rules_config.get('disabled_rules', [])
+            )
+    
+    @property
+    def secret_scanner(self) -> Optional[SecretScanner]:
+        """내장 비밀 값 형식 스캐너 (비활성화 시 None)"""
+        self._ensure_secret_rules()
+        return self.matcher.secret_scanner
+    
+    def fingerprint(self) -> str:
+        """
+        마스킹 결과에 영향을 주는 설정의 지문
+        
+        캐시 크기나 영구 캐시 위치처럼 결과와 무관한 설정은 제외합니다. 증분 스캔 인덱스가
+        설정이 바뀐 뒤 이전 실행의 판정을 재사용하지 않도록 하는 데 사용합니다.
+        
+        Returns:
+            SHA-256 16진수 문자열
+        """
+        matcher_config = {
+            name: value for name, value in self.config.get('matcher', {}).items()
+            if name not in ('key_cache_size', 'verdict_cache')
+        }
+        payload = json.dumps({
+            'sensitive_key_patterns': self.config.get('sensitive_key_patterns', []),
+            'sensitive_value_patterns': self.config.get('sensitive_value_patterns', []),
+            'exclude_key_patterns': self.config.get('exclude_key_patterns', []),
+            'exclude_value_patterns': self.config.get('exclude_value_patterns', []),
+            'matcher': matcher_config,
+            'mask_format': self.mask_format,
+            'yaml_mode': self.config.get('yaml_mode', 'line'),
+            'llm_key_match': self.config.get('llm', {}).get('key_match', 'suffix'),
+            'secret_rules_version': RULE_PACK_VERSION,
+        }, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def masker_kind(self, file_path: str) -> str:
+        """
+        파일에 적용될 마스커 종류
+        
+        같은 내용이라도 마스커(형식)가 다르면 결과가 다르므로, 내용 해시로 마스킹 결과를
+        재사용할 때 해시와 함께 키로 사용합니다.
+        """
+        return type(self._select_masker(file_path)).__name__
+    
+    def _select_masker(self, file_path: str) -> LineMasker:
+        """파일 유형에 따라 적절한 마스커 선택"""
+        if file_path.endswith(('.yml', '.yaml')):
+            return self.yaml_masker
+        elif file_path.endswith('.properties'):
+            return self.properties_masker
+        elif file_path.endswith('.env') or '.env' in file_path:
+            return self.env_masker
+        # 기본적으로 properties 형식으로 처리
+        return self.properties_masker
+    
+    def overlay(self, keys: Iterable[str], base=None) -> KeyOverlayMatcher:
+        """
+        파일 단위 민감 키(LLM 탐지 결과 등)를 덧씌운 매처 생성
+        
+        Args:
+            keys: 해당 파일에서만 민감 키로 취급할 키 경로
+            base: 기본 매처 (기본값: 엔진의 매처)
+        """
+        return KeyOverlayMatcher(
+            base or self.matcher,
+            ExactKeySet(keys, suffix_match=self.matcher.exact_keys.suffix_match),
+            self.matcher.is_excluded_key
+        )
+    
+    def mask_file(
+        self,
+        file_path: str,
+        content: str,
+        matcher: SensitivePatternMatcher = None,
+        extra_keys: Optional[Iterable[str]] = None
+    ) -> MaskingResult:
         """
         파일 내용을 마스킹 처리
         
         Args:
             file_path: 파일 경로
             content: 파일 내용
+            matcher: 이번 파일에만 사용할 매처 (기본값: 엔진의 매처)
+            extra_keys: 이번 파일에서만 민감 키로 취급할 키 경로 (LLM 탐지 결과 등)
             
         Returns:
             MaskingResult 객체
         """
+        self._ensure_secret_rules()
+        if extra_keys:
+            matcher = self.overlay(extra_keys, matcher)
+        
         try:
-            # 파일 유형에 따라 적절한 마스커 선택
-            if file_path.endswith(('.yml', '.yaml')):
-                masked_content, masked_items = self.yaml_masker.mask_content(content)
-            elif file_path.endswith('.properties'):
-                masked_content, masked_items = self.properties_masker.mask_content(content)
-            elif file_path.endswith('.env') or '.env' in file_path:
-                masked_content, masked_items = self.env_masker.mask_content(content)
-            else:
-                # 기본적으로 properties 형식으로 처리
-                masked_content, masked_items = self.properties_masker.mask_content(content)
+            masked_content, masked_items = self._select_masker(file_path).mask_content(content, matcher)
+            self._count_secret_hits(masked_items, matcher or self.matcher)
             
             return MaskingResult(
                 file_path=file_path,
@@ -326,12 +1349,133 @@ class MaskingEngine:
                 error=str(e)
             )
     
+    def mask_many(
+        self,
+        files: Iterable[Tuple[str, str]],
+        extra_keys: Optional[Dict[str, Iterable[str]]] = None
+    ) -> List[MaskingResult]:
+        """
+        여러 파일을 두 단계로 일괄 마스킹 처리
+        
+        1단계에서 모든 파일의 (키, 값) 쌍을 추출하여 중복을 제거하고, 2단계에서 고유한 키와 값을
+        한 번씩만 판정한 뒤 그 결과를 각 파일에 적용합니다. 여러 모듈/프로필에 같은 키가 반복되는
+        경우 매처 실행 횟수가 고유 키 수로 줄어듭니다.
+        
+        Args:
+            files: (파일 경로, 파일 내용) 이터러블
+            extra_keys: 파일 경로 -> 해당 파일에서만 민감 키로 취급할 키 경로 (LLM 탐지 결과 등)
+            
+        Returns:
+            입력 순서와 같은 MaskingResult 리스트
+        """
+        files = list(files)
+        self._ensure_secret_rules()
+        
+        # 1단계: 전체 파일에서 키/값 추출 및 중복 제거
+        collector = _PairCollector()
+        failed: Dict[int, str] = {}
+        for index, (file_path, content) in enumerate(files):
+            try:
+                self._select_masker(file_path).mask_content(content, collector)
+            except Exception as e:
+                failed[index] = str(e)
+        
+        # 2단계: 고유 키/값을 한 번씩만 판정 (값은 엔트로피 탐지기로 일괄 판정)
+        verdicts = _VerdictTable(
+            {key: self.matcher.is_sensitive_key(key) for key in collector.keys},
+            self.matcher.classify_values(collector.values),
+            self.matcher.secret_scanner
+        )
+        
+        # 판정 결과를 각 파일에 적용
+        results = []
+        for index, (file_path, content) in enumerate(files):
+            if index in failed:
+                results.append(MaskingResult(
+                    file_path=file_path,
+                    original_content=content,
+                    masked_content=content,
+                    error=failed[index]
+                ))
+            else:
+                file_keys = extra_keys.get(file_path) if extra_keys else None
+                results.append(self.mask_file(file_path, content, verdicts, file_keys))
+        return results
+    
+    def mask_stream(self, file_path: str, lines: Iterable[str]) -> Iterator[Tuple[str, Optional[MaskedItem]]]:
+        """
+        라인 스트림을 마스킹 처리 (대용량 파일용)
+        
+        파일 전체를 메모리에 올리지 않으므로 최대 메모리 사용량은 라인 묶음(VALUE_BATCH_LINES개,
+        엔트로피 탐지 사용 시) 또는 가장 긴 라인에 비례합니다.
+        
+        Args:
+            file_path: 파일 경로 (마스커 선택용)
+            lines: 라인 이터러블 (파일 핸들 등)
+            
+        Yields:
+            Tuple[마스킹된 라인, 마스킹된 항목 (없으면 None)]
+        """
+        self._ensure_secret_rules()
+        masked_lines = self._select_masker(file_path).mask_lines(lines)
+        if self.matcher.secret_scanner is None:
+            return masked_lines
+        return self._count_stream_hits(masked_lines)
+    
+    def _count_stream_hits(
+        self, masked_lines: Iterator[Tuple[str, Optional[MaskedItem]]]
+    ) -> Iterator[Tuple[str, Optional[MaskedItem]]]:
+        """스트리밍 마스킹 결과를 그대로 넘기면서 마스킹된 항목을 규칙별 탐지 횟수에 집계"""
+        for masked_line, item in masked_lines:
+            if item is not None:
+                self._count_secret_hits((item,), self.matcher)
+            yield masked_line, item
+    
+    def count_secret_hits(self, masked_items: Iterable[MaskedItem], extra_keys: Optional[Iterable[str]] = None):
+        """
+        다시 마스킹하지 않고 재사용한 결과(같은 내용의 중복 파일 등)의 항목을 규칙별 탐지 횟수에 집계
+        
+        Args:
+            masked_items: 재사용한 마스킹 항목
+            extra_keys: 원래 마스킹에 사용한 파일 단위 키 경로 (LLM 탐지 결과 등)
+        """
+        self._count_secret_hits(masked_items, self.overlay(extra_keys) if extra_keys else self.matcher)
+    
+    def _count_secret_hits(self, masked_items: Iterable[MaskedItem], matcher):
+        """
+        마스킹된 항목 중 알려진 비밀 값 형식 때문에 마스킹된 항목을 규칙별로 집계
+        
+        라인 단위 비밀 값 항목은 항목의 규칙으로, 키/값 항목은 키가 민감 키가 아니고 값이
+        규칙에 맞는 경우에만 집계합니다 (키로 이미 마스킹된 값은 제외).
+        """
+        scanner = self.matcher.secret_scanner
+        if scanner is None:
+            return
+        for item in masked_items:
+            if item.type == 'secret':
+                scanner.record_hit(item.key)
+            elif item.type != 'pem' and not matcher.is_sensitive_key(item.key):
+                rule = scanner.search(item.original_value)
+                if rule is not None:
+                    scanner.record_hit(rule)
+    
     def add_sensitive_patterns(self, patterns: List[str]):
-        """LLM이 탐지한 추가 민감 패턴을 추가"""
-        for pattern in patterns:
+        """
+        LLM이 탐지한 민감 키를 모든 파일에 적용되도록 추가
+        
+        파일 단위로만 적용하려면 mask_file/mask_many의 extra_keys를 사용합니다.
+        
+        LLM 결과는 정규식이 아닌 정확한 키 경로이므로 정확 일치 키 집합에 중복 없이 저장합니다.
+        정규식 규칙은 바뀌지 않으므로 판정 캐시도 그대로 유지됩니다.
+        """
+        self.matcher.exact_keys.add(patterns)
+    
+    def close(self):
+        """영구 캐시 등 엔진이 사용한 리소스 정리 (캐시 기록 실패는 verdict_store_error에 기록)"""
+        if self.verdict_store is not None:
+            store, self.verdict_store = self.verdict_store, None
+            self.matcher.verdict_store = None
             try:
-                compiled = re.compile(pattern, re.IGNORECASE)
-                self.matcher.key_patterns.append(compiled)
-            except re.error:
-                # 유효하지 않은 정규식은 무시
-                pass
+                store.close()
+            except (OSError, sqlite3.Error) as e:
+                self.verdict_store_error = str(e)
@@ -0,0 +1,206 @@
+"""
+리터럴 사전 필터 모듈
+
+민감 키 정규식에서 반드시 포함되어야 하는 리터럴 문자열을 추출하고,
+Aho-Corasick 오토마톤 한 번의 선형 탐색으로 정규식 실행이 필요한 키만 걸러냅니다.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+try:
+    import ahocorasick  # pyahocorasick (선택적 의존성)
+except ImportError:
+    ahocorasick = None
+
+
+_REPEAT_OPS = {
+    sre_parse.MAX_REPEAT,
+    sre_parse.MIN_REPEAT,
+    getattr(sre_parse, 'POSSESSIVE_REPEAT', sre_parse.MAX_REPEAT),
+}
+
+
+def _best(candidates: List[List[str]]) -> Optional[List[str]]:
+    """가장 선택성이 높은(최단 리터럴이 가장 긴) 후보 선택"""
+    if not candidates:
+        return None
+    return max(candidates, key=lambda literals: min(len(lit) for lit in literals))
+
+
+def _required_literals(items) -> Optional[List[str]]:
+    """
+    파싱된 정규식 시퀀스에서 필수 리터럴 후보를 찾습니다.
+
+    Returns:
+        리터럴 리스트 (그중 하나는 반드시 매칭 문자열에 포함됨) 또는 None
+    """
+    candidates: List[List[str]] = []
+    run: List[str] = []
+
+    def flush():
+        if run:
+            candidates.append([''.join(run)])
+            run.clear()
+
+    for op, av in items:
+        if op == sre_parse.LITERAL:
+            run.append(chr(av).casefold())
+        elif op == sre_parse.AT:
+            # 폭이 0인 앵커는 리터럴 연속성을 깨지 않음
+            continue
+        elif op == sre_parse.SUBPATTERN:
+            flush()
+            inner = _required_literals(av[-1])
+            if inner:
+                candidates.append(inner)
+        elif op == sre_parse.BRANCH:
+            flush()
+            alternatives = [_required_literals(branch) for branch in av[1]]
+            if all(alternatives):
+                candidates.append([lit for alt in alternatives for lit in alt])
+        elif op in _REPEAT_OPS:
+            flush()
+            min_count, _, inner_items = av
+            if min_count >= 1:
+                inner = _required_literals(inner_items)
+                if inner:
+                    candidates.append(inner)
+        else:
+            flush()
+    flush()
+
+    return _best(candidates)
+
+
+def extract_required_literals(pattern: str) -> Optional[List[str]]:
+    """
+    정규식이 매칭되려면 반드시 포함되어야 하는 리터럴을 추출합니다.
+
+    리터럴은 casefold된 형태로 반환되며, 대소문자 무시 패턴에 사용됩니다.
+
+    Args:
+        pattern: 정규식 패턴
+
+    Returns:
+        리터럴 리스트 (하나 이상 포함되어야 함), 추출할 수 없으면 None
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return None
+
+    literals = _required_literals(list(parsed))
+    if not literals or not all(literals):
+        return None
+    return literals
+
+
+class LiteralAutomaton:
+    """
+    다중 리터럴 탐색용 Aho-Corasick 오토마톤
+
+    pyahocorasick이 설치되어 있으면 C 구현을 사용하고, 없으면 순수 Python 구현을 사용합니다.
+    """
+
+    def __init__(self, literals: Iterable[str]):
+        """
+        Args:
+            literals: 탐색할 리터럴 (casefold된 문자열)
+        """
+        self.literals = sorted(set(lit for lit in literals if lit))
+        self._native = None
+
+        if ahocorasick is not None and self.literals:
+            automaton = ahocorasick.Automaton()
+            for literal in self.literals:
+                automaton.add_word(literal, literal)
+            automaton.make_automaton()
+            self._native = automaton
+            return
+
+        self._build()
+
+    def _build(self):
+        """goto/fail/output 테이블 구성"""
+        goto: List[Dict[str, int]] = [{}]
+        output: List[bool] = [False]
+
+        for literal in self.literals:
+            state = 0
+            for ch in literal:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    goto.append({})
+                    output.append(False)
+                    next_state = len(goto) - 1
+                    goto[state][ch] = next_state
+                state = next_state
+            output[state] = True
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(ch, 0)
+                fail[next_state] = target if target != next_state else 0
+                output[next_state] = output[next_state] or output[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def search(self, text: str) -> bool:
+        """
+        텍스트에 리터럴 중 하나라도 포함되어 있는지 확인
+
+        Args:
+            text: casefold된 검색 대상 문자열
+        """
+        if self._native is not None:
+            return next(self._native.iter(text), None) is not None
+
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                return True
+        return False
+
+
+def build_key_prefilter(patterns: Iterable[str]) -> Optional[LiteralAutomaton]:
+    """
+    민감 키 패턴 집합에 대한 사전 필터를 생성합니다.
+
+    필수 리터럴을 추출할 수 없는 패턴이 하나라도 있으면 모든 키에 정규식을 실행해야
+    하므로 None을 반환합니다.
+
+    Args:
+        patterns: 민감 키 정규식 패턴
+
+    Returns:
+        LiteralAutomaton 또는 None
+    """
+    literals: List[str] = []
+    for pattern in patterns:
+        required = extract_required_literals(pattern)
+        if required is None:
+            return None
+        literals.extend(required)
+
+    if not literals:
+        return None
+    return LiteralAutomaton(literals)
@@ -0,0 +1,132 @@
+"""
+정규식 백엔드 모듈
+
+사용자 정의 값 패턴(sensitive_value_patterns 등)을 실행할 정규식 엔진을 선택합니다.
+
+- re: Python 기본 백트래킹 엔진. 값 길이 상한을 넘는 값은 검사하지 않습니다.
+- re2: RE2 기반 선형 시간 엔진 (google-re2 설치 필요). RE2가 지원하지 않는
+  패턴(전방탐색, 역참조 등)은 길이 상한이 적용된 re로 대체됩니다.
+"""
+
+import re
+from typing import List, Optional
+
+try:
+    import re2  # google-re2 (선택적 의존성)
+except ImportError:
+    re2 = None
+
+
+# 백트래킹 엔진으로 검사할 최대 값 길이 (문자 수)
+DEFAULT_MAX_VALUE_LENGTH = 4096
+
+
+class CappedPattern:
+    """길이 상한을 넘는 입력은 매칭하지 않는 re 패턴 래퍼"""
+
+    def __init__(self, compiled: re.Pattern, max_length: Optional[int]):
+        self.compiled = compiled
+        self.pattern = compiled.pattern
+        self.max_length = max_length
+
+    def _too_long(self, text: str) -> bool:
+        return self.max_length is not None and len(text) > self.max_length
+
+    def match(self, text: str):
+        if self._too_long(text):
+            return None
+        return self.compiled.match(text)
+
+    def search(self, text: str):
+        if self._too_long(text):
+            return None
+        return self.compiled.search(text)
+
+    def finditer(self, text: str):
+        if self._too_long(text):
+            return iter(())
+        return self.compiled.finditer(text)
+
+
+class ReBackend:
+    """Python re 기반 백엔드 (값 길이 상한 적용)"""
+
+    name = 're'
+
+    def __init__(self, max_value_length: Optional[int] = DEFAULT_MAX_VALUE_LENGTH):
+        """
+        Args:
+            max_value_length: 검사할 최대 값 길이 (None이면 제한 없음)
+        """
+        self.max_value_length = max_value_length
+
+    def compile(self, pattern: str, flags: int = 0) -> CappedPattern:
+        """패턴 컴파일 (유효하지 않은 정규식은 re.error 발생)"""
+        return CappedPattern(re.compile(pattern, flags), self.max_value_length)
+
+
+class Re2Backend(ReBackend):
+    """RE2 기반 선형 시간 백엔드"""
+
+    name = 're2'
+
+    def __init__(self, max_value_length: Optional[int] = DEFAULT_MAX_VALUE_LENGTH):
+        """
+        Args:
+            max_value_length: RE2로 컴파일할 수 없어 re로 대체된 패턴에 적용할 최대 값 길이
+        """
+        if re2 is None:
+            raise ImportError("RE2 백엔드를 사용하려면 'pip install google-re2'가 필요합니다.")
+        super().__init__(max_value_length)
+        self.fallback_patterns: List[str] = []
+
+        self._options = None
+        if hasattr(re2, 'Options'):
+            # 지원하지 않는 패턴에 대한 RE2 내부 에러 로그 억제
+            self._options = re2.Options()
+            self._options.log_errors = False
+
+    def compile(self, pattern: str, flags: int = 0):
+        """
+        RE2로 패턴을 컴파일합니다. RE2가 지원하지 않는 문법이면 re로 대체합니다.
+        """
+        # 파이썬 플래그는 RE2 구현마다 다르므로 인라인 플래그로 전달
+        inline = ''
+        if flags & re.IGNORECASE:
+            inline += 'i'
+        if flags & re.MULTILINE:
+            inline += 'm'
+        if flags & re.DOTALL:
+            inline += 's'
+        re2_pattern = f"(?{inline}){pattern}" if inline else pattern
+
+        try:
+            if self._options is not None:
+                return re2.compile(re2_pattern, self._options)
+            return re2.compile(re2_pattern)
+        except re2.error:
+            compiled = super().compile(pattern, flags)
+            self.fallback_patterns.append(pattern)
+            return compiled
+
+
+def create_regex_backend(name: str = 're', max_value_length: Optional[int] = DEFAULT_MAX_VALUE_LENGTH):
+    """
+    설정값에 따라 정규식 백엔드 생성
+
+    Args:
+        name: 're', 're2', 'auto' (RE2가 설치되어 있으면 re2, 아니면 re)
+        max_value_length: 백트래킹 엔진에 적용할 최대 값 길이
+
+    Returns:
+        ReBackend 또는 Re2Backend
+    """
+    name = (name or 're').lower()
+    if name == 'auto':
+        name = 're2' if re2 is not None else 're'
+
+    if name == 're2':
+        return Re2Backend(max_value_length)
+    if name == 're':
+        return ReBackend(max_value_length)
+    raise ValueError(f"지원하지 않는 정규식 백엔드: {name}")
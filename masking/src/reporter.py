@@ -8,10 +8,12 @@ import json
 import os
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 
 import yaml
 
+from .masker import MaskedItem
+
 
 @dataclass
 class FileReport:
@@ -19,13 +21,26 @@ class FileReport:
     file_path: str
     relative_path: str
     masked_count: int
-    masked_items: List[Dict[str, Any]] = field(default_factory=list)
+    masked_items: List[MaskedItem] = field(default_factory=list)
     backup_path: Optional[str] = None
     error: Optional[str] = None
+    duplicate_of: Optional[str] = None  # 내용이 같아 마스킹 결과를 재사용한 파일의 상대 경로
     
     @property
     def is_success(self) -> bool:
         return self.error is None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (마스킹 항목은 이 시점에만 딕셔너리로 변환)"""
+        return {
+            'file_path': self.file_path,
+            'relative_path': self.relative_path,
+            'masked_count': self.masked_count,
+            'masked_items': [item.to_dict() for item in self.masked_items],
+            'backup_path': self.backup_path,
+            'error': self.error,
+            'duplicate_of': self.duplicate_of
+        }
 
 
 @dataclass
@@ -34,6 +49,8 @@ class MaskingReport:
     project_path: str
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     total_files_scanned: int = 0
+    total_files_skipped: int = 0
+    total_files_deduplicated: int = 0
     total_files_masked: int = 0
     total_items_masked: int = 0
     files: List[FileReport] = field(default_factory=list)
@@ -46,6 +63,8 @@ class MaskingReport:
         """파일 리포트 추가"""
         self.files.append(file_report)
         self.total_files_scanned += 1
+        if file_report.duplicate_of is not None:
+            self.total_files_deduplicated += 1
         
         if file_report.is_success and file_report.masked_count > 0:
             self.total_files_masked += 1
@@ -54,6 +73,10 @@ class MaskingReport:
         if file_report.error:
             self.errors.append(f"{file_report.file_path}: {file_report.error}")
     
+    def add_skipped_file(self):
+        """증분 스캔 인덱스로 건너뛴(지난 실행 이후 바뀌지 않은 정상) 파일 집계"""
+        self.total_files_skipped += 1
+    
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
         return {
@@ -61,11 +84,13 @@ class MaskingReport:
             'timestamp': self.timestamp,
             'summary': {
                 'total_files_scanned': self.total_files_scanned,
+                'total_files_skipped': self.total_files_skipped,
+                'total_files_deduplicated': self.total_files_deduplicated,
                 'total_files_masked': self.total_files_masked,
                 'total_items_masked': self.total_items_masked,
                 'has_errors': len(self.errors) > 0
             },
-            'files': [asdict(f) for f in self.files],
+            'files': [f.to_dict() for f in self.files],
             'errors': self.errors,
             'settings': {
                 'llm_used': self.llm_used,
@@ -124,6 +149,8 @@ class ReportGenerator:
             "요약",
             "-" * 60,
             f"스캔된 파일 수: {report.total_files_scanned}",
+            f"변경 없음(건너뜀) 파일 수: {report.total_files_skipped}",
+            f"중복 내용(결과 재사용) 파일 수: {report.total_files_deduplicated}",
             f"마스킹된 파일 수: {report.total_files_masked}",
             f"마스킹된 항목 수: {report.total_items_masked}",
             "",
@@ -141,11 +168,13 @@ class ReportGenerator:
                     lines.append(f"\n파일: {file_report.relative_path}")
                     lines.append(f"  마스킹 항목 수: {file_report.masked_count}")
                     
+                    if file_report.duplicate_of:
+                        lines.append(f"  동일 내용: {file_report.duplicate_of}")
                     if file_report.backup_path:
                         lines.append(f"  백업: {file_report.backup_path}")
                     
                     for item in file_report.masked_items:
-                        lines.append(f"  - Line {item['line']}: {item['key']}")
+                        lines.append(f"  - Line {item.line}: {item.key}")
         
         if report.errors:
             lines.extend([
@@ -231,6 +260,8 @@ class ConsoleReporter:
             table.add_column("값", style="green")
             
             table.add_row("스캔된 파일", str(report.total_files_scanned))
+            table.add_row("변경 없음(건너뜀)", str(report.total_files_skipped))
+            table.add_row("중복 내용(결과 재사용)", str(report.total_files_deduplicated))
             table.add_row("마스킹된 파일", str(report.total_files_masked))
             table.add_row("마스킹된 항목", str(report.total_items_masked))
             table.add_row("오류", str(len(report.errors)))
@@ -240,6 +271,8 @@ class ConsoleReporter:
         else:
             print(f"\n요약:")
             print(f"  스캔된 파일: {report.total_files_scanned}")
+            print(f"  변경 없음(건너뜀): {report.total_files_skipped}")
+            print(f"  중복 내용(결과 재사용): {report.total_files_deduplicated}")
             print(f"  마스킹된 파일: {report.total_files_masked}")
             print(f"  마스킹된 항목: {report.total_items_masked}")
             print(f"  오류: {len(report.errors)}")
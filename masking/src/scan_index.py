@@ -0,0 +1,125 @@
+"""
+증분 스캔 인덱스 모듈
+
+파일별 크기, mtime_ns, inode, 내용 해시를 프로젝트별 인덱스 파일에 기록하여
+지난 실행 이후 바뀌지 않았고 마스킹할 항목이 없던 파일은 다시 읽거나 마스킹하지 않도록 합니다.
+인덱스는 마스킹 설정 지문에 묶여 있어 설정이 바뀌면 자동으로 비워집니다.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+
+# 저장 형식이 바뀌면 올려서 기존 인덱스를 무효화
+INDEX_FORMAT_VERSION = 1
+
+
+def content_digest(content: str) -> str:
+    """파일 내용의 SHA-256 해시"""
+    return hashlib.sha256(content.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+class ScanIndex:
+    """
+    프로젝트별 증분 스캔 인덱스
+
+    마스킹 결과 변경할 내용이 없던(정상) 파일만 기록합니다. 상대 경로 -> 파일 상태/해시를
+    메모리에 두고 save() 시점에 임시 파일에 쓴 뒤 교체합니다.
+    """
+
+    def __init__(self, path: str, fingerprint: str):
+        """
+        Args:
+            path: 인덱스 파일 경로
+            fingerprint: 마스킹 설정 지문 (다르면 기존 인덱스를 사용하지 않음)
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """인덱스 파일 읽기 (없거나 손상되었거나 설정이 바뀌었으면 빈 인덱스)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') != INDEX_FORMAT_VERSION or data.get('fingerprint') != self.fingerprint:
+            self._dirty = True
+            return
+        self._entries = data.get('files', {})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _same_stat(entry: Dict[str, Any], stat: os.stat_result) -> bool:
+        return (
+            entry['size'] == stat.st_size
+            and entry['mtime_ns'] == stat.st_mtime_ns
+            and entry['inode'] == stat.st_ino
+        )
+
+    def is_unchanged(self, rel_path: str, stat: os.stat_result) -> bool:
+        """파일 상태(크기, mtime_ns, inode)가 정상으로 기록된 때와 같은지 확인"""
+        entry = self._entries.get(rel_path)
+        return entry is not None and self._same_stat(entry, stat)
+
+    def has_content(self, rel_path: str, digest: str) -> bool:
+        """
+        파일 상태는 바뀌었지만 내용이 정상으로 기록된 때와 같은지 확인
+
+        같으면 새 파일 상태를 기록하므로 다음 실행에서는 파일을 읽지 않습니다.
+        """
+        entry = self._entries.get(rel_path)
+        return entry is not None and entry.get('sha256') is not None and entry['sha256'] == digest
+
+    def mark_clean(self, rel_path: str, stat: os.stat_result, digest: Optional[str] = None):
+        """
+        마스킹할 항목이 없는 파일로 기록
+
+        Args:
+            rel_path: 프로젝트 기준 상대 경로
+            stat: 파일을 읽기 전의 파일 상태
+            digest: 내용 해시 (content_digest, 스트리밍 처리한 대용량 파일은 None)
+        """
+        self._entries[rel_path] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'inode': stat.st_ino,
+            'sha256': digest
+        }
+        self._dirty = True
+
+    def discard(self, rel_path: str):
+        """정상 기록 제거 (마스킹되었거나 오류가 난 파일)"""
+        if self._entries.pop(rel_path, None) is not None:
+            self._dirty = True
+
+    def save(self):
+        """변경된 경우 인덱스를 임시 파일에 쓴 뒤 원자적으로 교체"""
+        if not self._dirty:
+            return
+
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix='.scan_index.', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': INDEX_FORMAT_VERSION,
+                    'fingerprint': self.fingerprint,
+                    'files': self._entries
+                }, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._dirty = False
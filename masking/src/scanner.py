@@ -5,23 +5,67 @@
 """
 
 import os
+import re
 import fnmatch
+import hashlib
 import shutil
+import stat
+import subprocess
+import tempfile
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Set
+from typing import Dict, Generator, List, Optional, Set, Tuple
 from datetime import datetime
 import json
 
+from .backup_store import ArchiveStore, ObjectStore, hash_file
+
+
+def compile_glob_set(patterns: List[str]) -> Optional[re.Pattern]:
+    """
+    glob 패턴 리스트를 하나의 정규식으로 컴파일
+    
+    fnmatch.fnmatch와 같은 규칙(fnmatch.translate, os.path.normcase)을 사용하므로
+    결과 정규식의 match 한 번이 패턴별 fnmatch 호출 전체와 같습니다.
+    
+    Args:
+        patterns: glob 패턴 리스트
+        
+    Returns:
+        컴파일된 정규식, 패턴이 없으면 None
+    """
+    if not patterns:
+        return None
+    return re.compile('|'.join(
+        f"(?:{fnmatch.translate(os.path.normcase(pattern))})" for pattern in patterns
+    ))
+
 
 class FileScanner:
-    """프로젝트 디렉토리에서 설정 파일을 탐색하는 클래스"""
+    """
+    프로젝트 디렉토리에서 설정 파일을 탐색하는 클래스
+    
+    os.scandir로 디렉토리를 읽어 DirEntry의 파일 유형 정보를 그대로 사용하고(추가 stat 없음),
+    하위 디렉토리는 스레드 풀에서 병렬로 읽습니다. 상대 경로는 디렉토리를 내려가며 이어 붙이므로
+    파일마다 relpath를 계산하지 않습니다.
+    
+    git 저장소에서는 디렉토리를 읽는 대신 git 인덱스에서 후보 목록을 받아 패턴을 적용하므로
+    .gitignore로 무시된 빌드 출력/생성 소스/벤더 디렉토리에는 들어가지 않습니다.
+    """
+    
+    DISCOVERY_MODES = ('auto', 'walk')
     
     def __init__(
         self,
         file_patterns: List[str],
         exclude_dirs: List[str] = None,
         include_patterns: List[str] = None,
-        exclude_patterns: List[str] = None
+        exclude_patterns: List[str] = None,
+        workers: int = 8,
+        ordered: bool = True,
+        discovery: str = 'auto'
     ):
         """
         Args:
@@ -29,42 +73,211 @@ class FileScanner:
             exclude_dirs: 제외할 디렉토리 리스트
             include_patterns: 포함할 추가 패턴 (--include 옵션)
             exclude_patterns: 제외할 추가 패턴 (--exclude 옵션)
+            workers: 디렉토리를 병렬로 읽을 스레드 수 (1이면 순차 탐색)
+            ordered: True면 디렉토리/파일 이름 순(깊이 우선)으로, False면 읽기가 끝난 순서로 반환
+            discovery: 후보 파일 목록 방식 (auto: git 저장소면 git 인덱스, 아니면 디렉토리 탐색 / walk: 항상 디렉토리 탐색)
         """
+        if discovery not in self.DISCOVERY_MODES:
+            raise ValueError(f"지원하지 않는 탐색 방식: {discovery} ({', '.join(self.DISCOVERY_MODES)})")
+        
         self.file_patterns = file_patterns
         self.exclude_dirs = set(exclude_dirs or [])
         self.include_patterns = include_patterns or []
         self.exclude_patterns = exclude_patterns or []
+        self.workers = max(1, workers)
+        self.ordered = ordered
+        self.discovery = discovery
+        
+        # 패턴 집합을 한 번만 정규식으로 변환 (파일당 최대 세 번의 match)
+        # 제외 패턴은 상대 경로와 파일명 양쪽에 적용하고, 포함 패턴이 지정되면 기본 패턴 대신 사용
+        self._exclude_regex = compile_glob_set(self.exclude_patterns)
+        self._include_regex = compile_glob_set(self.include_patterns or self.file_patterns)
     
     def _should_exclude_dir(self, dir_name: str) -> bool:
         """디렉토리를 제외해야 하는지 확인"""
         return dir_name in self.exclude_dirs or dir_name.startswith('.')
     
-    def _matches_pattern(self, filename: str, patterns: List[str]) -> bool:
-        """파일명이 패턴 중 하나와 일치하는지 확인"""
-        for pattern in patterns:
-            if fnmatch.fnmatch(filename, pattern):
-                return True
-        return False
-    
     def _should_process_file(self, file_path: str, filename: str) -> bool:
         """파일을 처리해야 하는지 확인"""
-        # 추가 제외 패턴 확인
-        if self.exclude_patterns:
-            for pattern in self.exclude_patterns:
-                if fnmatch.fnmatch(file_path, pattern) or fnmatch.fnmatch(filename, pattern):
-                    return False
+        filename = os.path.normcase(filename)
+        
+        # 추가 제외 패턴 확인 (파일명, 상대 경로)
+        if self._exclude_regex is not None and (
+            self._exclude_regex.match(filename) or self._exclude_regex.match(os.path.normcase(file_path))
+        ):
+            return False
         
-        # 추가 포함 패턴이 지정된 경우 해당 패턴만 처리
-        if self.include_patterns:
-            return self._matches_pattern(filename, self.include_patterns)
+        # 추가 포함 패턴(지정된 경우) 또는 기본 파일 패턴 확인
+        return self._include_regex is not None and self._include_regex.match(filename) is not None
+    
+    def matches(self, rel_path: str) -> bool:
+        """
+        프로젝트 루트 기준 상대 경로의 파일이 대상인지 확인
+        
+        디렉토리 탐색과 같은 결과가 되도록 제외 디렉토리(exclude_dirs, '.'으로 시작하는 디렉토리)를
+        경로 구성 요소마다 확인한 뒤 파일 패턴을 적용합니다. git 인덱스 목록이나 파일 변경 이벤트처럼
+        디렉토리를 내려가지 않고 얻은 경로에 사용합니다.
+        
+        Args:
+            rel_path: 상대 경로 ('/' 또는 os.sep 구분)
+        """
+        *dirs, filename = rel_path.replace(os.sep, '/').split('/')
+        if any(self._should_exclude_dir(dir_name) for dir_name in dirs):
+            return False
+        return self._should_process_file(rel_path.replace('/', os.sep), filename)
+    
+    def _scan_dir(self, dir_path: str, rel_dir: str) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """
+        디렉토리 하나를 읽어 대상 파일과 탐색할 하위 디렉토리를 반환
+        
+        os.walk와 같이 읽을 수 없는 디렉토리는 무시하고, 디렉토리 심볼릭 링크는 따라가지 않습니다.
+        
+        Args:
+            dir_path: 디렉토리 절대 경로
+            rel_dir: 프로젝트 루트 기준 상대 경로 접두사 ('' 또는 'a/b/')
+            
+        Returns:
+            Tuple[대상 파일 절대 경로 리스트, (하위 디렉토리 절대 경로, 상대 경로 접두사) 리스트]
+        """
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    if is_dir:
+                        if not self._should_exclude_dir(entry.name) and not entry.is_symlink():
+                            subdirs.append((entry.path, f"{rel_dir}{entry.name}{os.sep}"))
+                    elif self._should_process_file(rel_dir + entry.name, entry.name):
+                        files.append(entry.path)
+        except OSError:
+            return [], []
         
-        # 기본 파일 패턴 확인
-        return self._matches_pattern(filename, self.file_patterns)
+        if self.ordered:
+            files.sort()
+            subdirs.sort()
+        return files, subdirs
+    
+    def _run_git_ls_files(self, project_path: str, args: List[str]) -> Optional[List[bytes]]:
+        """git ls-files 실행 결과 항목 리스트 (git 저장소가 아니거나 git을 실행할 수 없으면 None)"""
+        try:
+            result = subprocess.run(
+                ['git', '-C', project_path, 'ls-files', '-z', *args],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return None
+        if result.returncode != 0:
+            return None
+        return [raw for raw in result.stdout.split(b'\0') if raw]
+    
+    def _walk_rel_paths(self, project_path: str, rel_dir: str) -> List[str]:
+        """디렉토리 탐색으로 rel_dir 아래 대상 파일의 상대 경로 목록 조회 (git 목록 대체용)"""
+        rel_paths = []
+        stack = [(os.path.join(project_path, rel_dir.replace('/', os.sep)), rel_dir.replace('/', os.sep) + os.sep)]
+        while stack:
+            files, subdirs = self._scan_dir(*stack.pop())
+            rel_paths.extend(os.path.relpath(file_path, project_path).replace(os.sep, '/') for file_path in files)
+            stack.extend(subdirs)
+        return rel_paths
+    
+    def _list_git_paths(self, project_path: str) -> Optional[List[str]]:
+        """
+        git 인덱스에서 프로젝트 루트 기준 후보 상대 경로 목록 조회
+        
+        추적 중인 파일과 무시되지 않은 추적 전 파일에 더해, .gitignore로 무시된 개별 파일도 포함합니다
+        (.env처럼 커밋하지 않는 설정 파일이 마스킹 대상이므로). 무시된 디렉토리는 --directory로
+        한 항목('dir/')으로만 나오므로 그 안은 읽지 않습니다.
+        
+        하위 모듈(gitlink)과 추적 전 중첩 git 저장소('dir/')는 git이 안을 나열하지 않으므로, 그 디렉토리의
+        git 목록을 다시 조회하고 조회할 수 없으면 디렉토리를 탐색합니다.
+        
+        Args:
+            project_path: 프로젝트 루트 절대 경로
+            
+        Returns:
+            상대 경로 리스트 ('/' 구분), git 저장소가 아니거나 git을 실행할 수 없으면 None
+        """
+        staged = self._run_git_ls_files(project_path, ['--stage'])
+        others = self._run_git_ls_files(project_path, ['--others', '--exclude-standard'])
+        ignored = self._run_git_ls_files(project_path, ['--others', '--ignored', '--exclude-standard', '--directory'])
+        if staged is None or others is None or ignored is None:
+            return None
+        
+        paths: Dict[str, None] = {}
+        nested_dirs: Dict[str, None] = {}
+        # --stage 항목: '<모드> <해시> <스테이지>\t<경로>' (모드 160000은 하위 모듈)
+        # 병합 충돌 중인 파일은 스테이지마다 한 번씩 나오므로 중복 제거
+        for raw in staged:
+            info, _, raw_path = raw.partition(b'\t')
+            if info.startswith(b'160000 '):
+                nested_dirs[os.fsdecode(raw_path)] = None
+            else:
+                paths[os.fsdecode(raw_path)] = None
+        for raw in others:
+            if raw.endswith(b'/'):
+                nested_dirs[os.fsdecode(raw[:-1])] = None
+            else:
+                paths[os.fsdecode(raw)] = None
+        for raw in ignored:
+            if not raw.endswith(b'/'):
+                paths[os.fsdecode(raw)] = None
+        
+        for rel_dir in nested_dirs:
+            if any(self._should_exclude_dir(dir_name) for dir_name in rel_dir.split('/')):
+                continue
+            nested_path = os.path.join(project_path, rel_dir.replace('/', os.sep))
+            if not os.path.isdir(nested_path) or os.path.islink(nested_path):
+                continue
+            nested = self._list_git_paths(nested_path)
+            if nested is None:
+                # 초기화되지 않은 하위 모듈 등 git 목록을 조회할 수 없으면 디렉토리 탐색
+                paths.update(dict.fromkeys(self._walk_rel_paths(project_path, rel_dir)))
+            else:
+                paths.update(dict.fromkeys(f"{rel_dir}/{rel_path}" for rel_path in nested))
+        
+        # 루트 자체가 무시된 디렉토리이면 목록이 비므로 디렉토리 탐색으로 처리
+        return list(paths) or None
+    
+    def _scan_git(self, project_path: str, rel_paths: List[str]) -> List[str]:
+        """
+        git 인덱스 후보 목록에 디렉토리/파일 패턴을 적용
+        
+        삭제되었지만 인덱스에 남은 파일은 제외합니다.
+        
+        Args:
+            project_path: 프로젝트 루트 절대 경로
+            rel_paths: _list_git_paths 결과
+            
+        Returns:
+            대상 파일 절대 경로 리스트
+        """
+        matched = []
+        for rel_path in rel_paths:
+            if not self.matches(rel_path):
+                continue
+            file_path = os.path.join(project_path, rel_path.replace('/', os.sep))
+            if os.path.isfile(file_path):
+                *dirs, filename = rel_path.split('/')
+                matched.append((dirs, filename, file_path))
+        
+        if self.ordered:
+            # 디렉토리 탐색과 같은 순서: 디렉토리마다 파일을 먼저, 하위 디렉토리는 이름 순으로
+            matched.sort(key=lambda item: (*((1, name) for name in item[0]), (0, item[1])))
+        return [file_path for _, _, file_path in matched]
     
     def scan(self, project_path: str) -> Generator[str, None, None]:
         """
         프로젝트 디렉토리를 스캔하여 대상 파일을 찾습니다.
         
+        탐색이 끝나기 전에도 찾은 파일을 바로 반환하므로 호출자는 탐색과 동시에 처리를 시작할 수 있습니다.
+        discovery가 auto이고 git 저장소이면 git 인덱스 목록을 사용하고, 아니면 디렉토리를 탐색합니다.
+        
         Args:
             project_path: 프로젝트 루트 경로
             
@@ -73,16 +286,41 @@ class FileScanner:
         """
         project_path = os.path.abspath(project_path)
         
-        for root, dirs, files in os.walk(project_path):
-            # 제외할 디렉토리 필터링 (in-place 수정으로 하위 탐색 방지)
-            dirs[:] = [d for d in dirs if not self._should_exclude_dir(d)]
-            
-            for filename in files:
-                file_path = os.path.join(root, filename)
-                rel_path = os.path.relpath(file_path, project_path)
-                
-                if self._should_process_file(rel_path, filename):
-                    yield file_path
+        if self.discovery == 'auto':
+            rel_paths = self._list_git_paths(project_path)
+            if rel_paths is not None:
+                yield from self._scan_git(project_path, rel_paths)
+                return
+        
+        if self.workers == 1:
+            stack = [(project_path, '')]
+            while stack:
+                files, subdirs = self._scan_dir(*stack.pop())
+                yield from files
+                stack.extend(reversed(subdirs))
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='scan')
+        try:
+            if self.ordered:
+                # 하위 디렉토리를 모두 미리 제출해 두고 깊이 우선 순서로 결과를 기다림
+                stack = [executor.submit(self._scan_dir, project_path, '')]
+                while stack:
+                    files, subdirs = stack.pop().result()
+                    yield from files
+                    stack.extend(reversed([executor.submit(self._scan_dir, *subdir) for subdir in subdirs]))
+            else:
+                # 읽기가 끝난 디렉토리부터 결과 반환
+                pending = {executor.submit(self._scan_dir, project_path, '')}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        files, subdirs = future.result()
+                        pending.update(executor.submit(self._scan_dir, *subdir) for subdir in subdirs)
+                        yield from files
+        finally:
+            # 호출자가 중간에 멈춰도 대기 중인 디렉토리 읽기는 취소
+            executor.shutdown(wait=False, cancel_futures=True)
     
     def scan_multiple(self, project_paths: List[str]) -> Generator[str, None, None]:
         """
@@ -98,97 +336,417 @@ class FileScanner:
             yield from self.scan(project_path)
 
 
+@dataclass
+class RestoreResult:
+    """복원 결과를 담는 데이터 클래스"""
+    restored: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)  # 현재 내용이 백업과 같아 건너뛴 파일
+    errors: List[Tuple[str, str]] = field(default_factory=list)  # (파일 경로, 오류 메시지)
+
+
 class BackupManager:
-    """백업 관리 클래스"""
+    """
+    백업 관리 클래스
     
-    def __init__(self, backup_dir_name: str = ".masking_backup", suffix: str = ".backup"):
+    원본 내용은 백업 디렉토리의 objects/에 내용 해시 이름의 압축 객체로 저장하거나(ObjectStore),
+    archive 모드에서는 실행마다 tar 아카이브 하나에 모아 저장합니다(ArchiveStore). 어느 쪽이든
+    같은 내용은 파일이나 실행이 달라도 한 번만 저장됩니다. 백업 기록(상대 경로, 실행 ID, 내용 해시)은
+    manifest.jsonl 저널에 한 줄씩 추가만 하며, 모아 두었다가 flush() 시점에 한 번에 기록합니다.
+    조회는 프로젝트별로 한 번만 읽어 두는 메모리 인덱스(상대 경로 -> 백업 기록 이력)로 처리합니다.
+    이전 형식의 manifest.json과 백업 파일 기록도 읽습니다.
+    """
+    
+    JOURNAL_NAME = "manifest.jsonl"
+    LEGACY_MANIFEST_NAME = "manifest.json"
+    OBJECTS_DIR_NAME = "objects"
+    ARCHIVES_DIR_NAME = "archives"
+    MODES = ("objects", "archive")
+    
+    def __init__(
+        self,
+        backup_dir_name: str = ".masking_backup",
+        compression: str = "auto",
+        flush_every: int = 256,
+        mode: str = "objects"
+    ):
         """
         Args:
             backup_dir_name: 백업 디렉토리 이름
-            suffix: 백업 파일 접미사
+            compression: 백업 객체 압축 방식 (auto, zstd, zlib)
+            flush_every: flush() 호출 전이라도 이 개수만큼 쌓이면 저널에 기록
+            mode: objects (객체마다 파일 하나) 또는 archive (실행마다 tar 아카이브 하나)
         """
+        if mode not in self.MODES:
+            raise ValueError(f"지원하지 않는 백업 방식: {mode} ({', '.join(self.MODES)})")
+        
         self.backup_dir_name = backup_dir_name
-        self.suffix = suffix
-        self._backup_manifest: Dict[str, str] = {}
+        self.compression = compression
+        self.mode = mode
+        self.flush_every = max(1, flush_every)
+        # 같은 초에 시작한 실행도 구분되도록 임의 접미사 추가
+        self.run_id = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        # (프로젝트 경로, 백업 방식) -> 저장소
+        self._stores: Dict[Tuple[str, str], object] = {}
+        # 프로젝트 경로 -> 저널에 아직 기록하지 않은 백업 기록
+        self._pending: Dict[str, List[Dict[str, str]]] = {}
+        # 프로젝트 경로 -> (상대 경로 -> 백업 기록 리스트, 오래된 순)
+        self._indexes: Dict[str, Dict[str, List[Dict[str, str]]]] = {}
     
     def _get_backup_dir(self, project_path: str) -> str:
         """프로젝트의 백업 디렉토리 경로 반환"""
         return os.path.join(project_path, self.backup_dir_name)
     
-    def _get_backup_path(self, original_path: str, project_path: str) -> str:
-        """원본 파일의 백업 경로 생성"""
-        backup_dir = self._get_backup_dir(project_path)
-        rel_path = os.path.relpath(original_path, project_path)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_filename = f"{rel_path.replace(os.sep, '_')}_{timestamp}{self.suffix}"
-        return os.path.join(backup_dir, backup_filename)
+    def _get_journal_path(self, project_path: str) -> str:
+        """프로젝트의 백업 저널 경로 반환"""
+        return os.path.join(self._get_backup_dir(project_path), self.JOURNAL_NAME)
+    
+    def _get_store(self, project_path: str, mode: Optional[str] = None):
+        """
+        프로젝트의 백업 저장소 반환
+        
+        Args:
+            project_path: 프로젝트 루트 경로
+            mode: 백업 방식 (기본값: 이 매니저의 방식, 기록을 읽을 때는 기록의 방식)
+            
+        Returns:
+            ObjectStore 또는 ArchiveStore
+        """
+        mode = mode or self.mode
+        store = self._stores.get((project_path, mode))
+        if store is None:
+            backup_dir = self._get_backup_dir(project_path)
+            if mode == "archive":
+                store = ArchiveStore(os.path.join(backup_dir, self.ARCHIVES_DIR_NAME), self.run_id, self.compression)
+            else:
+                store = ObjectStore(os.path.join(backup_dir, self.OBJECTS_DIR_NAME), self.compression)
+            self._stores[(project_path, mode)] = store
+        return store
+    
+    @staticmethod
+    def _relative_key(file_path: str, project_path: str) -> str:
+        """인덱스/저널에 사용하는 프로젝트 기준 상대 경로 ('/' 구분)"""
+        if not os.path.isabs(file_path):
+            return file_path.replace(os.sep, '/')
+        return os.path.relpath(file_path, project_path).replace(os.sep, '/')
+    
+    def _load_index(self, project_path: str) -> Dict[str, List[Dict[str, str]]]:
+        """
+        프로젝트의 백업 인덱스 반환 (처음 한 번만 manifest.json과 저널을 읽음)
+        
+        저널은 기록 순서대로 읽으므로 파일별 기록 리스트의 마지막이 최신 백업입니다.
+        기록 중 중단되어 잘린 라인은 건너뜁니다.
+        """
+        index = self._indexes.get(project_path)
+        if index is not None:
+            return index
+        
+        records = []
+        legacy_path = os.path.join(self._get_backup_dir(project_path), self.LEGACY_MANIFEST_NAME)
+        if os.path.exists(legacy_path):
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                for original_path, backup_path in json.load(f).items():
+                    records.append({'path': original_path, 'backup': backup_path})
+        
+        journal_path = self._get_journal_path(project_path)
+        if os.path.exists(journal_path):
+            with open(journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+        
+        index = {}
+        for record in records:
+            # 이전 형식 기록은 원본 절대 경로를 사용
+            record['path'] = self._relative_key(record['path'], project_path)
+            index.setdefault(record['path'], []).append(record)
+        
+        self._indexes[project_path] = index
+        return index
+    
+    def _record_location(self, record: Dict[str, str], project_path: str) -> Optional[str]:
+        """백업 기록의 객체(또는 이전 형식 백업 파일) 경로, 없으면 None"""
+        if 'hash' in record:
+            found = self._get_store(project_path, record.get('store', 'objects')).find(record['hash'])
+            return found[0] if found else None
+        return record['backup'] if os.path.exists(record['backup']) else None
+    
+    def read_backup(self, record: Dict[str, str], project_path: str) -> bytes:
+        """
+        백업 기록의 원본 내용 반환
+        
+        Args:
+            record: 백업 기록
+            project_path: 프로젝트 루트 경로
+        """
+        if 'hash' in record:
+            return self._get_store(project_path, record.get('store', 'objects')).read(record['hash'])
+        with open(record['backup'], 'rb') as f:
+            return f.read()
     
     def create_backup(self, file_path: str, project_path: str) -> str:
         """
         파일의 백업을 생성합니다.
         
+        내용이 같은 객체가 이미 있으면 기록만 추가합니다. 백업 기록은 flush()가 호출되거나
+        flush_every개가 쌓일 때 저널에 기록됩니다.
+        
         Args:
             file_path: 백업할 파일 경로
             project_path: 프로젝트 루트 경로
             
         Returns:
-            백업 파일 경로
+            백업 객체 경로
+        """
+        digest, object_path = self._get_store(project_path).put_file(file_path)
+        
+        # 인덱스에 바로 반영하고 저널 기록은 모아서 처리
+        rel_path = self._relative_key(file_path, project_path)
+        record = {
+            'path': rel_path,
+            'run': self.run_id,
+            'hash': digest,
+            'store': self.mode,
+            'time': datetime.now().isoformat()
+        }
+        self._load_index(project_path).setdefault(rel_path, []).append(record)
+        pending = self._pending.setdefault(project_path, [])
+        pending.append(record)
+        if len(pending) >= self.flush_every:
+            self.flush(project_path)
+        
+        return object_path
+    
+    def flush(self, project_path: Optional[str] = None):
+        """
+        모아 둔 백업 기록을 저널에 한 번의 쓰기로 추가
+        
+        archive 모드에서는 기록이 가리킬 아카이브와 인덱스를 먼저 디스크에 기록합니다.
+        
+        Args:
+            project_path: 기록할 프로젝트 경로 (None이면 모든 프로젝트)
+        """
+        project_paths = [project_path] if project_path is not None else list(self._pending)
+        for path in project_paths:
+            archive = self._stores.get((path, "archive"))
+            if archive is not None:
+                archive.flush()
+            
+            records = self._pending.pop(path, None)
+            if not records:
+                continue
+            
+            data = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records).encode('utf-8')
+            with open(self._get_journal_path(path), 'a+b') as f:
+                # 이전 기록이 중간에 잘렸으면 새 라인에서 시작
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        data = b'\n' + data
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+    
+    def compact(self, project_path: str):
         """
+        저널 정리: 백업 내용이 없는 기록을 제거하고 이전 형식 manifest.json을 저널로 옮김
+        
+        Args:
+            project_path: 프로젝트 루트 경로
+        """
+        self.flush(project_path)
+        index = self._load_index(project_path)
         backup_dir = self._get_backup_dir(project_path)
+        legacy_path = os.path.join(backup_dir, self.LEGACY_MANIFEST_NAME)
+        if not index and not os.path.exists(legacy_path):
+            return
+        
+        for rel_path in list(index):
+            index[rel_path] = [
+                record for record in index[rel_path]
+                if self._record_location(record, project_path) is not None
+            ]
+            if not index[rel_path]:
+                del index[rel_path]
+        
         os.makedirs(backup_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=".manifest.", suffix=".tmp", dir=backup_dir)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for records in index.values():
+                    for record in records:
+                        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self._get_journal_path(project_path))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
         
-        backup_path = self._get_backup_path(file_path, project_path)
-        shutil.copy2(file_path, backup_path)
+        if os.path.exists(legacy_path):
+            os.remove(legacy_path)
+    
+    def list_runs(self, project_path: str) -> List[Tuple[str, str, int]]:
+        """
+        백업 기록이 있는 실행 목록
         
-        # 매니페스트에 기록
-        self._backup_manifest[file_path] = backup_path
-        self._save_manifest(project_path)
+        Returns:
+            (실행 ID, 첫 백업 시각, 백업 파일 수) 리스트 (오래된 순)
+        """
+        runs: Dict[str, List] = {}
+        for records in self._load_index(project_path).values():
+            for record in records:
+                if 'run' not in record:
+                    continue
+                run = runs.setdefault(record['run'], [record['time'], 0])
+                run[0] = min(run[0], record['time'])
+                run[1] += 1
+        return sorted(((run_id, time, count) for run_id, (time, count) in runs.items()), key=lambda run: run[1])
+    
+    def select_backups(
+        self,
+        project_path: str,
+        patterns: Optional[List[str]] = None,
+        run_id: Optional[str] = None,
+        before: Optional[datetime] = None
+    ) -> List[Dict[str, str]]:
+        """
+        복원할 백업 기록 선택 (파일별 하나)
         
-        return backup_path
+        Args:
+            project_path: 프로젝트 루트 경로
+            patterns: 복원할 파일의 상대 경로 glob 패턴 (없으면 전체)
+            run_id: 이 실행에서 만든 백업만 사용 (해당 실행에서 마스킹한 파일만 복원)
+            before: 이 시각 이전의 가장 최근 백업 사용 (시각이 없는 이전 형식 기록은 항상 이전으로 취급)
+            
+        Returns:
+            백업 기록 리스트 (지정하지 않으면 파일별 최신 백업)
+        """
+        path_regex = compile_glob_set(patterns or [])
+        selected = []
+        for rel_path, records in self._load_index(project_path).items():
+            if path_regex is not None and not path_regex.match(os.path.normcase(rel_path.replace('/', os.sep))):
+                continue
+            
+            candidates = records
+            if run_id is not None:
+                candidates = [record for record in candidates if record.get('run') == run_id]
+            if before is not None:
+                candidates = [
+                    record for record in candidates
+                    if 'time' not in record or datetime.fromisoformat(record['time']) < before
+                ]
+            if candidates:
+                selected.append(candidates[-1])
+        return selected
     
-    def _save_manifest(self, project_path: str):
-        """백업 매니페스트 저장"""
-        backup_dir = self._get_backup_dir(project_path)
-        manifest_path = os.path.join(backup_dir, "manifest.json")
+    def _restore_one(self, record: Dict[str, str], project_path: str) -> bool:
+        """
+        백업 기록 하나를 복원 (해시 검증 후 임시 파일에 쓰고 교체)
         
-        # 기존 매니페스트 로드
-        existing = {}
-        if os.path.exists(manifest_path):
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                existing = json.load(f)
+        Returns:
+            복원했으면 True, 현재 파일이 백업과 같아 건너뛰었으면 False
+            
+        Raises:
+            ValueError: 백업 내용이 기록된 해시와 다른 경우
+        """
+        original_path = os.path.join(project_path, record['path'].replace('/', os.sep))
+        expected = record.get('hash')
         
-        # 업데이트
-        existing.update(self._backup_manifest)
+        # 현재 파일이 이미 백업과 같으면 객체를 읽지 않음
+        if expected is not None and os.path.isfile(original_path) and hash_file(original_path) == expected:
+            return False
         
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(existing, f, indent=2, ensure_ascii=False)
+        data = self.read_backup(record, project_path)
+        if expected is not None:
+            if hashlib.sha256(data).hexdigest() != expected:
+                raise ValueError(f"백업 내용이 기록된 해시와 다릅니다 ({expected[:12]})")
+        elif os.path.isfile(original_path):
+            with open(original_path, 'rb') as f:
+                if f.read() == data:
+                    return False
+        
+        os.makedirs(os.path.dirname(os.path.realpath(original_path)), exist_ok=True)
+        fd, temp_path, target_path = create_temp_file(original_path)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            replace_file(temp_path, target_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return True
     
-    def restore_all(self, project_path: str) -> List[str]:
+    def restore(
+        self,
+        project_path: str,
+        patterns: Optional[List[str]] = None,
+        run_id: Optional[str] = None,
+        before: Optional[datetime] = None,
+        workers: int = 8
+    ) -> 'RestoreResult':
         """
-        프로젝트의 모든 백업 파일을 복원합니다.
+        선택한 파일을 백업에서 병렬로 복원합니다.
+        
+        복원 전에 저널을 정리(compact)하고 비정상 종료로 남은 임시 파일을 지우며,
+        백업 내용은 기록된 해시로 검증합니다.
+        현재 내용이 이미 백업과 같은 파일은 쓰지 않습니다.
         
         Args:
             project_path: 프로젝트 루트 경로
+            patterns: 복원할 파일의 상대 경로 glob 패턴 (없으면 전체)
+            run_id: 이 실행에서 만든 백업만 사용
+            before: 이 시각 이전의 가장 최근 백업 사용
+            workers: 복원 스레드 수
             
         Returns:
-            복원된 파일 경로 리스트
+            RestoreResult
         """
-        backup_dir = self._get_backup_dir(project_path)
-        manifest_path = os.path.join(backup_dir, "manifest.json")
+        self.compact(project_path)
+        records = self.select_backups(project_path, patterns, run_id, before)
+        # 저장소는 스레드 풀에서 사용하기 전에 만들어 둠
+        for mode in {record.get('store', 'objects') for record in records if 'hash' in record}:
+            self._get_store(project_path, mode)
+        # 이전 실행이 비정상 종료로 남긴 임시 파일 삭제
+        for directory in {
+            os.path.dirname(os.path.realpath(os.path.join(project_path, record['path'].replace('/', os.sep))))
+            for record in records
+        }:
+            remove_stale_temp_files(directory)
         
-        if not os.path.exists(manifest_path):
-            return []
+        result = RestoreResult()
         
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        def restore_one(record):
+            try:
+                return record, self._restore_one(record, project_path), None
+            except Exception as e:
+                return record, False, str(e)
         
-        restored = []
-        for original_path, backup_path in manifest.items():
-            if os.path.exists(backup_path):
-                shutil.copy2(backup_path, original_path)
-                restored.append(original_path)
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='restore') as executor:
+            for record, restored, error in executor.map(restore_one, records):
+                original_path = os.path.join(project_path, record['path'].replace('/', os.sep))
+                if error is not None:
+                    result.errors.append((original_path, error))
+                elif restored:
+                    result.restored.append(original_path)
+                else:
+                    result.unchanged.append(original_path)
+        return result
+    
+    def restore_all(self, project_path: str) -> List[str]:
+        """
+        프로젝트의 모든 파일을 가장 최근 백업으로 복원합니다.
         
-        return restored
+        Args:
+            project_path: 프로젝트 루트 경로
+            
+        Returns:
+            복원된 파일 경로 리스트
+        """
+        return self.restore(project_path).restored
     
     def get_latest_backup(self, file_path: str, project_path: str) -> Optional[str]:
         """
@@ -199,18 +757,253 @@ class BackupManager:
             project_path: 프로젝트 루트 경로
             
         Returns:
-            백업 파일 경로 또는 None
+            백업 객체(또는 이전 형식 백업 파일) 경로 또는 None
         """
-        backup_dir = self._get_backup_dir(project_path)
-        manifest_path = os.path.join(backup_dir, "manifest.json")
+        records = self._load_index(project_path).get(self._relative_key(file_path, project_path))
+        return self._record_location(records[-1], project_path) if records else None
+
+
+# 원본 교체용 임시 파일 이름: .masking-<파일 이름>.<프로세스 ID>.<mkstemp 임의 문자열 8자>.tmp
+# 다른 도구의 임시 파일을 지우지 않도록 이 도구의 접두사와 mkstemp 형식에 정확히 맞는 이름만 인식
+TEMP_FILE_PREFIX = '.masking-'
+_TEMP_FILE_RE = re.compile(r'^\.masking-(?P<name>.+)\.(?P<pid>\d+)\.[a-z0-9_]{8}\.tmp$')
+
+# 프로세스 생존 여부를 확인할 수 없는 플랫폼에서 임시 파일을 남은 것으로 볼 때까지의 시간 (초)
+STALE_TEMP_AGE = 24 * 60 * 60
+
+
+def create_temp_file(file_path: str) -> Tuple[int, str, str]:
+    """
+    원본 교체용 임시 파일 생성
+    
+    심볼릭 링크는 실제 대상 파일을 교체해야 링크가 유지되므로, 임시 파일은 대상 파일과 같은
+    디렉토리에 만듭니다.
+    
+    Returns:
+        (파일 디스크립터, 임시 파일 경로, 교체할 대상 파일 경로)
+    """
+    target_path = os.path.realpath(file_path)
+    directory, filename = os.path.split(target_path)
+    fd, temp_path = tempfile.mkstemp(prefix=f"{TEMP_FILE_PREFIX}{filename}.{os.getpid()}.", suffix=".tmp", dir=directory)
+    return fd, temp_path, target_path
+
+
+def is_temp_file(file_path: str) -> bool:
+    """원본 교체용 임시 파일 이름인지 확인"""
+    return _TEMP_FILE_RE.match(os.path.basename(file_path)) is not None
+
+
+def _can_rename_over(temp_path: str, target_path: str) -> bool:
+    """
+    임시 파일에 대상 파일의 권한과 소유자를 복사하고 이름 변경으로 교체할 수 있는지 확인
+    
+    하드링크가 있는 파일은 이름을 바꾸면 다른 링크가 이전 내용에 남고, 소유자를 복사할 수 없으면
+    파일 소유자가 바뀌므로 제자리 쓰기가 필요합니다.
+    """
+    try:
+        target_stat = os.stat(target_path)
+    except FileNotFoundError:
+        return True
+    os.chmod(temp_path, stat.S_IMODE(target_stat.st_mode))
+    if target_stat.st_nlink > 1:
+        return False
+    temp_stat = os.stat(temp_path)
+    if (temp_stat.st_uid, temp_stat.st_gid) != (target_stat.st_uid, target_stat.st_gid):
+        if not hasattr(os, 'chown'):
+            return True
+        try:
+            os.chown(temp_path, target_stat.st_uid, target_stat.st_gid)
+        except OSError:
+            return False
+    return True
+
+
+def replace_file(temp_path: str, target_path: str):
+    """
+    임시 파일로 대상 파일 교체
+    
+    이름 변경(os.replace)으로 교체할 수 없는 파일(하드링크, 소유자 유지 불가)은 대상 파일에
+    임시 파일 내용을 제자리로 쓴 뒤 임시 파일을 삭제합니다.
+    
+    Args:
+        temp_path: create_temp_file로 만든 임시 파일 경로
+        target_path: 교체할 대상 파일 경로 (심볼릭 링크가 아닌 실제 파일)
+    """
+    if _can_rename_over(temp_path, target_path):
+        os.replace(temp_path, target_path)
+        return
+    
+    with open(temp_path, 'rb') as src, open(target_path, 'r+b') as dst:
+        shutil.copyfileobj(src, dst)
+        dst.truncate()
+        dst.flush()
+        os.fsync(dst.fileno())
+    os.remove(temp_path)
+
+
+def _is_stale_temp_file(path: str, pid: int) -> bool:
+    """임시 파일을 만든 프로세스가 끝났는지 확인 (확인할 수 없으면 STALE_TEMP_AGE로 판단)"""
+    if pid == os.getpid():
+        return False
+    if os.name == 'posix':
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            return False
+        return False
+    try:
+        return os.path.getmtime(path) < datetime.now().timestamp() - STALE_TEMP_AGE
+    except OSError:
+        return False
+
+
+def remove_stale_temp_files(directory: str) -> List[str]:
+    """
+    비정상 종료로 남은 원본 교체용 임시 파일 삭제
+    
+    임시 파일을 만든 프로세스가 아직 실행 중이면(다른 마스킹 실행 등) 삭제하지 않습니다.
+    
+    Args:
+        directory: 임시 파일을 찾을 디렉토리
         
-        if not os.path.exists(manifest_path):
-            return None
+    Returns:
+        삭제한 임시 파일 경로 리스트
+    """
+    removed = []
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return removed
+    for entry in entries:
+        match = _TEMP_FILE_RE.match(entry.name)
+        if match is None or not entry.is_file(follow_symlinks=False):
+            continue
+        if not _is_stale_temp_file(entry.path, int(match.group('pid'))):
+            continue
+        try:
+            os.remove(entry.path)
+        except OSError:
+            continue
+        removed.append(entry.path)
+    return removed
+
+
+def _sync_file(path: str):
+    """파일 내용을 디스크에 기록 (fdatasync가 없는 플랫폼에서는 fsync)"""
+    fd = os.open(path, os.O_RDWR)
+    try:
+        if hasattr(os, 'fdatasync'):
+            os.fdatasync(fd)
+        else:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(directory: str):
+    """디렉토리 항목(이름 변경) 변경을 디스크에 기록 (디렉토리를 열 수 없는 플랫폼에서는 생략)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class FileTransaction:
+    """
+    마스킹 결과 일괄 반영 트랜잭션
+    
+    마스킹된 내용은 원본(심볼릭 링크면 대상 파일)과 같은 디렉토리의 임시 파일에 먼저 쓰고,
+    commit()에서 임시 파일마다 fdatasync로 디스크에 기록한 뒤 원본과 교체하고 디렉토리마다
+    한 번씩 fsync합니다. commit() 전에 중단되면 원본은 모두 그대로 남고, rollback()으로 임시 파일을
+    지웁니다. 비정상 종료로 남은 임시 파일은 다음 실행에서 remove_stale_temp_files로 지웁니다.
+    """
+    
+    def __init__(self):
+        # (임시 파일 경로, 교체할 대상 파일 경로, 원본 경로)
+        self._staged: List[Tuple[str, str, str]] = []
+    
+    def __len__(self) -> int:
+        return len(self._staged)
+    
+    def stage(self, file_path: str, content: str):
+        """
+        마스킹된 내용을 임시 파일에 기록하여 반영 대기
+        
+        Args:
+            file_path: 원본 파일 경로
+            content: 마스킹된 내용
+        """
+        fd, temp_path, target_path = create_temp_file(file_path)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._staged.append((temp_path, target_path, file_path))
+    
+    def add(self, temp_path: str, file_path: str):
+        """
+        이미 기록된 임시 파일을 반영 대기 (스트리밍 마스킹 결과 등)
+        
+        Args:
+            temp_path: create_temp_file로 만든 임시 파일 경로
+            file_path: 원본 파일 경로
+        """
+        self._staged.append((temp_path, os.path.realpath(file_path), file_path))
+    
+    def commit(self) -> List[Tuple[str, str]]:
+        """
+        대기 중인 임시 파일을 모두 원본과 교체
+        
+        교체에 실패한 파일이 있어도 나머지 파일은 계속 교체합니다.
         
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        Returns:
+            교체하지 못한 (원본 경로, 오류 메시지) 리스트
+        """
+        staged, self._staged = self._staged, []
         
-        return manifest.get(file_path)
+        # 모든 임시 파일 내용을 디스크에 기록한 뒤 교체
+        synced = []
+        failed = []
+        for temp_path, target_path, file_path in staged:
+            try:
+                _sync_file(temp_path)
+                synced.append((temp_path, target_path, file_path))
+            except OSError as e:
+                failed.append((file_path, str(e)))
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+        
+        directories = set()
+        for temp_path, target_path, file_path in synced:
+            try:
+                replace_file(temp_path, target_path)
+                directories.add(os.path.dirname(target_path))
+            except OSError as e:
+                failed.append((file_path, str(e)))
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+        
+        for directory in directories:
+            _fsync_directory(directory)
+        return failed
+    
+    def rollback(self):
+        """대기 중인 임시 파일을 모두 삭제 (원본은 변경되지 않음)"""
+        staged, self._staged = self._staged, []
+        for temp_path, _, _ in staged:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
 
 
 class FileProcessor:
@@ -273,3 +1066,65 @@ class FileProcessor:
             self.write_file(file_path, processed_content, project_path, create_backup)
         
         return processed_content
+    
+    def mask_file_streaming(
+        self,
+        file_path: str,
+        engine,
+        project_path: str = None,
+        create_backup: bool = True,
+        dry_run: bool = False,
+        transaction: Optional[FileTransaction] = None
+    ) -> Tuple[List, Optional[str]]:
+        """
+        파일을 라인 단위로 마스킹하여 같은 디렉토리의 임시 파일에 기록한 뒤 교체합니다.
+        
+        파일 전체를 메모리에 올리지 않으므로 최대 메모리 사용량은 가장 긴 라인에 비례합니다.
+        
+        Args:
+            file_path: 처리할 파일 경로
+            engine: MaskingEngine 인스턴스
+            project_path: 프로젝트 루트 경로 (백업용)
+            create_backup: 백업 생성 여부
+            dry_run: True면 실제 파일 변경 없음
+            transaction: 지정하면 바로 교체하지 않고 임시 파일을 트랜잭션에 넘김
+            
+        Returns:
+            Tuple[마스킹된 항목(MaskedItem) 리스트, 백업 파일 경로 (없으면 None)]
+        """
+        masked_items = []
+        
+        if dry_run:
+            with open(file_path, 'r', encoding='utf-8', newline='') as src:
+                for _, item in engine.mask_stream(file_path, src):
+                    if item is not None:
+                        masked_items.append(item)
+            return masked_items, None
+        
+        fd, temp_path, target_path = create_temp_file(file_path)
+        try:
+            with open(file_path, 'r', encoding='utf-8', newline='') as src, \
+                    os.fdopen(fd, 'w', encoding='utf-8', newline='') as dst:
+                for masked_line, item in engine.mask_stream(file_path, src):
+                    dst.write(masked_line)
+                    if item is not None:
+                        masked_items.append(item)
+            
+            if not masked_items:
+                os.remove(temp_path)
+                return masked_items, None
+            
+            # 백업 생성 후 원본 교체
+            backup_path = None
+            if create_backup and self.backup_manager and project_path:
+                backup_path = self.backup_manager.create_backup(file_path, project_path)
+            
+            if transaction is not None:
+                transaction.add(temp_path, file_path)
+            else:
+                replace_file(temp_path, target_path)
+            return masked_items, backup_path
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
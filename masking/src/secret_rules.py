@@ -0,0 +1,184 @@
+"""
+알려진 비밀 값 형식 규칙 모듈
+
+서비스별 토큰/키 형식(GitHub, GitLab, Slack, Stripe, GCP, PEM 개인키, Azure 등)을
+버전이 있는 내장 규칙 팩으로 제공합니다. 모든 규칙은 alternation 정규식 하나로 컴파일되므로
+값/라인마다 한 번의 탐색으로 검사합니다.
+
+내장 규칙은 리터럴로 시작하는 선형 시간 패턴이므로 사용자 패턴과 달리 값 길이 상한 없이 실행합니다.
+한 줄짜리 서비스 계정 JSON처럼 상한을 넘는 값/라인에 담긴 비밀 값도 놓치지 않기 위해서입니다.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .regex_backend import ReBackend, create_regex_backend
+
+
+# 규칙을 추가/수정하면 올림
+RULE_PACK_VERSION = "2026.1"
+
+
+@dataclass(frozen=True)
+class SecretRule:
+    """
+    알려진 비밀 값 형식 규칙
+
+    결합 정규식이 첫 글자 집합으로 탐색 위치를 건너뛸 수 있도록 패턴은 단어 경계(\\b)나
+    그룹이 아닌 리터럴로 시작해야 합니다.
+    """
+    name: str
+    pattern: str
+    description: str
+
+
+BUILTIN_RULES: Tuple[SecretRule, ...] = (
+    SecretRule(
+        'github-token',
+        r'gh[pousr]_[A-Za-z0-9]{36,255}\b|github_pat_[A-Za-z0-9_]{82}\b',
+        'GitHub 개인/OAuth/앱 토큰'
+    ),
+    SecretRule(
+        'gitlab-token',
+        r'gl(?:pat|dt|rt|ptt|oas)-[A-Za-z0-9_\-]{20,}',
+        'GitLab 개인/배포/러너 토큰'
+    ),
+    SecretRule(
+        'slack-webhook',
+        r'https://hooks\.slack\.com/(?:services|workflows|triggers)/[A-Za-z0-9_/+\-]{20,}',
+        'Slack Incoming Webhook URL'
+    ),
+    SecretRule(
+        'slack-token',
+        r'xox[abposr]-[A-Za-z0-9\-]{10,}',
+        'Slack 봇/사용자 토큰'
+    ),
+    SecretRule(
+        'stripe-key',
+        r'sk_(?:live|test)_[A-Za-z0-9]{16,}\b|rk_(?:live|test)_[A-Za-z0-9]{16,}\b',
+        'Stripe 비밀/제한 키'
+    ),
+    SecretRule(
+        'gcp-service-account',
+        r'"private_key_id"\s*:\s*"[0-9a-f]{40}"',
+        'GCP 서비스 계정 JSON의 개인키 ID'
+    ),
+    SecretRule(
+        'pem-private-key',
+        r'-----BEGIN (?:[A-Z0-9]+ )*PRIVATE KEY-----(?:[A-Za-z0-9+/=\s]|\\n)*'
+        r'(?:-----END (?:[A-Z0-9]+ )*PRIVATE KEY-----)?',
+        'PEM 개인키 (한 줄에 포함된 본문까지)'
+    ),
+    SecretRule(
+        'azure-connection-string',
+        r'DefaultEndpointsProtocol=https?;[^\s"\']*?AccountKey=[A-Za-z0-9+/]{40,}={0,2}'
+        r'|Endpoint=sb://[^\s"\']*?SharedAccessKey=[A-Za-z0-9+/]{40,}={0,2}',
+        'Azure Storage/Service Bus 연결 문자열'
+    ),
+)
+
+
+class SecretScanner:
+    """
+    규칙 팩 전체를 하나의 정규식으로 검사하는 스캐너
+
+    규칙은 캡처 그룹 없이 결합되므로 대부분의 위치는 첫 글자 검사만으로 건너뜁니다.
+    매칭된 구간이 어느 규칙인지는 탐지된 경우에만 규칙별 정규식으로 확인합니다.
+    검사만으로는 탐지 횟수가 늘지 않으며, 마스킹 엔진이 실제로 마스킹한 항목마다 record_hit으로
+    집계하므로 일괄/단일/스트리밍 처리의 집계가 같습니다.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[SecretRule] = BUILTIN_RULES,
+        regex_backend: Optional[ReBackend] = None,
+        version: str = RULE_PACK_VERSION
+    ):
+        """
+        Args:
+            rules: 검사할 규칙 (기본값: 내장 규칙 팩)
+            regex_backend: 결합 정규식을 컴파일할 백엔드 (기본값: RE2가 설치되어 있으면 re2, 아니면 re, 길이 상한 없음)
+            version: 규칙 팩 버전
+        """
+        self.rules: List[SecretRule] = list(rules)
+        self.version = version
+        self.hits: Dict[str, int] = {rule.name: 0 for rule in self.rules}
+        self._rule_regexes = [(rule.name, re.compile(rule.pattern)) for rule in self.rules]
+
+        backend = regex_backend or create_regex_backend('auto', max_value_length=None)
+        combined = '|'.join(f"(?:{rule.pattern})" for rule in self.rules)
+        self._regex = backend.compile(combined) if self.rules else None
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def _rule_at(self, text: str, start: int, end: int) -> str:
+        """매칭된 구간을 만든 규칙(alternation 순서상 첫 규칙) 이름"""
+        for name, regex in self._rule_regexes:
+            match = regex.match(text, start)
+            if match is not None and match.end() == end:
+                return name
+        return self.rules[0].name
+
+    def record_hit(self, name: str):
+        """규칙으로 마스킹된 항목 하나를 탐지 횟수에 집계"""
+        if name in self.hits:
+            self.hits[name] += 1
+
+    def search(self, text: str) -> Optional[str]:
+        """
+        텍스트에서 첫 번째 비밀 값을 찾아 규칙 이름 반환
+
+        Returns:
+            매칭된 규칙 이름, 없으면 None
+        """
+        if self._regex is None:
+            return None
+        match = self._regex.search(text)
+        if match is None:
+            return None
+        return self._rule_at(text, match.start(), match.end())
+
+    def find_all(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        텍스트의 모든 비밀 값 구간 반환
+
+        Returns:
+            (시작, 끝, 규칙 이름) 리스트
+        """
+        if self._regex is None:
+            return []
+        found = []
+        for match in self._regex.finditer(text):
+            start, end = match.span()
+            found.append((start, end, self._rule_at(text, start, end)))
+        return found
+
+    def hit_counts(self) -> Dict[str, int]:
+        """마스킹된 항목 수가 있는 규칙별 집계 반환"""
+        return {name: count for name, count in self.hits.items() if count}
+
+
+def load_rule_pack(
+    regex_backend: Optional[ReBackend] = None,
+    disabled_rules: Iterable[str] = ()
+) -> SecretScanner:
+    """
+    내장 규칙 팩 로드
+
+    Args:
+        regex_backend: 결합 정규식을 컴파일할 백엔드 (기본값: 길이 상한 없는 re2 또는 re)
+        disabled_rules: 사용하지 않을 규칙 이름
+
+    Returns:
+        SecretScanner
+    """
+    disabled = set(disabled_rules)
+    unknown = disabled - {rule.name for rule in BUILTIN_RULES}
+    if unknown:
+        raise ValueError(f"알 수 없는 비밀 값 규칙: {', '.join(sorted(unknown))}")
+    return SecretScanner(
+        [rule for rule in BUILTIN_RULES if rule.name not in disabled],
+        regex_backend
+    )
@@ -0,0 +1,150 @@
+"""
+키 판정 영구 캐시 모듈
+
+SQLite 파일에 (규칙 집합 해시, 키) -> 판정 결과를 저장하여 실행 간에 재사용합니다.
+판정은 자신을 만든 민감/제외 키 패턴 집합의 해시와 함께 저장되므로, 설정이 다른 실행이
+같은 파일을 함께 써도 서로의 판정을 읽거나 지우지 않습니다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+
+# 저장 형식이 바뀌면 올려서 기존 캐시를 무효화
+STORE_FORMAT_VERSION = 2
+
+Verdict = Tuple[bool, Optional[str]]
+
+
+def compute_ruleset_hash(key_patterns: Iterable[str], exclude_key_patterns: Iterable[str]) -> str:
+    """
+    키 판정 규칙 집합의 해시 계산
+
+    Args:
+        key_patterns: 민감 키 패턴
+        exclude_key_patterns: 제외 키 패턴
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    payload = json.dumps({
+        'version': STORE_FORMAT_VERSION,
+        'key_patterns': list(key_patterns),
+        'exclude_key_patterns': list(exclude_key_patterns),
+    }, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class VerdictStore:
+    """
+    SQLite 기반 키 판정 영구 캐시
+
+    열 때 현재 규칙 집합의 판정 결과만 메모리로 읽어 두고, 새 판정과 사용 시각은
+    flush() 시점에 한 번의 트랜잭션으로 기록합니다. 다른 규칙 집합의 항목은 건드리지 않고
+    최대 항목 수를 넘을 때만 전체에서 가장 오래 사용되지 않은 항목부터 제거하므로,
+    더 이상 쓰지 않는 설정의 판정은 자연스럽게 밀려납니다.
+    """
+
+    def __init__(self, path: str, ruleset_hash: str, max_entries: int = 200000):
+        """
+        Args:
+            path: SQLite 파일 경로 (~ 확장 지원)
+            ruleset_hash: 현재 규칙 집합 해시 (compute_ruleset_hash)
+            max_entries: 보관할 최대 항목 수
+        """
+        self.path = os.path.expanduser(path)
+        self.ruleset_hash = ruleset_hash
+        self.max_entries = max_entries
+        self.hits = 0
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._migrate()
+            self._verdicts: Dict[str, Verdict] = {
+                key: (bool(sensitive), rule)
+                for key, sensitive, rule in self._conn.execute(
+                    "SELECT key, sensitive, rule FROM verdicts WHERE ruleset = ?", (self.ruleset_hash,)
+                )
+            }
+        except BaseException:
+            self._conn.close()
+            raise
+        self._pending: Dict[str, Verdict] = {}
+        self._touched: set = set()
+
+    def _migrate(self):
+        """테이블 생성 (규칙 집합 열이 없는 이전 형식의 캐시는 새로 만듦)"""
+        with self._conn:
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(verdicts)")]
+            if columns and 'ruleset' not in columns:
+                self._conn.execute("DROP TABLE verdicts")
+                self._conn.execute("DROP TABLE IF EXISTS meta")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS verdicts ("
+                "ruleset TEXT NOT NULL, key TEXT NOT NULL, sensitive INTEGER NOT NULL, rule TEXT, "
+                "last_used INTEGER NOT NULL, PRIMARY KEY (ruleset, key))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS verdicts_last_used ON verdicts (last_used)")
+
+    def __len__(self) -> int:
+        return len(self._verdicts)
+
+    def get(self, key: str) -> Optional[Verdict]:
+        """저장된 판정 결과 조회 (없으면 None)"""
+        verdict = self._verdicts.get(key)
+        if verdict is not None:
+            self.hits += 1
+            self._touched.add(key)
+        return verdict
+
+    def put(self, key: str, verdict: Verdict):
+        """판정 결과 저장 (flush 시 기록)"""
+        self._verdicts[key] = verdict
+        self._pending[key] = verdict
+
+    def flush(self):
+        """새 판정과 사용 시각을 기록하고 최대 항목 수를 넘는 항목 제거"""
+        if not self._pending and not self._touched:
+            return
+
+        now = int(time.time())
+        ruleset = self.ruleset_hash
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO verdicts (ruleset, key, sensitive, rule, last_used) VALUES (?, ?, ?, ?, ?)",
+                [(ruleset, key, int(sensitive), rule, now) for key, (sensitive, rule) in self._pending.items()]
+            )
+            self._conn.executemany(
+                "UPDATE verdicts SET last_used = ? WHERE ruleset = ? AND key = ?",
+                [(now, ruleset, key) for key in self._touched if key not in self._pending]
+            )
+
+            count = self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+            overflow = count - self.max_entries
+            if overflow > 0:
+                evicted = self._conn.execute(
+                    "SELECT ruleset, key FROM verdicts ORDER BY last_used ASC LIMIT ?", (overflow,)
+                ).fetchall()
+                self._conn.executemany("DELETE FROM verdicts WHERE ruleset = ? AND key = ?", evicted)
+                for evicted_ruleset, key in evicted:
+                    if evicted_ruleset == ruleset:
+                        self._verdicts.pop(key, None)
+
+        self._pending.clear()
+        self._touched.clear()
+
+    def close(self):
+        """기록 후 연결 종료"""
+        if self._conn is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+            self._conn = None
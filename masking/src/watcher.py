@@ -0,0 +1,210 @@
+"""
+설정 파일 감시 모듈
+
+프로젝트 디렉토리의 파일 변경을 감시하여 FileScanner 패턴에 맞는 설정 파일이 생성/수정되면
+바로 처리 함수로 넘깁니다. watchdog이 설치되어 있으면 OS 파일 이벤트(Linux inotify, macOS FSEvents 등)를,
+없으면 주기적인 파일 상태 비교(폴링)를 사용합니다.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .scanner import FileScanner
+
+try:
+    from watchdog.events import FileSystemEventHandler  # 선택적 의존성 (OS 파일 이벤트)
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+
+# (크기, mtime_ns, inode) - 파일이 없으면 None
+FileSignature = Optional[Tuple[int, int, int]]
+
+
+def file_signature(file_path: str) -> FileSignature:
+    """파일 상태 서명 (파일이 없거나 읽을 수 없으면 None)"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+class _EventHandler(FileSystemEventHandler):
+    """watchdog 이벤트를 ConfigWatcher로 전달"""
+
+    def __init__(self, watcher: 'ConfigWatcher', project_path: str):
+        self.watcher = watcher
+        self.project_path = project_path
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in ('created', 'modified', 'moved', 'closed'):
+            return
+        # 편집기가 임시 파일에 쓴 뒤 이름을 바꾸는 경우 대상 경로로 처리
+        file_path = getattr(event, 'dest_path', '') or event.src_path
+        self.watcher.notify(self.project_path, os.fsdecode(file_path))
+
+
+class ConfigWatcher:
+    """
+    설정 파일 변경 감시기
+
+    이벤트는 경로별로 모아 두었다가 마지막 이벤트 이후 debounce 시간 동안 조용해진 파일만
+    한 번에 처리 함수로 넘기므로, 편집기 저장이나 git checkout처럼 짧은 시간에 몰리는 이벤트도
+    파일당 한 번만 처리합니다. 처리 직후의 파일 상태를 기억하여 처리 함수가 파일을 다시 쓰면서
+    발생한 이벤트는 무시합니다.
+    """
+
+    BACKENDS = ('auto', 'watchdog', 'polling')
+
+    def __init__(
+        self,
+        scanner: FileScanner,
+        on_change: Callable[[str, List[str]], None],
+        debounce: float = 0.3,
+        poll_interval: float = 1.0,
+        backend: str = 'auto'
+    ):
+        """
+        Args:
+            scanner: 대상 파일 패턴을 가진 FileScanner (폴링 시 파일 탐색에도 사용)
+            on_change: 처리 함수 (프로젝트 경로, 변경된 파일 절대 경로 리스트)
+            debounce: 마지막 이벤트 이후 처리까지 기다릴 시간 (초)
+            poll_interval: 폴링 백엔드의 파일 상태 비교 주기 (초)
+            backend: auto (watchdog이 설치되어 있으면 watchdog, 아니면 polling), watchdog, polling
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"지원하지 않는 감시 방식: {backend} ({', '.join(self.BACKENDS)})")
+        if backend == 'auto':
+            backend = 'watchdog' if Observer is not None else 'polling'
+        if backend == 'watchdog' and Observer is None:
+            raise ImportError("watchdog 감시 방식을 사용하려면 'pip install watchdog'이 필요합니다.")
+
+        self.scanner = scanner
+        self.on_change = on_change
+        self.debounce = max(0.0, debounce)
+        self.poll_interval = max(0.05, poll_interval)
+        self.backend = backend
+
+        # 파일 경로 -> (프로젝트 경로, 마지막 이벤트 시각)
+        self._pending: Dict[str, Tuple[str, float]] = {}
+        # 파일 경로 -> 처리 직후 파일 상태 (처리 함수가 쓴 결과로 인한 이벤트 무시용)
+        self._handled: Dict[str, FileSignature] = {}
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+
+    def notify(self, project_path: str, file_path: str):
+        """
+        파일 변경 알림 (백엔드 스레드에서 호출)
+
+        Args:
+            project_path: 프로젝트 루트 절대 경로
+            file_path: 변경된 파일 절대 경로
+        """
+        rel_path = os.path.relpath(file_path, project_path)
+        if rel_path.startswith(os.pardir) or not self.scanner.matches(rel_path):
+            return
+
+        with self._condition:
+            self._pending[file_path] = (project_path, time.monotonic())
+            self._condition.notify()
+
+    def _take_ready(self) -> Dict[str, List[str]]:
+        """debounce 시간이 지난 파일을 꺼내 프로젝트별로 묶음 (조건 변수 잠금 상태에서 호출)"""
+        now = time.monotonic()
+        ready: Dict[str, List[str]] = {}
+        for file_path, (project_path, last_event) in list(self._pending.items()):
+            if now - last_event >= self.debounce:
+                del self._pending[file_path]
+                ready.setdefault(project_path, []).append(file_path)
+        return ready
+
+    def _next_deadline(self) -> Optional[float]:
+        """가장 먼저 debounce가 끝나는 파일까지 남은 시간 (대기 중인 파일이 없으면 None)"""
+        if not self._pending:
+            return None
+        earliest = min(last_event for _, last_event in self._pending.values())
+        return max(0.0, earliest + self.debounce - time.monotonic())
+
+    def _dispatch(self, ready: Dict[str, List[str]]):
+        """모인 파일을 처리 함수로 넘기고 처리 직후 파일 상태 기록"""
+        for project_path, file_paths in ready.items():
+            # 처리 함수가 쓴 뒤 상태가 바뀌지 않은 파일(자기 쓰기 이벤트)과 삭제된 파일은 제외
+            changed = []
+            for file_path in sorted(file_paths):
+                signature = file_signature(file_path)
+                if signature is not None and self._handled.get(file_path) != signature:
+                    changed.append(file_path)
+            if not changed:
+                continue
+
+            self.on_change(project_path, changed)
+            for file_path in changed:
+                self._handled[file_path] = file_signature(file_path)
+
+    def _poll(self, project_paths: List[str]):
+        """폴링 백엔드: 주기적으로 대상 파일을 탐색해 파일 상태가 바뀐 파일을 알림"""
+        snapshots = {
+            project_path: {path: file_signature(path) for path in self.scanner.scan(project_path)}
+            for project_path in project_paths
+        }
+        while not self._stopped.wait(self.poll_interval):
+            for project_path in project_paths:
+                previous = snapshots[project_path]
+                current = {path: file_signature(path) for path in self.scanner.scan(project_path)}
+                for file_path, signature in current.items():
+                    if signature is not None and previous.get(file_path) != signature:
+                        self.notify(project_path, file_path)
+                snapshots[project_path] = current
+
+    def _start_backend(self, project_paths: List[str]) -> Callable[[], None]:
+        """감시 백엔드 시작 후 정지 함수 반환"""
+        if self.backend == 'watchdog':
+            observer = Observer()
+            for project_path in project_paths:
+                observer.schedule(_EventHandler(self, project_path), project_path, recursive=True)
+            observer.start()
+
+            def stop():
+                observer.stop()
+                observer.join()
+            return stop
+
+        thread = threading.Thread(target=self._poll, args=(project_paths,), name='watch-poll', daemon=True)
+        thread.start()
+        return lambda: thread.join()
+
+    def watch(self, project_paths: List[str]):
+        """
+        stop()이 호출되거나 KeyboardInterrupt가 발생할 때까지 감시하며 변경된 파일을 처리
+
+        처리 함수는 이 메서드를 호출한 스레드에서 순서대로 실행되므로 엔진/LLM 클라이언트를
+        스레드 간에 공유하지 않습니다.
+
+        Args:
+            project_paths: 감시할 프로젝트 루트 경로 리스트
+        """
+        project_paths = [os.path.abspath(path) for path in project_paths]
+        self._stopped.clear()
+        stop_backend = self._start_backend(project_paths)
+        try:
+            while not self._stopped.is_set():
+                with self._condition:
+                    self._condition.wait(self._next_deadline())
+                    ready = self._take_ready()
+                self._dispatch(ready)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._stopped.set()
+            stop_backend()
+
+    def stop(self):
+        """감시 종료 (다른 스레드나 처리 함수에서 호출)"""
+        self._stopped.set()
+        with self._condition:
+            self._condition.notify()
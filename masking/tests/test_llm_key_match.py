@@ -0,0 +1,58 @@
+"""
+LLM 탐지 키 일치 회귀 테스트
+
+LLM은 전체 키 경로 대신 잎 키 이름(myauthcode)만 답하는 경우가 많으므로,
+기본 설정에서 app.jwt.myauthcode 같은 중첩 키도 마스킹되어야 합니다.
+
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import load_config
+from src.masker import MaskingEngine
+
+
+SECRET = 'Zq8xW2vR'
+
+CONTENTS = {
+    'application.properties': f"app.jwt.myauthcode={SECRET}\n",
+    'application.yml': f"app:\n  jwt:\n    myauthcode: {SECRET}\n",
+}
+
+
+def create_engine(**overrides) -> MaskingEngine:
+    cfg = load_config()
+    cfg.setdefault('verdict_cache', {})['enabled'] = False
+    cfg.update(overrides)
+    return MaskingEngine(cfg)
+
+
+@pytest.mark.parametrize('yaml_mode', ['line', 'token'])
+@pytest.mark.parametrize('filename', sorted(CONTENTS))
+def test_leaf_key_from_llm_masks_nested_key(filename, yaml_mode):
+    engine = create_engine(yaml_mode=yaml_mode)
+    content = CONTENTS[filename]
+
+    # LLM 키 없이는 마스킹되지 않는 키여야 회귀를 잡을 수 있음
+    assert engine.mask_file(filename, content).masked_count == 0
+
+    result = engine.mask_file(filename, content, extra_keys=['myauthcode'])
+    assert result.masked_count == 1
+    assert SECRET not in result.masked_content
+
+    [batched] = engine.mask_many([(filename, content)], extra_keys={filename: ['myauthcode']})
+    assert batched.masked_content == result.masked_content
+
+
+def test_exact_mode_requires_full_key_path():
+    engine = create_engine(llm={'key_match': 'exact'})
+    content = CONTENTS['application.properties']
+
+    assert engine.mask_file('application.properties', content, extra_keys=['myauthcode']).masked_count == 0
+    assert engine.mask_file('application.properties', content, extra_keys=['app.jwt.myauthcode']).masked_count == 1
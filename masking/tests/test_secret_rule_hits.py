@@ -0,0 +1,56 @@
+"""
+비밀 값 규칙별 탐지 횟수 회귀 테스트
+
+탐지 횟수는 규칙 때문에 실제로 마스킹된 항목 수이므로 처리 방식(단일/일괄/스트리밍)과 관계없이
+같아야 하고, 키로 이미 마스킹된 값은 세지 않습니다.
+
+    python -m pytest tests
+"""
+
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import load_config
+from src.masker import MaskingEngine
+
+
+TOKEN = 'ghp_' + 'a1B2' * 9
+
+CONTENT = (
+    f"github.token={TOKEN}\n"
+    f"ci.value={TOKEN}\n"
+    f"other.value={TOKEN}\n"
+    f"# note {TOKEN}\n"
+)
+
+
+def create_engine() -> MaskingEngine:
+    cfg = load_config()
+    cfg.setdefault('verdict_cache', {})['enabled'] = False
+    return MaskingEngine(cfg)
+
+
+def test_hit_counts_match_masked_items_on_every_path():
+    engine = create_engine()
+    assert engine.mask_file('application.properties', CONTENT).masked_count == 4
+    assert engine.secret_scanner.hit_counts() == {'github-token': 3}
+
+    engine = create_engine()
+    [result] = engine.mask_many([('application.properties', CONTENT)])
+    assert result.masked_count == 4
+    assert engine.secret_scanner.hit_counts() == {'github-token': 3}
+
+    engine = create_engine()
+    items = [item for _, item in engine.mask_stream('application.properties', io.StringIO(CONTENT)) if item]
+    assert len(items) == 4
+    assert engine.secret_scanner.hit_counts() == {'github-token': 3}
+
+
+def test_reused_duplicate_is_counted_once_per_file():
+    engine = create_engine()
+    result = engine.mask_file('application.properties', CONTENT)
+    engine.count_secret_hits(result.masked_items)
+    assert engine.secret_scanner.hit_counts() == {'github-token': 6}